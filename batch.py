@@ -0,0 +1,103 @@
+# Standard Library Imports
+from pathlib import Path
+import argparse
+import os
+
+# Local Application Imports
+from modules.config import initialize_directories
+from modules.logging_config import configure_logging
+from modules.audio_processing.config import CACHE_KEY_MODE
+from modules.lyrics_processing.modify_lyrics.config import LYRICS_ALIGNER, LYRICS_ALIGNERS
+from modules.lyrics_processing.extract_lyrics.config import TRANSCRIPTION_WORKERS, DECODE_MODE
+from interface.handlers import handle_batch_processing, handle_batch_lyrics_fetch
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(
+        description="Render every song in a folder into a karaoke video without the UI."
+    )
+    parser.add_argument("input_dir", type=Path, help="Folder containing the songs to process.")
+    parser.add_argument("--effect", type=Path, default=None, help="Background effect video (default: black background).")
+    parser.add_argument("--recursive", action="store_true", help="Include songs in subfolders.")
+    parser.add_argument("--no-enhance", action="store_true", help="Skip fetching reference lyrics and lyric correction.")
+    parser.add_argument("--aligner", choices=LYRICS_ALIGNERS, default=LYRICS_ALIGNER, help=f"Lyric correction: Gemini for every chunk (llm), local alignment with Gemini for unclear parts (hybrid), or local only (default: {LYRICS_ALIGNER}).")
+    parser.add_argument("--match-audio", action="store_true", help="Reuse cached results of songs with near-identical audio (e.g. other encodings).")
+    parser.add_argument("--lyrics-only", action="store_true", help="Only fetch the reference lyrics of every song (concurrently).")
+    parser.add_argument("--override", action="store_true", help="Recompute every stage instead of reusing cached results.")
+    parser.add_argument("--language", default="Auto Detect", help="Transcription language (default: Auto Detect).")
+    parser.add_argument("--no-vad", action="store_true", help="Decode the whole vocals stem instead of only its voiced regions.")
+    parser.add_argument("--transcription-workers", type=int, default=TRANSCRIPTION_WORKERS, help=f"Songs transcribed at once with one shared Whisper model (default: {TRANSCRIPTION_WORKERS}).")
+    parser.add_argument("--adaptive-decoding", action="store_true", help="Decode with a small beam first and re-decode only low-confidence segments with the full settings.")
+    parser.add_argument("--model-size", default="large-v2", help="Whisper model size (default: large-v2).")
+    parser.add_argument("--font", default="Arial", help="Subtitle font (default: Arial).")
+    parser.add_argument("--fontsize", type=int, default=42, help="Subtitle font size (default: 42).")
+    parser.add_argument("--resolution", default="1280x720", help="Video resolution (default: 1280x720).")
+    parser.add_argument("--preset", default="fast", help="FFmpeg encoding preset (default: fast).")
+    parser.add_argument("--crf", type=int, default=23, help="FFmpeg CRF (default: 23).")
+    parser.add_argument("--fps", type=int, default=24, help="Video frame rate (default: 24).")
+    parser.add_argument("--verbose", action="store_true", help="Enable debug logging.")
+    return parser.parse_args()
+
+
+def run():
+    args = _parse_args()
+    input_dir = args.input_dir.resolve()
+    effect_path = args.effect.resolve() if args.effect else None
+
+    # Initialize the project directories
+    project_root, cache_dir, output_dir = initialize_directories()
+
+    # Video rendering uses paths relative to the project root
+    os.chdir(project_root)
+
+    # Configure logging based on the verbose flag
+    configure_logging(verbose=args.verbose)
+
+    if args.lyrics_only:
+        results = handle_batch_lyrics_fetch(
+            input_dir=input_dir,
+            cache_dir=cache_dir,
+            recursive=args.recursive,
+            override=args.override,
+            cache_key_mode="audio" if args.match_audio else CACHE_KEY_MODE,
+        )
+        for input_file, result in results.items():
+            print(f"{input_file.name}: {result}")
+        return
+
+    results = handle_batch_processing(
+        input_dir=input_dir,
+        cache_dir=cache_dir,
+        output_dir=output_dir,
+        effect_path=effect_path,
+        recursive=args.recursive,
+        enhance_lyrics=not args.no_enhance,
+        override=args.override,
+        cache_key_mode="audio" if args.match_audio else CACHE_KEY_MODE,
+        transcription_workers=args.transcription_workers,
+        transcription_options={
+            "language_option": args.language,
+            "model_size": args.model_size,
+            "vad_filter": not args.no_vad,
+            "decode_mode": "adaptive" if args.adaptive_decoding else DECODE_MODE,
+        },
+        enhancement_options={
+            "aligner": args.aligner,
+        },
+        subtitle_options={
+            "font": args.font,
+            "fontsize": args.fontsize,
+        },
+        video_options={
+            "resolution": args.resolution,
+            "preset": args.preset,
+            "crf": args.crf,
+            "fps": args.fps,
+        },
+    )
+
+    for input_file, result in results.items():
+        print(f"{input_file.name}: {result}")
+
+if __name__ == "__main__":
+    run()
@@ -1,11 +1,14 @@
 # Standard Library Imports
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union, Optional
 from pathlib import Path
 import logging
+import queue
 import json
 
 # Local Application Imports
 from .helpers import (
+    dataframe_from_verses,
     display_dataframe_from_lyrics,
     load_json_file,
     save_json_file
@@ -35,13 +38,18 @@ def process_audio_callback(
     compression_threshold_input,
     temperature_input,
     language_input,
+    model_size_input,
     state_working_dir,
     state_lyrics_json,
     state_lyrics_display,
+    state_artist_name,
+    state_song_name,
     cache_dir,
 ):
     """
     1) Runs the audio processing pipeline -> `raw_lyrics.json`
+       While the vocals are transcribed, the verses decoded so far are streamed to the
+       lyrics display box.
     2) Loads that JSON and sets up the states + left text box display.
     3) Updates the states: 
         `state_working_dir` -> working directory path, 
@@ -51,25 +59,46 @@ def process_audio_callback(
     try:
         # If no audio file provided, return an error message
         if audio_file is None:
-            return "Error: No audio file provided."
+            yield (state_working_dir, state_lyrics_json, "Error: No audio file provided.",
+                   state_artist_name, state_song_name, state_lyrics_display)
+            return
 
-        # Handler: Audio processing pipeline
+        # Handler: Audio processing pipeline, run in the background so partial transcriptions
+        # can be displayed while it runs
         # Returns: Path to raw_lyrics.json, and Path to working directory
-        raw_lyrics_path, working_dir, title, artists = handle_audio_processing(
-            audio_file,
-            cache_dir,
-            override_meta,
-            override_audio,
-            override_transcribe,
-            beam_size_input,
-            best_of_input,
-            patience_input,
-            condition_toggle,
-            compression_threshold_input,
-            temperature_input,
-            language_input,
-            file_name="raw_lyrics.json"
-        )
+        progress = queue.Queue()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(
+                handle_audio_processing,
+                audio_file,
+                cache_dir,
+                override_meta,
+                override_audio,
+                override_transcribe,
+                beam_size_input,
+                best_of_input,
+                patience_input,
+                condition_toggle,
+                compression_threshold_input,
+                temperature_input,
+                language_input,
+                model_size_input,
+                file_name="raw_lyrics.json",
+                on_transcription_progress=progress.put,
+            )
+
+            # Display the verses transcribed so far (only the latest update is shown)
+            while not future.done() or not progress.empty():
+                try:
+                    verses = progress.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                while not progress.empty():
+                    verses = progress.get_nowait()
+                yield (state_working_dir, state_lyrics_json, state_lyrics_display,
+                       state_artist_name, state_song_name, dataframe_from_verses(verses))
+
+            raw_lyrics_path, working_dir, title, artists = future.result()
 
         # Update State: working directory
         state_working_dir = working_dir
@@ -79,7 +108,9 @@ def process_audio_callback(
 
         # Check if the file is empty or not found
         if not raw_lyrics_json:
-            return "Error: No raw_lyrics.json found or empty."
+            yield (state_working_dir, state_lyrics_json, "Error: No raw_lyrics.json found or empty.",
+                   state_artist_name, state_song_name, state_lyrics_display)
+            return
 
         # Create display text
         display_text = display_dataframe_from_lyrics(raw_lyrics_path)
@@ -90,18 +121,19 @@ def process_audio_callback(
         state_artist_name = artists[0]
         state_song_name = title
 
-        return (
+        yield (
             state_working_dir,
             state_lyrics_json,
             state_lyrics_display,
             state_artist_name,
-            state_song_name
+            state_song_name,
+            display_text
         )
 
     except Exception as e:
         logger.error(f"Error in process_audio_callback: {e}")
-        return (None, None, f"Error: {e}")
-
+        yield (state_working_dir, state_lyrics_json, f"Error: {e}",
+               state_artist_name, state_song_name, state_lyrics_display)
 
 def modify_lyrics_callback(
     override,
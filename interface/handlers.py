@@ -1,7 +1,10 @@
 # Standard Library Imports
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Union
 from pathlib import Path
-from typing import Union
+import threading
 import logging
+import queue
 
 # Local Application Imports
 from modules import (
@@ -9,8 +12,18 @@ from modules import (
     extract_audio_metadata,
     separate_audio_stems,
     merge_audio_stems,
-    transcribe_audio_lyrics
+    transcribe_audio_lyrics,
+    TranscriptionService,
+    fetch_and_save_lyrics,
+    perform_lyric_enhancement,
+    process_karaoke_subtitles,
+    process_karaoke_video
 )
+from modules.audio_processing.config import EXTENSIONS, CACHE_KEY_MODE
+from modules.pipeline import PipelineStage, run_pipeline
+from modules.lyrics_processing.search_lyrics.config import GENIUS_MAX_CONCURRENCY
+from modules.lyrics_processing.extract_lyrics.config import TRANSCRIPTION_WORKERS
+from modules.utilities import load_json, save_json
 
 # Initialize Logger
 logger = logging.getLogger(__name__)
@@ -30,51 +43,339 @@ def handle_audio_processing(
         compression_threshold_input: float = 1.3,
         temperature_input: float = 0.0,
         language_input: str = "Auto Detect",
+        model_size_input: str = "large-v2",
         file_name: str = "raw_lyrics.json",
+        karaoke_mode: bool = True,
+        prefetch_lyrics: bool = True,
+        on_transcription_progress: Optional[Callable[[list], None]] = None,
 ):
     """
     Handler function to process the audio file.
     1) Initializes the working directory.
     2) Extracts song metadata.
     3) Performs audio stem separation.
-    4) Merges audio stems into a single karaoke audio.
+    4) Merges audio stems into a single karaoke audio (skipped in karaoke mode, where the
+       separation writes the karaoke audio directly).
     5) Extracts raw lyrics using Whisper Language Model.
     6) Returns the path to the raw lyrics file and the working directory.
+
+    Steps 2-5 run as a pipeline: the metadata lookup and the reference lyrics fetch
+    (if `prefetch_lyrics` is set) run while the stems are separated, and each stage
+    only waits for the stages producing its inputs.
+
+    `on_transcription_progress` is called with the verses transcribed so far each time
+    a verse is decoded.
     """
     try:
         # Initialize working directory
         working_dir, file_hash = initialize_working_directory(input_file, cache_dir)
 
-        # Extract Song Metadata
-        # Query audio file metadata from AcoustID API (title and artist) and store in a JSON file
-        title, artists = extract_audio_metadata(input_file, working_dir, override=override_meta)
-
-        # Perform Audio Stem Separation
-        # Extract vocals, other, bass, and drums from the input audio file using Demucs from Facebook AI
-        # Re-arrange the files in the working directory
-        separate_audio_stems(input_file, working_dir, override=override_audio)
-
-        # Merge Audio Stems into a single Karaoke Audio
-        # Merge the other, bass, and drums into a single karaoke audio file using AudioSegment from PyDub
-        merge_audio_stems(working_dir, override=override_audio)
+        stages = _audio_pipeline_stages(
+            input_file,
+            working_dir,
+            override_meta=override_meta,
+            override_audio=override_audio,
+            karaoke_mode=karaoke_mode,
+            prefetch_lyrics=prefetch_lyrics,
+        )
 
         # Extract Raw Lyrics
         # Extract the segments (lyric transcription, timing, and confidence scores) using the Whisper OpenAI API
         # Reformat the data into a JSON file
-        raw_lyrics_path = transcribe_audio_lyrics(
-            working_dir,
-            override=override_transcribe,
-            beam_size_input=beam_size_input,
-            best_of_input=best_of_input,
-            patience_input=patience_input,
-            condition_toggle=condition_toggle,
-            compression_threshold_input=compression_threshold_input,
-            temperature_input=temperature_input,
-            language_option=language_input,
-            file_name=file_name,
-        )
+        stages.append(PipelineStage(
+            name="transcription",
+            func=lambda: transcribe_audio_lyrics(
+                working_dir,
+                override=override_transcribe,
+                beam_size_input=beam_size_input,
+                best_of_input=best_of_input,
+                patience_input=patience_input,
+                condition_toggle=condition_toggle,
+                compression_threshold_input=compression_threshold_input,
+                temperature_input=temperature_input,
+                language_option=language_input,
+                file_name=file_name,
+                model_size=model_size_input,
+                on_verse=on_transcription_progress,
+            ),
+            inputs=("vocals",),
+            outputs=(file_name,),
+        ))
+
+        results = run_pipeline(stages)
+        title, artists = results["metadata"]
 
-        return raw_lyrics_path, working_dir, title, artists
+        return results["transcription"], working_dir, title, artists
 
     except Exception as e:
         raise RuntimeError(f"Error in audio processing pipeline: {e}")
+
+
+def _audio_pipeline_stages(
+        input_file: Path,
+        working_dir: Path,
+        override_meta: bool = False,
+        override_audio: bool = False,
+        karaoke_mode: bool = True,
+        prefetch_lyrics: bool = True,
+        name_unknown_songs: bool = False,
+) -> list:
+    """
+    Build the pipeline stages that prepare a song's metadata and audio artifacts.
+
+    Stages and the artifacts they read -> write:
+        metadata:           input audio -> metadata.json
+        separation:         input audio -> vocals, karaoke_audio (karaoke mode) or the four stems
+        merge:              bass, drums, other -> karaoke_audio (skipped in karaoke mode)
+        reference_lyrics:   metadata.json -> reference_lyrics.json (optional, best effort)
+    """
+    def extract_metadata():
+        # Query audio file metadata from AcoustID API (title and artist) and store in a JSON file
+        metadata = extract_audio_metadata(input_file, working_dir, override=override_meta)
+        if name_unknown_songs:
+            _name_unknown_song(working_dir, Path(input_file))
+        return metadata
+
+    # Perform Audio Stem Separation
+    # Extract vocals, other, bass, and drums from the input audio file using Demucs from Facebook AI
+    # In karaoke mode only the vocals and the karaoke audio (accompaniment) are written
+    stems = ("vocals", "karaoke_audio") if karaoke_mode else ("vocals", "bass", "drums", "other")
+    stages = [
+        PipelineStage(name="metadata", func=extract_metadata, outputs=("metadata.json",)),
+        PipelineStage(
+            name="separation",
+            func=lambda: separate_audio_stems(input_file, working_dir, override=override_audio, karaoke_mode=karaoke_mode),
+            outputs=stems,
+        ),
+    ]
+
+    # Merge Audio Stems into a single Karaoke Audio
+    # Merge the other, bass, and drums into a single karaoke audio file using the NumPy stem mixer
+    if not karaoke_mode:
+        stages.append(PipelineStage(
+            name="merge",
+            func=lambda: merge_audio_stems(working_dir, override=override_audio),
+            inputs=("bass", "drums", "other"),
+            outputs=("karaoke_audio",),
+        ))
+
+    # Fetch the reference lyrics while the audio is processed, so they are ready
+    # for lyric correction. A failed lookup does not stop the pipeline.
+    if prefetch_lyrics:
+        stages.append(PipelineStage(
+            name="reference_lyrics",
+            func=lambda: fetch_and_save_lyrics(working_dir, override=override_meta),
+            inputs=("metadata.json",),
+            outputs=("reference_lyrics.json",),
+            required=False,
+        ))
+
+    return stages
+
+
+def _find_audio_files(input_dir: Union[str, Path], recursive: bool = False) -> list:
+    """Collect the supported audio files of a directory, sorted by path."""
+    pattern = "**/*" if recursive else "*"
+    return sorted(
+        file for file in Path(input_dir).glob(pattern)
+        if file.is_file() and file.suffix.lower().lstrip(".") in EXTENSIONS
+    )
+
+
+def _name_unknown_song(working_dir: Path, input_file: Path):
+    """
+    Use the file name as the song title when no metadata could be retrieved,
+    so unidentified songs do not overwrite each other's video output.
+    """
+    metadata_file = working_dir / "metadata.json"
+    metadata = load_json(metadata_file)
+    if not metadata.get("retrieved_successfully") and metadata.get("title") == "Unknown Title":
+        metadata["title"] = input_file.stem
+        save_json(metadata, metadata_file)
+
+
+def handle_batch_processing(
+        input_dir: Union[str, Path],
+        cache_dir: Union[str, Path],
+        output_dir: Union[str, Path],
+        effect_path: Optional[Union[str, Path]] = None,
+        recursive: bool = False,
+        enhance_lyrics: bool = True,
+        override: bool = False,
+        karaoke_mode: bool = True,
+        cache_key_mode: str = CACHE_KEY_MODE,
+        transcription_workers: int = TRANSCRIPTION_WORKERS,
+        transcription_options: Optional[dict] = None,
+        enhancement_options: Optional[dict] = None,
+        subtitle_options: Optional[dict] = None,
+        video_options: Optional[dict] = None,
+):
+    """
+    Handler function to render every song of a directory into a karaoke video without the UI.
+
+    The songs are processed by a three-stage pipeline so that stem separation, transcription
+    and rendering of consecutive songs overlap:
+    1) Audio stage: Initializes the working directory, then extracts song metadata and
+       fetches the reference lyrics while separating (and if needed merging) the stems.
+    2) Transcription stage: Transcribes the vocals of up to `transcription_workers` songs at
+       once with one shared Whisper model (see `TranscriptionService`).
+    3) Render stage: Fetches and applies reference lyrics, and generates the subtitles and
+       the karaoke video, in input order.
+
+    A failing song is logged and skipped; the batch continues with the next one.
+
+    Args:
+        input_dir (Union[str, Path]): Directory holding the songs (see `EXTENSIONS`).
+        cache_dir (Union[str, Path]): Cache directory for the working directories.
+        output_dir (Union[str, Path]): Directory for the karaoke videos.
+        effect_path (Optional[Union[str, Path]]): Background effect video, or None for black.
+        recursive (bool): Whether to include songs in subdirectories.
+        enhance_lyrics (bool): Whether to fetch reference lyrics and correct the transcription.
+        override (bool): Whether to recompute every stage instead of reusing cached results.
+        karaoke_mode (bool): Separate directly into vocals and karaoke audio (no merge stage).
+        cache_key_mode (str): "file" to cache songs by file hash, or "audio" to reuse the cached
+            results of songs with near-identical audio (see `initialize_working_directory`).
+        transcription_workers (int): Number of songs transcribed concurrently.
+        transcription_options (Optional[dict]): Keyword arguments for `transcribe_audio_lyrics`.
+        enhancement_options (Optional[dict]): Keyword arguments for `perform_lyric_enhancement`.
+        subtitle_options (Optional[dict]): Keyword arguments for `process_karaoke_subtitles`.
+        video_options (Optional[dict]): Keyword arguments for `process_karaoke_video`.
+
+    Returns:
+        dict: Mapping of input file to the video path, or to the error message on failure.
+    """
+    audio_files = _find_audio_files(input_dir, recursive)
+    transcription_options = transcription_options or {}
+    enhancement_options = enhancement_options or {}
+    subtitle_options = subtitle_options or {}
+    video_options = video_options or {}
+    logger.info(f"Batch processing {len(audio_files)} songs from: {input_dir}")
+
+    # Subtitles are laid out for the video resolution
+    resolution = video_options.get("resolution", "1280x720")
+    screen_width, screen_height = map(int, resolution.split("x"))
+
+    results = {}
+    transcription = TranscriptionService(transcription_workers)
+    # Songs being transcribed or waiting for rendering (bounds the work done ahead of rendering)
+    prepared = queue.Queue(maxsize=transcription.workers)
+    done = object()
+
+    def audio_stage():
+        for input_file in audio_files:
+            try:
+                logger.info(f"[Audio] {input_file.name}")
+                working_dir, _ = initialize_working_directory(input_file, Path(cache_dir), key_mode=cache_key_mode)
+                run_pipeline(_audio_pipeline_stages(
+                    input_file,
+                    working_dir,
+                    override_meta=override,
+                    override_audio=override,
+                    karaoke_mode=karaoke_mode,
+                    prefetch_lyrics=enhance_lyrics,
+                    name_unknown_songs=True,
+                ))
+                transcribed = transcription.submit(working_dir, override=override, **transcription_options)
+                prepared.put((input_file, working_dir, transcribed))
+
+            except Exception as e:
+                logger.error(f"Audio processing failed for {input_file.name}: {e}")
+                results[input_file] = f"Error: {e}"
+        prepared.put(done)
+
+    def render_stage():
+        while (item := prepared.get()) is not done:
+            input_file, working_dir, transcribed = item
+            try:
+                transcribed.result()
+                logger.info(f"[Render] {input_file.name}")
+
+                # Lyric correction is best effort: without reference lyrics the raw transcription is used
+                # (the reference lyrics were prefetched during the audio stage)
+                if enhance_lyrics:
+                    try:
+                        fetch_and_save_lyrics(working_dir)
+                        perform_lyric_enhancement(working_dir, override=override, **enhancement_options)
+                    except Exception as e:
+                        logger.warning(f"Lyric enhancement skipped for {input_file.name}: {e}")
+
+                process_karaoke_subtitles(
+                    working_dir,
+                    override=override,
+                    screen_width=screen_width,
+                    screen_height=screen_height,
+                    **subtitle_options
+                )
+                video_path = process_karaoke_video(
+                    working_dir=working_dir,
+                    output_path=Path(output_dir),
+                    effect_path=Path(effect_path) if effect_path else None,
+                    **video_options
+                )
+                results[input_file] = video_path
+                logger.info(f"Karaoke video ready for {input_file.name}: {video_path}")
+
+            except Exception as e:
+                logger.error(f"Rendering failed for {input_file.name}: {e}")
+                results[input_file] = f"Error: {e}"
+
+    # Run the audio stage in the background while this thread renders
+    audio_thread = threading.Thread(target=audio_stage, name="batch-audio", daemon=True)
+    audio_thread.start()
+    render_stage()
+    audio_thread.join()
+    transcription.shutdown()
+
+    succeeded = sum(1 for result in results.values() if not str(result).startswith("Error"))
+    logger.info(f"Batch finished: {succeeded}/{len(audio_files)} karaoke videos created.")
+    return results
+
+
+def handle_batch_lyrics_fetch(
+        input_dir: Union[str, Path],
+        cache_dir: Union[str, Path],
+        recursive: bool = False,
+        override: bool = False,
+        cache_key_mode: str = CACHE_KEY_MODE,
+        max_workers: int = GENIUS_MAX_CONCURRENCY,
+):
+    """
+    Handler function to fetch the reference lyrics of every song of a directory.
+
+    Songs are processed concurrently: each worker initializes the working directory,
+    extracts the song metadata and fetches the lyrics. Requests to Genius go through the
+    shared pooled client, which enforces the politeness limits and answers repeated
+    requests from its on-disk cache.
+
+    Args:
+        input_dir (Union[str, Path]): Directory holding the songs (see `EXTENSIONS`).
+        cache_dir (Union[str, Path]): Cache directory for the working directories.
+        recursive (bool): Whether to include songs in subdirectories.
+        override (bool): Whether to fetch the lyrics again even if they already exist.
+        cache_key_mode (str): "file" or "audio" (see `initialize_working_directory`).
+        max_workers (int): Number of songs processed at the same time.
+
+    Returns:
+        dict: Mapping of input file to the reference lyrics path, or to the error message on failure.
+    """
+    audio_files = _find_audio_files(input_dir, recursive)
+    logger.info(f"Fetching reference lyrics for {len(audio_files)} songs from: {input_dir}")
+
+    def fetch(input_file):
+        try:
+            working_dir, _ = initialize_working_directory(input_file, Path(cache_dir), key_mode=cache_key_mode)
+            extract_audio_metadata(input_file, working_dir)
+            _name_unknown_song(working_dir, input_file)
+            fetch_and_save_lyrics(working_dir, override=override)
+            return working_dir / "reference_lyrics.json"
+
+        except Exception as e:
+            logger.error(f"Lyrics fetch failed for {input_file.name}: {e}")
+            return f"Error: {e}"
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="lyrics") as executor:
+        results = dict(zip(audio_files, executor.map(fetch, audio_files)))
+
+    succeeded = sum(1 for result in results.values() if not str(result).startswith("Error"))
+    logger.info(f"Lyrics fetch finished: {succeeded}/{len(audio_files)} songs.")
+    return results
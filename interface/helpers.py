@@ -106,6 +106,25 @@ def display_text_from_lyrics(json_file: Union[str, Path]) -> str:
         return f"Error: {e}"
 
 
+def dataframe_from_verses(verses: list) -> pd.DataFrame:
+    """
+    Converts verses (as in raw_lyrics.json or modified_lyrics.json) to a Pandas
+    DataFrame with a single column:
+    - Lyrics (the combined text)
+    """
+    rows = []
+    for verse_info in verses:
+        # Option 1: Use the "text" field directly if it already has full verse text
+        # verse_text = verse_info.get("text", "")
+
+        # Option 2: Or combine the words array if you want them re-joined:
+        verse_text = " ".join(w["word"] for w in verse_info["words"])
+
+        rows.append({"Processed Lyrics (Used for Karaoke)": verse_text})
+
+    return pd.DataFrame(rows)
+
+
 def display_dataframe_from_lyrics(json_path: Union[str, Path]) -> pd.DataFrame:
     """
     Loads raw_lyrics.json (or modified_lyrics.json) 
@@ -116,18 +135,7 @@ def display_dataframe_from_lyrics(json_path: Union[str, Path]) -> pd.DataFrame:
         with open(json_path, "r", encoding="utf-8") as f:
             data = json.load(f)
 
-        rows = []
-        for verse_info in data:
-            # Option 1: Use the "text" field directly if it already has full verse text
-            # verse_text = verse_info.get("text", "")
-
-            # Option 2: Or combine the words array if you want them re-joined:
-            verse_text = " ".join(w["word"] for w in verse_info["words"])
-
-            rows.append({"Processed Lyrics (Used for Karaoke)": verse_text})
-
-        df = pd.DataFrame(rows)
-        return df
+        return dataframe_from_verses(data)
     except Exception as e:
         print(f"Error reading {json_path}: {e}")
         return pd.DataFrame(columns=["Lyrics"])
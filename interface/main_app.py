@@ -22,6 +22,7 @@ from .helpers import (
 from modules import (
     get_available_colors,
     get_font_list,
+    get_available_model_sizes,
 )
 
 import pandas as pd
@@ -36,6 +37,7 @@ def main_app(cache_dir, output_dir, project_root):
         available_colors = get_available_colors()
         available_effects = ["None"] + get_effect_video_list(effects_dir)
         available_langs = ["Auto Detect"] + sorted(get_available_languages().keys())
+        available_model_sizes = get_available_model_sizes()
 
         ##############################################################################
         #                               APP STATES
@@ -122,6 +124,12 @@ def main_app(cache_dir, output_dir, project_root):
                             value="Auto Detect",
                             info="Select a language if auto-detection is not reliable; otherwise, choose 'Auto Detect'."
                         )
+                        model_size_input = gr.Dropdown(
+                            choices=available_model_sizes,
+                            label="Whisper Model Size",
+                            value="large-v2",
+                            info="Smaller models load and transcribe faster, larger models are more accurate."
+                        )
 
                 process_audio_button = gr.Button(
                     "Process Audio",
@@ -409,9 +417,12 @@ def main_app(cache_dir, output_dir, project_root):
                 compression_threshold_input,
                 temperature_input,
                 language_input,
+                model_size_input,
                 state_working_dir,
                 state_lyrics_json,
                 state_lyrics_display,
+                state_artist_name,
+                state_song_name,
 
                 # Hidden state: cache_dir
                 gr.State(cache_dir),
@@ -422,6 +433,9 @@ def main_app(cache_dir, output_dir, project_root):
                 state_lyrics_display,
                 state_artist_name,
                 state_song_name,
+
+                # Verses are streamed to the display box while the vocals are transcribed
+                raw_lyrics_box,
             ]
         ).then(
             # `.then()` event: After states are updated, display them in display box
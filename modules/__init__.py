@@ -12,6 +12,9 @@ from .stem_processing import (
 
 from .lyrics_processing import (
     transcribe_audio_lyrics,
+    TranscriptionService,
+    warm_up_whisper_model,
+    get_available_model_sizes,
     fetch_and_save_lyrics,
     perform_lyric_enhancement
 )
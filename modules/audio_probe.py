@@ -0,0 +1,143 @@
+# Standard Library Imports
+from pathlib import Path
+from typing import Optional, Union
+import subprocess
+import logging
+import json
+
+# Local Application Imports
+from .cache_manifest import read_manifest_entry, write_manifest_entry
+
+# Initialize Logger
+logger = logging.getLogger(__name__)
+
+# Manifest section holding the probe results of the song's audio files
+PROBE_SECTION = "probes"
+
+
+def _probe_key(file_path: Path, working_dir: Optional[Path]) -> str:
+    """Files of the working directory are keyed by name, other files (the upload) by path."""
+    if working_dir is not None and file_path.parent.resolve() == Path(working_dir).resolve():
+        return file_path.name
+    return str(file_path.resolve())
+
+
+def _run_ffprobe(file_path: Path) -> dict:
+    """
+    Read the duration and the format of the first audio stream with a single ffprobe call.
+
+    Returns:
+        dict: duration (float, seconds), sample_rate (int), channels (int) and codec (str).
+    """
+    result = subprocess.run(
+        [
+            "ffprobe",
+            "-v", "error",
+            "-select_streams", "a:0",
+            "-show_entries", "format=duration:stream=codec_name,sample_rate,channels",
+            "-of", "json",
+            str(file_path),
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"ffprobe failed: {result.stderr.decode('utf-8', 'ignore')}")
+
+    info = json.loads(result.stdout.decode("utf-8") or "{}")
+    streams = info.get("streams") or [{}]
+    stream = streams[0]
+
+    try:
+        duration = float(info.get("format", {})["duration"])
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError("Invalid duration format received from ffprobe.") from e
+
+    return {
+        "duration": duration,
+        "sample_rate": int(stream.get("sample_rate", 0)) or None,
+        "channels": stream.get("channels"),
+        "codec": stream.get("codec_name"),
+    }
+
+
+def _run_fpcalc(file_path: Path) -> dict:
+    """Compute the Chromaprint fingerprint (and fpcalc's duration estimate) of an audio file."""
+    import acoustid
+
+    duration, fingerprint = acoustid.fingerprint_file(str(file_path))
+    return {
+        "fingerprint": fingerprint.decode("utf-8") if isinstance(fingerprint, bytes) else fingerprint,
+        "fingerprint_duration": duration,
+    }
+
+
+def probe_audio(
+    file_path: Union[str, Path],
+    working_dir: Optional[Union[str, Path]] = None,
+    fingerprint: bool = False,
+) -> dict:
+    """
+    Probe an audio file once per song and reuse the result in every stage.
+
+    The duration, sample rate, channel count and codec (and, if requested, the Chromaprint
+    fingerprint) are cached in the song manifest together with the file size and
+    modification time, so later stages do not launch ffprobe or fpcalc again. Each tool
+    only runs for the fields asked for: a fingerprint request runs fpcalc alone (which
+    reports its own duration), and ffprobe runs the first time the format is asked for.
+
+    Args:
+        file_path (Union[str, Path]): Audio file to probe.
+        working_dir (Optional[Union[str, Path]]): Working directory whose manifest caches
+            the result. Without it the file is probed without caching.
+        fingerprint (bool): Whether the Chromaprint fingerprint is needed instead of the
+            format.
+
+    Returns:
+        dict: Probe result with fingerprint and fingerprint_duration if requested, otherwise
+            duration, sample_rate, channels and codec (plus any fields cached earlier).
+    """
+    file_path = Path(file_path)
+    stat = file_path.stat()
+    signature = [stat.st_size, stat.st_mtime_ns]
+    key = _probe_key(file_path, working_dir)
+
+    probe = None
+    if working_dir is not None:
+        cached = read_manifest_entry(working_dir, PROBE_SECTION, key)
+        if cached and cached.get("signature") == signature:
+            probe = cached
+
+    changed = probe is None
+    if probe is None:
+        probe = {"signature": signature}
+
+    if fingerprint and "fingerprint" not in probe:
+        logger.debug(f"Fingerprinting audio file: {file_path.name}")
+        probe.update(_run_fpcalc(file_path))
+        changed = True
+
+    if not fingerprint and "duration" not in probe:
+        logger.debug(f"Probing audio file: {file_path.name}")
+        probe.update(_run_ffprobe(file_path))
+        changed = True
+
+    if changed and working_dir is not None:
+        write_manifest_entry(working_dir, PROBE_SECTION, key, probe)
+    return probe
+
+
+def cache_audio_probe(file_path: Union[str, Path], working_dir: Union[str, Path], probe: dict) -> None:
+    """
+    Store a probe result computed before the working directory was known (e.g. the
+    fingerprint used to select the directory), so later stages reuse it.
+    """
+    file_path = Path(file_path)
+    stat = file_path.stat()
+    entry = {**probe, "signature": [stat.st_size, stat.st_mtime_ns]}
+    write_manifest_entry(working_dir, PROBE_SECTION, _probe_key(file_path, working_dir), entry)
+
+
+def get_audio_duration(file_path: Union[str, Path], working_dir: Optional[Union[str, Path]] = None) -> float:
+    """Return the duration of an audio file in seconds, probing it at most once per song."""
+    return probe_audio(file_path, working_dir)["duration"]
@@ -0,0 +1,204 @@
+# Standard Library Imports
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Union
+import threading
+import hashlib
+import logging
+import sqlite3
+import json
+import time
+
+# Third-Party Imports
+import requests
+
+# Local Application Imports
+from .config import (
+    ACOUSTID_BACKEND,
+    ACOUSTID_API_URL,
+    ACOUSTID_CATALOG_FILE,
+    ACOUSTID_TIMEOUT,
+    ACOUSTID_RETRIES,
+    ACOUSTID_CACHE_FILE,
+    ACOUSTID_EMPTY_RESULT_TTL,
+    FINGERPRINT_MATCH_THRESHOLD,
+)
+from .fingerprint import _decode_fingerprint, _fingerprint_similarity
+
+# Initialize Logger
+logger = logging.getLogger(__name__)
+
+# Metadata requested from the AcoustID web service
+ACOUSTID_META = "recordings releasegroups"
+
+
+class AcoustIDLookupCache:
+    """
+    Persistent fingerprint -> AcoustID response cache backed by SQLite.
+
+    Responses are keyed on the fingerprint digest and the rounded duration, so
+    re-running the metadata stage for a known song never reaches the network.
+    Responses without any match expire after `empty_ttl` seconds, since the song
+    may be added to AcoustID (or the catalog) later.
+    """
+
+    def __init__(self, db_path: Union[str, Path], empty_ttl: float = ACOUSTID_EMPTY_RESULT_TTL):
+        self.db_path = Path(db_path)
+        self.empty_ttl = empty_ttl
+        self._lock = threading.Lock()
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS lookups ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, created REAL NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection for one transaction and close it afterwards."""
+        connection = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _key(fingerprint: str, duration: float) -> str:
+        return f"{hashlib.sha256(fingerprint.encode('utf-8')).hexdigest()}:{int(duration)}"
+
+    def get(self, fingerprint: str, duration: float) -> Optional[dict]:
+        with self._lock, self._connect() as connection:
+            row = connection.execute(
+                "SELECT response, created FROM lookups WHERE key = ?", (self._key(fingerprint, duration),)
+            ).fetchone()
+        if row is None:
+            return None
+
+        response = json.loads(row[0])
+        if not response.get("results") and time.time() - row[1] > self.empty_ttl:
+            return None
+        return response
+
+    def put(self, fingerprint: str, duration: float, response: dict) -> None:
+        with self._lock, self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO lookups (key, response, created) VALUES (?, ?, ?)",
+                (self._key(fingerprint, duration), json.dumps(response), time.time()),
+            )
+
+
+def _lookup_web_service(api_key: str, fingerprint: str, duration: float, base_url: str = ACOUSTID_API_URL) -> dict:
+    """
+    Query the AcoustID web service (or a local stand-in exposing the same API).
+
+    Server errors (5xx), timeouts and connection failures are retried with exponential
+    backoff; other failures, such as a rejected API key (4xx), are raised at once.
+    """
+    data = {
+        "client": api_key,
+        "format": "json",
+        "duration": str(int(duration)),
+        "fingerprint": fingerprint,
+        "meta": ACOUSTID_META,
+    }
+
+    for attempt in range(ACOUSTID_RETRIES + 1):
+        try:
+            response = requests.post(base_url, data=data, timeout=ACOUSTID_TIMEOUT)
+            response.raise_for_status()
+            result = response.json()
+            if result.get("status") != "ok":
+                raise RuntimeError(f"AcoustID error: {result.get('error', {}).get('message', result)}")
+            return result
+
+        except (requests.RequestException, ValueError) as e:
+            transient = isinstance(e, (requests.ConnectionError, requests.Timeout)) or (
+                isinstance(e, requests.HTTPError) and e.response is not None and e.response.status_code >= 500
+            )
+            if not transient:
+                raise RuntimeError(f"AcoustID lookup failed: {e}") from e
+            if attempt == ACOUSTID_RETRIES:
+                raise RuntimeError(f"AcoustID lookup failed after {attempt + 1} attempts: {e}") from e
+            logger.debug(f"AcoustID lookup attempt {attempt + 1} failed: {e}. Retrying...")
+            time.sleep(2 ** attempt)
+
+
+def _lookup_catalog(fingerprint: str, duration: float, catalog_file: Union[str, Path] = ACOUSTID_CATALOG_FILE) -> dict:
+    """
+    Answer a lookup from a static catalog file, without any network access.
+
+    The catalog is a JSON list of entries with `fingerprint`, `duration`, `title`,
+    `artists` and `albums`. The entry with the most similar fingerprint is returned
+    in the AcoustID response format.
+    """
+    if not catalog_file or not Path(catalog_file).exists():
+        raise FileNotFoundError(f"AcoustID catalog file not found: {catalog_file}")
+
+    with open(catalog_file, "r", encoding="utf-8") as f:
+        catalog = json.load(f)
+
+    decoded = _decode_fingerprint(fingerprint)
+    best_entry, best_score = None, FINGERPRINT_MATCH_THRESHOLD
+    for entry in catalog:
+        if entry["fingerprint"] == fingerprint:
+            best_entry, best_score = entry, 1.0
+            break
+        score = _fingerprint_similarity(decoded, _decode_fingerprint(entry["fingerprint"]))
+        if score >= best_score:
+            best_entry, best_score = entry, score
+
+    if best_entry is None:
+        return {"status": "ok", "results": []}
+
+    return {
+        "status": "ok",
+        "results": [{
+            "score": best_score,
+            "recordings": [{
+                "title": best_entry.get("title"),
+                "artists": [{"name": name} for name in best_entry.get("artists", [])],
+                "releasegroups": [{"title": title} for title in best_entry.get("albums", [])],
+            }],
+        }],
+    }
+
+
+def lookup_recording(
+    api_key: str,
+    fingerprint: str,
+    duration: float,
+    cache_dir: Optional[Union[str, Path]] = None,
+    backend: str = ACOUSTID_BACKEND,
+) -> dict:
+    """
+    Look up the recordings matching a fingerprint, consulting the persistent cache first.
+
+    Args:
+        api_key (str): AcoustID application API key.
+        fingerprint (str): Compressed Chromaprint fingerprint.
+        duration (float): Duration of the audio in seconds.
+        cache_dir (Optional[Union[str, Path]]): Directory of the lookup cache database.
+            Without it, the cache is not used.
+        backend (str): "api" (AcoustID web service or a stand-in at `ACOUSTID_API_URL`),
+            "catalog" (static catalog file at `ACOUSTID_CATALOG_FILE`) or "none".
+
+    Returns:
+        dict: Response in the AcoustID web service format.
+    """
+    cache = AcoustIDLookupCache(Path(cache_dir) / ACOUSTID_CACHE_FILE) if cache_dir is not None else None
+    if cache is not None and (cached := cache.get(fingerprint, duration)) is not None:
+        logger.debug("AcoustID lookup answered from the cache.")
+        return cached
+
+    if backend == "api":
+        result = _lookup_web_service(api_key, fingerprint, duration)
+    elif backend == "catalog":
+        result = _lookup_catalog(fingerprint, duration)
+    elif backend == "none":
+        return {"status": "ok", "results": []}
+    else:
+        raise ValueError(f"Unknown AcoustID backend '{backend}'. Expected 'api', 'catalog' or 'none'.")
+
+    if cache is not None:
+        cache.put(fingerprint, duration, result)
+    return result
@@ -1,2 +1,35 @@
+# Standard Library Imports
+import os
+
 # File Extensions to search for in the input directory
-EXTENSIONS = {"mp3", "wav", "ogg", "flac"}
\ No newline at end of file
+EXTENSIONS = {"mp3", "wav", "ogg", "flac"}
+
+# Index of file hashes in the cache directory, so unchanged files are not hashed again
+HASH_INDEX_FILE = "hash_index.json"
+HASH_INDEX_MAX_ENTRIES = 10000
+
+# Cache key of a song's working directory:
+#   "file"  - SHA256 of the uploaded file
+#   "audio" - reuse the working directory of a cached song with near-identical audio
+#             (Chromaprint fingerprint), so re-encodes and re-tagged copies hit the cache
+CACHE_KEY_MODE = os.getenv("KARAOKE_CACHE_KEY_MODE", "file")
+
+# Index of the fingerprints of cached songs, and how close two songs must be to match
+FINGERPRINT_INDEX_FILE = "fingerprint_index.json"
+FINGERPRINT_MATCH_THRESHOLD = 0.90          # Fraction of matching fingerprint bits
+FINGERPRINT_DURATION_TOLERANCE = 2.0        # Seconds
+FINGERPRINT_MAX_OFFSET = 16                 # Sub-fingerprints (~0.12s each) of alignment slack
+
+# AcoustID metadata lookup:
+#   "api"     - AcoustID web service, or a local stand-in serving the same API at ACOUSTID_API_URL
+#   "catalog" - static JSON catalog (ACOUSTID_CATALOG_FILE), for offline environments
+#   "none"    - skip the lookup (songs keep the default 'Unknown' metadata)
+ACOUSTID_BACKEND = os.getenv("ACOUSTID_BACKEND", "api")
+ACOUSTID_API_URL = os.getenv("ACOUSTID_API_URL", "https://api.acoustid.org/v2/lookup")
+ACOUSTID_CATALOG_FILE = os.getenv("ACOUSTID_CATALOG_FILE")
+ACOUSTID_TIMEOUT = float(os.getenv("ACOUSTID_TIMEOUT", 10))     # Seconds per request
+ACOUSTID_RETRIES = int(os.getenv("ACOUSTID_RETRIES", 2))        # Retries after a server or connection error
+
+# Persistent fingerprint -> metadata cache in the cache directory
+ACOUSTID_CACHE_FILE = "acoustid_cache.sqlite"
+ACOUSTID_EMPTY_RESULT_TTL = float(os.getenv("ACOUSTID_EMPTY_RESULT_TTL", 7 * 24 * 3600))  # Seconds a "no match" is reused
@@ -0,0 +1,187 @@
+# Standard Library Imports
+from pathlib import Path
+from typing import Optional, Union
+import threading
+import logging
+import base64
+import json
+import os
+
+# Third-Party Imports
+import numpy as np
+
+# Local Application Imports
+from .config import (
+    FINGERPRINT_INDEX_FILE,
+    FINGERPRINT_MATCH_THRESHOLD,
+    FINGERPRINT_DURATION_TOLERANCE,
+    FINGERPRINT_MAX_OFFSET,
+)
+
+# Initialize Logger
+logger = logging.getLogger(__name__)
+
+# Serializes access to the fingerprint index between concurrent jobs
+_FINGERPRINT_INDEX_LOCK = threading.Lock()
+
+# Decoded fingerprints of the indexed songs, keyed by working directory name and stored with
+# the compressed fingerprint they were decoded from, so each song is only decoded once
+_DECODED_FINGERPRINTS = {}
+
+
+def _unpack_bits(data: bytes, width: int, count: int) -> list:
+    """Unpack `count` little-endian values of `width` bits from a byte string."""
+    packed = int.from_bytes(data, "little")
+    mask = (1 << width) - 1
+    return [(packed >> (width * i)) & mask for i in range(count)]
+
+
+def _decode_fingerprint(fingerprint: str) -> np.ndarray:
+    """
+    Decode a compressed Chromaprint fingerprint into its 32-bit sub-fingerprints.
+
+    The compressed format stores, per sub-fingerprint, the positions of the bits that
+    differ from the previous one as 3-bit deltas terminated by 0; deltas of 7 or more
+    continue in a 5-bit exception stream after the normal one.
+
+    Args:
+        fingerprint (str): Compressed fingerprint as returned by fpcalc.
+
+    Returns:
+        np.ndarray: Sub-fingerprints as uint32.
+    """
+    data = base64.urlsafe_b64decode(fingerprint + "=" * (-len(fingerprint) % 4))
+    if len(data) < 4:
+        raise ValueError("Fingerprint is too short.")
+
+    num_items = int.from_bytes(data[1:4], "big")
+    body = data[4:]
+
+    # Read the 3-bit deltas until every sub-fingerprint is terminated
+    normal = []
+    terminated = 0
+    for value in _unpack_bits(body, 3, len(body) * 8 // 3):
+        if terminated == num_items:
+            break
+        normal.append(value)
+        terminated += value == 0
+    if terminated != num_items:
+        raise ValueError("Fingerprint is truncated.")
+
+    # Extend the saturated deltas with the exception stream
+    exceptions_data = body[(len(normal) * 3 + 7) // 8:]
+    exceptions = iter(_unpack_bits(exceptions_data, 5, len(exceptions_data) * 8 // 5))
+    deltas = [value + next(exceptions) if value == 7 else value for value in normal]
+
+    # Rebuild each sub-fingerprint from its bit positions, XOR-ed with the previous one
+    items = np.zeros(num_items, dtype=np.uint32)
+    index, last_bit, value, previous = 0, 0, 0, 0
+    for delta in deltas:
+        if delta == 0:
+            previous ^= value
+            items[index] = previous
+            index, last_bit, value = index + 1, 0, 0
+            continue
+        last_bit += delta
+        value |= 1 << (last_bit - 1)
+
+    return items
+
+
+def _fingerprint_similarity(first: np.ndarray, second: np.ndarray, max_offset: int = FINGERPRINT_MAX_OFFSET) -> float:
+    """
+    Compare two decoded fingerprints.
+
+    The fingerprints are aligned at every offset up to `max_offset` sub-fingerprints
+    (encoders may add or trim some silence at the start), and the best fraction of
+    matching bits over the overlapping part is returned.
+
+    Returns:
+        float: Similarity between 0.0 and 1.0 (about 0.5 for unrelated audio).
+    """
+    best = 0.0
+    for offset in range(-max_offset, max_offset + 1):
+        a = first[max(0, offset):]
+        b = second[max(0, -offset):]
+        length = min(len(a), len(b))
+
+        # Require a meaningful overlap (half of the shorter fingerprint)
+        if length == 0 or length < min(len(first), len(second)) // 2:
+            continue
+
+        differing = np.unpackbits((a[:length] ^ b[:length]).view(np.uint8)).sum()
+        best = max(best, 1.0 - differing / (32 * length))
+
+    return best
+
+
+def _decoded_song_fingerprint(name: str, fingerprint: str) -> np.ndarray:
+    """Return the decoded fingerprint of an indexed song, decoding it on first use."""
+    cached = _DECODED_FINGERPRINTS.get(name)
+    if cached is None or cached[0] != fingerprint:
+        cached = (fingerprint, _decode_fingerprint(fingerprint))
+        _DECODED_FINGERPRINTS[name] = cached
+    return cached[1]
+
+
+def _load_fingerprint_index(index_file: Path) -> dict:
+    try:
+        return json.loads(index_file.read_text()) if index_file.exists() else {}
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _find_matching_song(cache_dir: Union[str, Path], duration: float, fingerprint: str) -> Optional[str]:
+    """
+    Look up a cached song with near-identical audio.
+
+    Args:
+        cache_dir (Union[str, Path]): Cache directory holding the fingerprint index.
+        duration (float): Duration of the new audio in seconds.
+        fingerprint (str): Compressed Chromaprint fingerprint of the new audio.
+
+    Returns:
+        Optional[str]: Name of the matching working directory, or None.
+    """
+    cache_dir = Path(cache_dir)
+    with _FINGERPRINT_INDEX_LOCK:
+        index = _load_fingerprint_index(cache_dir / FINGERPRINT_INDEX_FILE)
+
+    decoded = _decode_fingerprint(fingerprint)
+    best_name, best_score = None, FINGERPRINT_MATCH_THRESHOLD
+    for name, entry in index.items():
+        # Only compare songs of similar length that are still cached
+        if abs(entry["duration"] - duration) > FINGERPRINT_DURATION_TOLERANCE:
+            continue
+        if not (cache_dir / name).is_dir():
+            continue
+
+        if entry["fingerprint"] == fingerprint:
+            return name
+
+        score = _fingerprint_similarity(decoded, _decoded_song_fingerprint(name, entry["fingerprint"]))
+        if score >= best_score:
+            best_name, best_score = name, score
+
+    if best_name is not None:
+        logger.info(f"Audio matches cached song {best_name} (similarity {best_score:.2f}).")
+    return best_name
+
+
+def _register_song_fingerprint(cache_dir: Union[str, Path], name: str, duration: float, fingerprint: str) -> None:
+    """Add a working directory to the fingerprint index and drop entries of evicted songs."""
+    cache_dir = Path(cache_dir)
+    index_file = cache_dir / FINGERPRINT_INDEX_FILE
+
+    with _FINGERPRINT_INDEX_LOCK:
+        index = _load_fingerprint_index(index_file)
+        index = {key: entry for key, entry in index.items() if (cache_dir / key).is_dir()}
+        index[name] = {"duration": duration, "fingerprint": fingerprint}
+
+        temp_file = index_file.with_suffix(".tmp")
+        temp_file.write_text(json.dumps(index))
+        os.replace(temp_file, index_file)
+
+        # Forget the decoded fingerprints of songs that left the index
+        for key in set(_DECODED_FINGERPRINTS) - set(index):
+            _DECODED_FINGERPRINTS.pop(key, None)
@@ -7,10 +7,11 @@ import os
 
 # Third-Party Imports
 from dotenv import load_dotenv
-import acoustid
 
 # Local Application Imports
 from modules.utilities import normalize_path
+from modules.audio_probe import probe_audio
+from .acoustid_lookup import lookup_recording
 
 # Initialize Logger
 logger = logging.getLogger(__name__)
@@ -52,19 +53,27 @@ def _fetch_audio_metadata(
 
         try:
             # Generate fingerprint and duration for the input audio file by using Chromaprint fpcalc
-            duration, fingerprint = acoustid.fingerprint_file(audio_path)
+            # (computed once per song and shared with the other stages through the song manifest)
+            probe = probe_audio(audio_path, output_directory, fingerprint=True)
+            duration, fingerprint = probe["fingerprint_duration"], probe["fingerprint"]
             logger.debug(f"Generated fingerprint and duration: {duration}, {fingerprint}")
 
             # Update metadata with the generated fingerprint and duration
-            metadata["fingerprint"] = fingerprint.decode('utf-8') if isinstance(fingerprint, bytes) else fingerprint
+            metadata["fingerprint"] = fingerprint
             metadata["duration"] = duration
 
         except Exception as e:
             logger.warning(f"Failed to generate fingerprint and duration: {e}")
 
         try:
-            # Query AcoustID API and search for the best matching audio
-            result = acoustid.lookup(ACOUSTID_API_KEY, metadata["fingerprint"], int(metadata["duration"]))
+            # Query AcoustID (through the persistent lookup cache in the cache directory)
+            # and search for the best matching audio
+            result = lookup_recording(
+                ACOUSTID_API_KEY,
+                metadata["fingerprint"],
+                metadata["duration"],
+                cache_dir=Path(output_directory).parent,
+            )
             logger.debug(f"AcoustID lookup result: {result}")
 
             # Check if there is a match found and obtain the best matching audio details
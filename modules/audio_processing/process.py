@@ -8,8 +8,12 @@ from .main import _fetch_audio_metadata
 from .utilities import (
     _create_directory,
     _validate_audio_file,
-    _get_file_hash,
+    _get_cached_file_hash,
 )
+from .fingerprint import _find_matching_song, _register_song_fingerprint
+from .config import CACHE_KEY_MODE
+from ..cache_manager import get_cache_manager
+from ..audio_probe import probe_audio, cache_audio_probe
 
 # Initialize Logger
 logger = logging.getLogger(__name__)
@@ -18,15 +22,47 @@ logger = logging.getLogger(__name__)
 def initialize_working_directory(
         input_file: Path,
         cache_dir: Path,
+        key_mode: str = CACHE_KEY_MODE,
 ):
-    """Initialize the working directory for the input file."""
+    """
+    Initialize the working directory for the input file.
+
+    With `key_mode="file"` the directory is named after the SHA256 of the file. With
+    `key_mode="audio"` the audio fingerprint is compared with the cached songs first, and
+    the directory of a song with near-identical audio (e.g. the same track as MP3 and FLAC,
+    or with different tags) is reused with all its stems and lyrics.
+    """
     # Confirm the file is a valid audio file
     if not _validate_audio_file(input_file):
         raise ValueError(f"Invalid audio file: {input_file}. Please provide a valid audio file.")
     
     logger.info(f"Initializing working directory for input file: {Path(input_file).stem}")
-    file_hash = _get_file_hash(input_file)
+    file_hash, probe = None, None
+
+    if key_mode == "audio":
+        try:
+            probe = probe_audio(input_file, fingerprint=True)
+            duration, fingerprint = probe["fingerprint_duration"], probe["fingerprint"]
+            file_hash = _find_matching_song(cache_dir, duration, fingerprint)
+
+            # New audio: key it on the file and remember its fingerprint for later uploads
+            if file_hash is None:
+                file_hash = _get_cached_file_hash(input_file, cache_dir)
+                _register_song_fingerprint(cache_dir, file_hash, duration, fingerprint)
+
+        except Exception as e:
+            logger.warning(f"Audio fingerprint lookup failed: {e}. Falling back to the file hash.")
+
+    if file_hash is None:
+        file_hash = _get_cached_file_hash(input_file, cache_dir)
     working_dir = _create_directory(cache_dir / file_hash)
+
+    # Keep the probe (and fingerprint) so the metadata lookup does not run fpcalc again
+    if probe is not None:
+        cache_audio_probe(input_file, working_dir, probe)
+
+    # Mark the song as recently used so it is the last candidate for eviction
+    get_cache_manager(cache_dir).touch(working_dir)
     logger.info(f"Working directory initialized: {working_dir}")
     return working_dir, file_hash
 
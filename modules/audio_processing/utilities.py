@@ -1,8 +1,12 @@
 # Standard Library Imports
-from .config import EXTENSIONS
+from .config import EXTENSIONS, HASH_INDEX_FILE, HASH_INDEX_MAX_ENTRIES
 from pathlib import Path
+import threading
 import logging
 import hashlib
+import json
+import mmap
+import os
 
 # Initialize Logger
 logger = logging.getLogger(__name__)
@@ -27,8 +31,8 @@ def _create_directory(path):
 def _get_file_hash(file_path):
     """
     Generate a SHA256 hash of a file's content.
-    Once all chunks have been read and processed, finalize 
-        the hash and get the hexadecimal representation.
+    The file is memory-mapped and hashed in a single call, so the whole file is
+        processed by hashlib without a Python-level read loop.
     Args:
         file_path (str): Path to the file.
     Returns:
@@ -39,18 +43,79 @@ def _get_file_hash(file_path):
 
     # Open the file in binary read mode
     with open(file_path, 'rb') as f:
-
-        # Read the file in chunks of 8192 bytes
-        while chunk := f.read(8192):
-
-            # Update the hash object with the chunk
-            hash_func.update(chunk)
+        try:
+            # Map the file into memory and hash it in one pass (empty files cannot be mapped)
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    hash_func.update(mapped)
+
+        except (OSError, ValueError):
+            # Fall back to large buffered reads where mapping is not supported
+            f.seek(0)
+            hash_func = hashlib.sha256()
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                hash_func.update(chunk)
 
     # Return the hexadecimal representation of the hash
     logger.debug(f"File hash: {hash_func.hexdigest()}")
     return hash_func.hexdigest()
 
 
+# Serializes access to the hash index between concurrent jobs
+_HASH_INDEX_LOCK = threading.Lock()
+
+
+def _get_cached_file_hash(file_path, cache_dir):
+    """
+    Return the SHA256 hash of a file, reusing the digest of an unchanged file.
+
+    Digests are remembered in a small index in the cache directory, keyed on the resolved
+    path and validated against the file size, modification time and inode. Re-submitting
+    an unchanged file therefore skips hashing entirely.
+
+    Args:
+        file_path (str): Path to the file.
+        cache_dir (str): Cache directory holding the hash index.
+    Returns:
+        str: Hexadecimal hash of the file.
+    """
+    file_path = Path(file_path).resolve()
+    index_file = Path(cache_dir) / HASH_INDEX_FILE
+    stat = file_path.stat()
+    signature = [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+
+    with _HASH_INDEX_LOCK:
+        try:
+            index = json.loads(index_file.read_text()) if index_file.exists() else {}
+        except (OSError, json.JSONDecodeError):
+            index = {}
+
+        entry = index.get(str(file_path))
+        if entry and entry["signature"] == signature:
+            logger.debug(f"File unchanged since last hash: {file_path.name}")
+            return entry["sha256"]
+
+    file_hash = _get_file_hash(file_path)
+
+    with _HASH_INDEX_LOCK:
+        try:
+            index = json.loads(index_file.read_text()) if index_file.exists() else {}
+        except (OSError, json.JSONDecodeError):
+            index = {}
+
+        # Keep the most recently hashed files only (dicts preserve insertion order)
+        index.pop(str(file_path), None)
+        index[str(file_path)] = {"signature": signature, "sha256": file_hash}
+        while len(index) > HASH_INDEX_MAX_ENTRIES:
+            index.pop(next(iter(index)))
+
+        temp_file = index_file.with_suffix(".tmp")
+        temp_file.write_text(json.dumps(index))
+        os.replace(temp_file, index_file)
+
+    return file_hash
+
+
 def _validate_audio_file(file_path):
     """
     Validate the existence and extension of an audio file.
@@ -0,0 +1,267 @@
+# Standard Library Imports
+from pathlib import Path
+from typing import Dict, Optional, Union
+import threading
+import logging
+import shutil
+import time
+import json
+import os
+
+# Local Application Imports
+from .utilities import load_json, save_json
+from .cache_manifest import VARIANTS_DIR
+
+# Initialize Logger
+logger = logging.getLogger(__name__)
+
+# Byte budget of the cache directory (unlimited if unset)
+CACHE_MAX_BYTES = int(float(os.getenv("KARAOKE_CACHE_MAX_GB", 0)) * 1024 ** 3) or None
+
+# Working directories used within this window are never evicted (they may be in use)
+ACTIVE_WINDOW_SECONDS = int(os.getenv("KARAOKE_CACHE_ACTIVE_SECONDS", 3600))
+
+# Interval of the background eviction pass
+EVICTION_INTERVAL_SECONDS = 60
+
+# Index of the working directories (size and last access), stored in the cache directory
+INDEX_FILE = "cache_index.json"
+
+# Marker file that protects a working directory from eviction
+PIN_FILE = ".pinned"
+
+# Audio files in a working directory (stems, karaoke audio)
+AUDIO_SUFFIXES = {".wav", ".flac", ".mp3"}
+
+
+def _audio_variants(directory: Path) -> list:
+    variants_dir = directory / VARIANTS_DIR
+    if not variants_dir.is_dir():
+        return []
+    return [
+        variant for variant in variants_dir.iterdir()
+        if variant.is_dir() and any(file.suffix in AUDIO_SUFFIXES for file in variant.iterdir())
+    ]
+
+
+def _instrument_stems(directory: Path) -> list:
+    return [file for file in directory.iterdir() if file.suffix in AUDIO_SUFFIXES and file.stem in ("bass", "drums", "other")]
+
+
+def _karaoke_audio(directory: Path) -> list:
+    return [file for file in directory.iterdir() if file.suffix in AUDIO_SUFFIXES and file.stem in ("vocals", "karaoke_audio")]
+
+
+def _whole_directory(directory: Path) -> list:
+    return [directory]
+
+
+# Eviction tiers, cheapest to recompute first. Stems are large and derivable from the
+# source audio; the lyrics are small but cost a transcription and an LLM pass, so they
+# only go with the whole directory. Downstream stages are keyed on the stage that produced
+# their inputs (see `compute_cache_key`), so re-separated stems do not invalidate the lyrics.
+EVICTION_TIERS = (
+    ("stored stem variants", _audio_variants),
+    ("instrument stems", _instrument_stems),
+    ("vocals and karaoke audio", _karaoke_audio),
+    ("working directory", _whole_directory),
+)
+
+
+def _directory_size(directory: Path) -> int:
+    """Return the disk usage of a directory, counting hard-linked files once."""
+    seen, total = set(), 0
+    for root, _, files in os.walk(directory):
+        for name in files:
+            try:
+                stat = os.stat(os.path.join(root, name))
+            except FileNotFoundError:
+                continue
+            if (stat.st_dev, stat.st_ino) not in seen:
+                seen.add((stat.st_dev, stat.st_ino))
+                total += stat.st_size
+    return total
+
+
+def _remove(path: Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        path.unlink(missing_ok=True)
+
+
+class CacheManager:
+    """
+    Keep the `cache/<sha256>` working directories within a byte budget.
+
+    Each working directory's size and last access time are tracked in an index. A background
+    thread measures recently used directories and, when the cache exceeds its budget, evicts
+    the least recently used directories tier by tier: stored stem variants and instrument
+    stems first, then the vocals and karaoke audio, and the whole directory (metadata,
+    lyrics, subtitles) last. Evicted artifacts are recomputed by their stage on next use.
+
+    Directories holding a `.pinned` marker, and directories used within the active window,
+    are never evicted.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], max_bytes: Optional[int] = CACHE_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._dirty = set()
+        self._index = self._load_index()
+        self._thread = None
+
+    # ---------------- Index ----------------
+    def _load_index(self) -> Dict[str, dict]:
+        index_file = self.cache_dir / INDEX_FILE
+        try:
+            return load_json(index_file) if index_file.exists() else {}
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Cache index unreadable, rebuilding it: {e}")
+            return {}
+
+    def _save_index(self) -> None:
+        temp_file = self.cache_dir / f"{INDEX_FILE}.tmp"
+        save_json(self._index, temp_file)
+        os.replace(temp_file, self.cache_dir / INDEX_FILE)
+
+    # ---------------- Public API ----------------
+    def touch(self, working_dir: Union[str, Path]) -> None:
+        """Record an access to a working directory and schedule its size to be measured."""
+        name = Path(working_dir).name
+        with self._lock:
+            entry = self._index.setdefault(name, {"size": 0})
+            entry["last_access"] = time.time()
+            self._dirty.add(name)
+            self._save_index()
+        self.start()
+        self._wake.set()
+
+    def pin(self, working_dir: Union[str, Path]) -> None:
+        """Protect a working directory from eviction."""
+        (self.cache_dir / Path(working_dir).name / PIN_FILE).touch()
+
+    def unpin(self, working_dir: Union[str, Path]) -> None:
+        """Allow a working directory to be evicted again."""
+        (self.cache_dir / Path(working_dir).name / PIN_FILE).unlink(missing_ok=True)
+
+    def is_pinned(self, working_dir: Union[str, Path]) -> bool:
+        return (self.cache_dir / Path(working_dir).name / PIN_FILE).exists()
+
+    def total_size(self) -> int:
+        """Return the tracked size of the cache in bytes."""
+        with self._lock:
+            return sum(entry.get("size", 0) for entry in self._index.values())
+
+    def start(self) -> None:
+        """Start the background eviction thread (only when a budget is configured)."""
+        if self.max_bytes is None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="cache-eviction", daemon=True)
+                self._thread.start()
+
+    # ---------------- Background work ----------------
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(timeout=EVICTION_INTERVAL_SECONDS)
+            self._wake.clear()
+            try:
+                self._measure_pending()
+                self.evict()
+            except Exception as e:
+                logger.error(f"Cache eviction failed: {e}")
+
+    def _measure_pending(self) -> None:
+        """Measure the directories that were used recently or are not indexed yet, one at a time."""
+        # Hidden directories (e.g. the HTTP cache) are not song working directories
+        existing = {path.name for path in self.cache_dir.iterdir() if path.is_dir() and not path.name.startswith(".")}
+        with self._lock:
+            # Forget directories that were removed outside the manager
+            for name in set(self._index) - existing:
+                del self._index[name]
+            pending = (existing - set(self._index)) | (self._dirty & existing)
+            for name in existing - set(self._index):
+                self._index[name] = {"size": 0, "last_access": (self.cache_dir / name).stat().st_mtime}
+
+        for name in pending:
+            size = _directory_size(self.cache_dir / name)
+            with self._lock:
+                if name in self._index:
+                    self._index[name]["size"] = size
+                # Keep measuring directories that are still in use
+                if time.time() - self._index.get(name, {}).get("last_access", 0) > ACTIVE_WINDOW_SECONDS:
+                    self._dirty.discard(name)
+
+        with self._lock:
+            self._save_index()
+
+    def _eviction_candidates(self) -> list:
+        """Return the evictable directories, least recently used first."""
+        now = time.time()
+        with self._lock:
+            entries = sorted(self._index.items(), key=lambda item: item[1].get("last_access", 0))
+        return [
+            name for name, entry in entries
+            if now - entry.get("last_access", 0) > ACTIVE_WINDOW_SECONDS
+            and not (self.cache_dir / name / PIN_FILE).exists()
+        ]
+
+    def evict(self) -> int:
+        """
+        Evict artifacts until the cache fits its budget.
+
+        Works through the eviction tiers in order; within a tier the least recently used
+        directories go first. The index lock is only held between steps, so new jobs are
+        never blocked by a long eviction pass.
+
+        Returns:
+            int: Number of bytes freed.
+        """
+        if self.max_bytes is None:
+            return 0
+
+        freed = 0
+        for tier_name, select_targets in EVICTION_TIERS:
+            for name in self._eviction_candidates():
+                if self.total_size() <= self.max_bytes:
+                    return freed
+
+                directory = self.cache_dir / name
+                targets = select_targets(directory) if directory.exists() else []
+                if not targets:
+                    continue
+
+                for target in targets:
+                    _remove(target)
+
+                with self._lock:
+                    before = self._index.get(name, {}).get("size", 0)
+                    if directory.exists():
+                        self._index[name]["size"] = _directory_size(directory)
+                    else:
+                        self._index.pop(name, None)
+                    after = self._index.get(name, {}).get("size", 0)
+                    self._save_index()
+
+                freed += before - after
+                logger.info(f"Evicted {tier_name} of cached song {name} ({(before - after) / 1024 ** 2:.1f} MB).")
+
+        return freed
+
+
+# One manager per cache directory
+_CACHE_MANAGERS = {}
+_CACHE_MANAGERS_LOCK = threading.Lock()
+
+
+def get_cache_manager(cache_dir: Union[str, Path]) -> CacheManager:
+    """Return the shared cache manager of a cache directory."""
+    key = Path(cache_dir).resolve()
+    with _CACHE_MANAGERS_LOCK:
+        if key not in _CACHE_MANAGERS:
+            _CACHE_MANAGERS[key] = CacheManager(key)
+        return _CACHE_MANAGERS[key]
@@ -0,0 +1,264 @@
+# Standard Library Imports
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from typing import Iterable, Optional, Union
+import threading
+import hashlib
+import logging
+import shutil
+import json
+import os
+
+# Local Application Imports
+from .utilities import load_json, save_json
+
+# Initialize Logger
+logger = logging.getLogger(__name__)
+
+# Per-song manifest of the artifacts in a working directory and the keys they were computed with
+MANIFEST_FILE = "manifest.json"
+
+# Directory holding one subdirectory per cache key with the artifacts computed for it
+VARIANTS_DIR = "variants"
+
+# Manifest updates are read-modify-write; pipeline stages of a song run concurrently
+_MANIFEST_LOCK = threading.RLock()
+
+
+def _load_manifest(working_dir: Path) -> dict:
+    manifest_file = working_dir / MANIFEST_FILE
+    manifest = load_json(manifest_file) if manifest_file.exists() else {}
+    for section in ("stages", "variants", "digests"):
+        manifest.setdefault(section, {})
+    return manifest
+
+
+def _save_manifest(manifest: dict, working_dir: Path) -> None:
+    # Write atomically so a crash never leaves a truncated manifest behind
+    temp_file = working_dir / f"{MANIFEST_FILE}.tmp"
+    save_json(manifest, temp_file)
+    os.replace(temp_file, working_dir / MANIFEST_FILE)
+
+
+def _file_digest(file_path: Path, entry: Optional[dict]) -> dict:
+    """
+    Return the digest entry (size, modification time and SHA-256) of a working directory file.
+
+    The entry remembered in the manifest is returned as is if the file size and modification
+    time still match, so an unchanged file is only hashed once.
+    """
+    stat = file_path.stat()
+    if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+        return entry
+
+    hash_func = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            hash_func.update(chunk)
+
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": hash_func.hexdigest(),
+    }
+
+
+def _file_digests(working_dir: Path, files: Iterable[Path]) -> dict:
+    """
+    Return the SHA-256 digests of working directory files, keyed by file name.
+
+    Files are hashed without holding the manifest lock, which is only taken to read the
+    remembered digests and to store new ones, so concurrent stages and songs never queue
+    behind a long read of another stage's stems.
+    """
+    with _MANIFEST_LOCK:
+        known = dict(_load_manifest(working_dir)["digests"])
+
+    entries = {file_path.name: _file_digest(file_path, known.get(file_path.name)) for file_path in files}
+    hashed = {name: entry for name, entry in entries.items() if entry is not known.get(name)}
+    if hashed:
+        with _MANIFEST_LOCK:
+            manifest = _load_manifest(working_dir)
+            manifest["digests"].update(hashed)
+            _save_manifest(manifest, working_dir)
+
+    return {name: entry["sha256"] for name, entry in entries.items()}
+
+
+def _to_jsonable(value):
+    """Convert stage parameters (dataclasses, paths, tuples) into JSON-serializable values."""
+    if is_dataclass(value):
+        return _to_jsonable(asdict(value))
+    if isinstance(value, dict):
+        return {str(k): _to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_jsonable(v) for v in value]
+    if isinstance(value, Path):
+        return value.as_posix()
+    return value
+
+
+def _link_or_copy(source: Path, destination: Path) -> None:
+    """Hard-link a file (no extra disk space), falling back to a copy across file systems."""
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+def read_manifest_entry(working_dir: Union[str, Path], section: str, name: str) -> Optional[dict]:
+    """Return an entry of a manifest section (e.g. a cached audio probe), or None."""
+    with _MANIFEST_LOCK:
+        return _load_manifest(Path(working_dir)).get(section, {}).get(name)
+
+
+def write_manifest_entry(working_dir: Union[str, Path], section: str, name: str, entry: dict) -> None:
+    """Store an entry in a manifest section."""
+    working_dir = Path(working_dir)
+    with _MANIFEST_LOCK:
+        manifest = _load_manifest(working_dir)
+        manifest.setdefault(section, {})[name] = entry
+        _save_manifest(manifest, working_dir)
+
+
+def compute_cache_key(
+    working_dir: Union[str, Path],
+    stage: str,
+    params: Optional[dict] = None,
+    inputs: Iterable[Union[str, Path, None]] = (),
+) -> str:
+    """
+    Compute the cache key of a stage from its parameters and the content of its inputs.
+
+    Args:
+        working_dir (Union[str, Path]): Working directory of the song.
+        stage (str): Name of the stage (e.g. "transcription").
+        params (Optional[dict]): Parameters that affect the stage output (dataclasses allowed).
+        inputs (Iterable[Union[str, Path, None]]): Working directory files the stage reads.
+            Missing files (or None) are part of the key as absent inputs, and unchanged outputs
+            of a recorded stage count as that stage's key rather than their content.
+
+    Returns:
+        str: Hexadecimal SHA-256 cache key.
+    """
+    working_dir = Path(working_dir)
+    input_files = [Path(input_file) for input_file in inputs if input_file is not None]
+    digests = _file_digests(working_dir, [input_file for input_file in input_files if input_file.is_file()])
+
+    # Inputs that are unchanged outputs of a recorded stage are identified by that stage's key,
+    # so recomputing an evicted artifact (e.g. stems, which are not bit-exact) keeps the keys
+    # of the stages downstream
+    with _MANIFEST_LOCK:
+        producers = {
+            name: (entry["key"], entry.get("digests", {}).get(name))
+            for entry in _load_manifest(working_dir)["stages"].values()
+            for name in entry["outputs"]
+        }
+
+    input_digests = {}
+    for input_file in input_files:
+        digest = digests.get(input_file.name)
+        producer_key, recorded_digest = producers.get(input_file.name, (None, None))
+        if digest is not None and digest == recorded_digest:
+            digest = f"stage:{producer_key}"
+        input_digests[input_file.name] = digest
+
+    # The working directory name is the hash of the source audio
+    payload = {
+        "source": working_dir.name,
+        "stage": stage,
+        "params": _to_jsonable(params or {}),
+        "inputs": input_digests,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def restore_artifacts(
+    working_dir: Union[str, Path],
+    stage: str,
+    key: str,
+    override: bool = False,
+) -> bool:
+    """
+    Make the artifacts computed for a cache key the current outputs of a stage.
+
+    If the current outputs were computed with the same key, nothing is done. If the key was
+    computed before under different parameters, its stored variant is restored in place.
+    On a miss (or with `override`), the current outputs are detached from the variant store
+    so the stage can rewrite them without altering other variants.
+
+    Args:
+        working_dir (Union[str, Path]): Working directory of the song.
+        stage (str): Name of the stage.
+        key (str): Cache key from `compute_cache_key`.
+        override (bool): Whether to force recomputation.
+
+    Returns:
+        bool: True if the stage outputs for the key are in place and the stage can be skipped.
+    """
+    working_dir = Path(working_dir)
+
+    with _MANIFEST_LOCK:
+        manifest = _load_manifest(working_dir)
+        current = manifest["stages"].get(stage)
+
+        # Cache hit: the current outputs were computed with this key
+        if not override and current and current["key"] == key:
+            if all((working_dir / name).is_file() for name in current["outputs"]):
+                return True
+
+        # Detach the current outputs; their variant (if any) stays in the store
+        if current:
+            for name in current["outputs"]:
+                (working_dir / name).unlink(missing_ok=True)
+            del manifest["stages"][stage]
+
+        # Restore a variant computed earlier for this key
+        variant = manifest["variants"].get(key)
+        variant_dir = working_dir / VARIANTS_DIR / key
+        if not override and variant and all((variant_dir / name).is_file() for name in variant["outputs"]):
+            for name in variant["outputs"]:
+                (working_dir / name).unlink(missing_ok=True)
+                _link_or_copy(variant_dir / name, working_dir / name)
+            manifest["stages"][stage] = {"key": key, "outputs": variant["outputs"], "digests": variant.get("digests", {})}
+            _save_manifest(manifest, working_dir)
+            logger.info(f"Restored cached '{stage}' artifacts computed with the requested settings.")
+            return True
+
+        _save_manifest(manifest, working_dir)
+        return False
+
+
+def record_artifacts(
+    working_dir: Union[str, Path],
+    stage: str,
+    key: str,
+    outputs: Iterable[Union[str, Path]],
+) -> None:
+    """
+    Record the outputs of a stage under its cache key and keep them as a variant.
+
+    Args:
+        working_dir (Union[str, Path]): Working directory of the song.
+        stage (str): Name of the stage.
+        key (str): Cache key from `compute_cache_key`.
+        outputs (Iterable[Union[str, Path]]): Files written by the stage into the working directory.
+    """
+    working_dir = Path(working_dir)
+    names = [Path(output).name for output in outputs]
+
+    # The output digests tell later keys whether a file is still what this stage wrote
+    digests = _file_digests(working_dir, [working_dir / name for name in names])
+
+    with _MANIFEST_LOCK:
+        manifest = _load_manifest(working_dir)
+
+        variant_dir = working_dir / VARIANTS_DIR / key
+        shutil.rmtree(variant_dir, ignore_errors=True)
+        variant_dir.mkdir(parents=True)
+        for name in names:
+            _link_or_copy(working_dir / name, variant_dir / name)
+
+        manifest["stages"][stage] = {"key": key, "outputs": names, "digests": digests}
+        manifest["variants"][key] = {"stage": stage, "outputs": names, "digests": digests}
+        _save_manifest(manifest, working_dir)
@@ -2,6 +2,9 @@
 from pathlib import Path
 import logging
 
+# Local Application Imports
+from .cache_manager import get_cache_manager
+
 # Initialize Logger
 logger = logging.getLogger(__name__)
 
@@ -54,4 +57,7 @@ def initialize_directories():
     cache_dir.mkdir(parents=True, exist_ok=True)
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    # Keep the cache within its size budget in the background (if one is configured)
+    get_cache_manager(cache_dir).start()
+
     return project_root, cache_dir, output_dir
@@ -1,3 +1,8 @@
-from .extract_lyrics import transcribe_audio_lyrics
+from .extract_lyrics import (
+    transcribe_audio_lyrics,
+    TranscriptionService,
+    warm_up_whisper_model,
+    get_available_model_sizes,
+)
 from .search_lyrics import fetch_and_save_lyrics
 from .modify_lyrics import perform_lyric_enhancement
\ No newline at end of file
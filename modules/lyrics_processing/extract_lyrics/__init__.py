@@ -1 +1,3 @@
-from .process import transcribe_audio_lyrics
\ No newline at end of file
+from .process import transcribe_audio_lyrics, warm_up_whisper_model, load_transcription_stats
+from .service import TranscriptionService
+from .config import get_available_model_sizes
\ No newline at end of file
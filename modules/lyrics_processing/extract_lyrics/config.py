@@ -1,6 +1,40 @@
+# Standard Library Imports
+import os
+
 # Third-Party Imports
 import torch
 
 DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
 COMPUTE_TYPE = "float16" if DEVICE == "cuda" else "int8"
-MODEL_SIZE = "large-v2"
\ No newline at end of file
+MODEL_SIZE = "large-v2"
+
+# Whisper model sizes that can be selected per transcription job
+MODEL_SIZES = ["tiny", "base", "small", "medium", "large-v2", "large-v3"]
+
+# Voice activity detection: only the voiced regions of the vocals stem are decoded
+VAD_FILTER = os.getenv("WHISPER_VAD_FILTER", "1").lower() in ("1", "true", "yes")
+VAD_THRESHOLD = float(os.getenv("WHISPER_VAD_THRESHOLD", 0.5))                    # Speech probability threshold
+VAD_MIN_SILENCE_MS = int(os.getenv("WHISPER_VAD_MIN_SILENCE_MS", 1000))          # Shorter pauses do not split regions
+VAD_SPEECH_PAD_MS = int(os.getenv("WHISPER_VAD_SPEECH_PAD_MS", 400))             # Padding kept around each region
+
+# Decoding mode: "full" decodes the whole song with the selected settings; "adaptive" decodes
+# with cheap settings first and re-decodes only the weak segments with the selected settings
+DECODE_MODES = ["full", "adaptive"]
+DECODE_MODE = os.getenv("WHISPER_DECODE_MODE", "full")
+ADAPTIVE_FAST_BEAM_SIZE = int(os.getenv("WHISPER_FAST_BEAM_SIZE", 2))          # Beam size of the first pass
+ADAPTIVE_FAST_MODEL_SIZE = os.getenv("WHISPER_FAST_MODEL_SIZE")                 # Model of the first pass (default: same)
+ADAPTIVE_MIN_WORD_PROBABILITY = float(os.getenv("WHISPER_MIN_WORD_PROBABILITY", 0.6))  # Mean word probability
+ADAPTIVE_MAX_COMPRESSION_RATIO = float(os.getenv("WHISPER_MAX_COMPRESSION_RATIO", 2.4)) # Above it, text is repetitive
+ADAPTIVE_MIN_AVG_LOGPROB = float(os.getenv("WHISPER_MIN_AVG_LOGPROB", -1.0))    # Mean token log probability
+
+# Songs transcribed concurrently by the transcription service, sharing one model
+TRANSCRIPTION_WORKERS = int(os.getenv("WHISPER_NUM_WORKERS", 1))
+
+# Maximum number of Whisper models kept loaded in memory at the same time (adaptive decoding
+# with a separate first-pass model needs both resident)
+MAX_LOADED_MODELS = int(os.getenv("WHISPER_MAX_LOADED_MODELS", 2 if ADAPTIVE_FAST_MODEL_SIZE else 1))
+
+
+def get_available_model_sizes():
+    """Retrieve the Whisper model sizes that can be selected for transcription."""
+    return list(MODEL_SIZES)
@@ -1,22 +1,102 @@
 # Standard Imports
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 import logging
 
-# Third-Party Imports
-from faster_whisper import WhisperModel
-
 # Local Application Imports
-from .config import MODEL_SIZE, DEVICE, COMPUTE_TYPE
-from interface.helpers import get_available_languages
-
-# Initialize Whisper model globally to avoid reloading it multiple times
-MODEL = WhisperModel(MODEL_SIZE, device=DEVICE, compute_type=COMPUTE_TYPE)
+from .config import (
+    MODEL_SIZE,
+    DEVICE,
+    COMPUTE_TYPE,
+    VAD_FILTER,
+    VAD_THRESHOLD,
+    VAD_MIN_SILENCE_MS,
+    VAD_SPEECH_PAD_MS,
+    DECODE_MODE,
+    DECODE_MODES,
+    ADAPTIVE_FAST_BEAM_SIZE,
+    ADAPTIVE_FAST_MODEL_SIZE,
+    ADAPTIVE_MIN_WORD_PROBABILITY,
+    ADAPTIVE_MAX_COMPRESSION_RATIO,
+    ADAPTIVE_MIN_AVG_LOGPROB,
+)
+from .model_registry import MODEL_REGISTRY
 
 # Initialize Logger
 logger = logging.getLogger(__name__)
 
-def _extract_lyrics_with_timing(
+
+def _segment_to_verse(segment):
+    """
+    Converts a decoded Whisper segment into a verse and its decoding statistics.
+
+    Returns:
+        tuple: (verse dict with start, end and words, statistics dict with the segment's
+        avg_logprob, no_speech_prob, compression_ratio and per-word probabilities).
+    """
+    # Create metadata for each word in the segment
+    words_metadata = []
+    probabilities = []
+
+    for word in segment.words:
+        word_data = {
+            "word": word.word.strip(),
+            "start": round(word.start, 2),
+            "end": round(word.end, 2),
+        }
+        words_metadata.append(word_data)
+        probabilities.append(round(word.probability, 3))
+
+    # Create the verse-level metadata dictionary
+    verse = {
+        "start": round(segment.start, 2),       # Start time of the verse
+        "end": round(segment.end, 2),           # End time of the verse
+        "words": words_metadata       # Word-level metadata
+    }
+    stats = {
+        "avg_logprob": round(segment.avg_logprob, 3),
+        "no_speech_prob": round(segment.no_speech_prob, 3),
+        "compression_ratio": round(segment.compression_ratio, 3),
+        "probabilities": probabilities,
+    }
+    return verse, stats
+
+
+def _is_weak_segment(stats):
+    """Whether a first-pass segment should be re-decoded with the expensive settings."""
+    probabilities = stats["probabilities"]
+    mean_probability = sum(probabilities) / len(probabilities) if probabilities else 0.0
+    return (
+        mean_probability < ADAPTIVE_MIN_WORD_PROBABILITY
+        or stats["compression_ratio"] > ADAPTIVE_MAX_COMPRESSION_RATIO
+        or stats["avg_logprob"] < ADAPTIVE_MIN_AVG_LOGPROB
+    )
+
+
+def _mean_word_probability(entries):
+    """Mean word probability over the (verse, statistics) entries of a decoded span."""
+    probabilities = [probability for _, stats in entries for probability in stats["probabilities"]]
+    return sum(probabilities) / len(probabilities) if probabilities else 0.0
+
+
+def _speech_clips(audio, sampling_rate, start_time, vad_parameters):
+    """
+    Returns the voiced regions of the audio after `start_time` as flat clip timestamps.
+
+    faster-whisper ignores the VAD filter when clip timestamps are given, so a resumed
+    run detects the voiced regions itself and decodes only the ones that remain.
+    """
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+    clips = []
+    for chunk in get_speech_timestamps(audio, VadOptions(**vad_parameters), sampling_rate=sampling_rate):
+        start, end = chunk["start"] / sampling_rate, chunk["end"] / sampling_rate
+        if end > start_time:
+            clips.extend([round(max(start, start_time), 3), round(end, 3)])
+    return clips
+
+
+def _iter_lyrics_with_timing(
         audio_path: Union[str, Path],
         beam_size_input: int = 15,
         best_of_input: int = 5,
@@ -24,67 +104,208 @@ def _extract_lyrics_with_timing(
         condition_toggle: bool = False,
         compression_threshold_input: float = 1.3,
         temperature_input: float = 0.0,
-        language_option: str = "Auto Detect"
+        language_option: str = "Auto Detect",
+        model_size: str = MODEL_SIZE,
+        device: str = DEVICE,
+        compute_type: str = COMPUTE_TYPE,
+        start_time: float = 0.0,
+        vad_filter: bool = VAD_FILTER,
+        vad_threshold: float = VAD_THRESHOLD,
+        vad_min_silence_ms: int = VAD_MIN_SILENCE_MS,
+        vad_speech_pad_ms: int = VAD_SPEECH_PAD_MS,
+        num_workers: int = 1,
+        cpu_threads: int = 0,
+        decode_mode: str = DECODE_MODE,
+        fast_model_size: Optional[str] = ADAPTIVE_FAST_MODEL_SIZE,
     ):
     """
-    Extracts and groups lyrics into verses with timing and word details.
+    Transcribes the audio and yields each verse as soon as its segment is decoded.
+
+    In "adaptive" decode mode, the song is first decoded with cheap settings (a small
+    beam, and optionally the smaller `fast_model_size`). Segments whose mean word
+    probability, compression ratio or average log probability fail the `WHISPER_*`
+    thresholds are decoded again with the selected settings, and the pass with the higher
+    mean word probability is kept.
 
     Args:
         audio_path (str): Path to the audio file.
+        model_size (str): Whisper model size to transcribe with. Loaded on first use.
+        device (str): Device to run the Whisper model on.
+        compute_type (str): CTranslate2 compute type for the Whisper model.
+        start_time (float): Time in seconds to start decoding from (to resume a partial run).
+        vad_filter (bool): Only decode the voiced regions of the audio (intros, solos and
+            outros are skipped). Timestamps stay on the original timeline.
+        vad_threshold (float): Speech probability above which audio counts as voiced.
+        vad_min_silence_ms (int): Minimum silence in milliseconds that separates two regions.
+        vad_speech_pad_ms (int): Padding in milliseconds kept around each voiced region.
+        num_workers (int): Parallel transcriptions the shared model is loaded for.
+        cpu_threads (int): CPU threads per model worker (0 for the CPU cores split between the workers).
+        decode_mode (str): "full" or "adaptive" (see above).
+        fast_model_size (Optional[str]): Model size of the adaptive first pass (default: `model_size`).
 
-    Returns:
-        list[dict]: List of verses with text and metadata.
+    Yields:
+        tuple: (verse with start and end times and word details, decoding statistics).
     """
+    if decode_mode not in DECODE_MODES:
+        raise ValueError(f"Unknown decode mode '{decode_mode}'. Expected one of {DECODE_MODES}.")
+
     # If the user chooses Auto Detect, we let Whisper decide (or pass None)
     if language_option == "Auto Detect":
         lang = None
     else:
+        # Imported here so headless runs do not load the UI helpers at import time
+        from interface.helpers import get_available_languages
         available_langs = get_available_languages()
         lang = available_langs.get(language_option, None)
 
-    # Transcribe the audio and extract word-level timestamps
-    segments, info = MODEL.transcribe(
-        audio_path,
+    # Get the requested Whisper model from the shared registry (loaded on first use)
+    model = MODEL_REGISTRY.get_model(model_size, device, compute_type, num_workers, cpu_threads)
+
+    # Decoding settings shared by every pass
+    options = dict(
         word_timestamps=True,              # Extract word-level timestamps
-        beam_size=int(beam_size_input),    # Increase beam search for better word accuracy
-        best_of=int(best_of_input),        # Pick the best transcription from multiple runs
-        patience=patience_input,           # Allow more time before closing segments
         condition_on_previous_text=condition_toggle,             # Ensure no contextual bias from previous words
         compression_ratio_threshold=compression_threshold_input, # Force Whisper to retain more words
         temperature=temperature_input,       # Eliminate randomness in transcription
-        language=lang                       # Language code for transcription
+        language=lang,                      # Language code for transcription
+    )
+    full_quality = dict(
+        beam_size=int(beam_size_input),    # Increase beam search for better word accuracy
+        best_of=int(best_of_input),        # Pick the best transcription from multiple runs
+        patience=patience_input,           # Allow more time before closing segments
+    )
+    vad_options = dict(
+        vad_filter=vad_filter,              # Skip instrumental gaps of the vocals stem
+        vad_parameters={
+            "threshold": vad_threshold,
+            "min_silence_duration_ms": vad_min_silence_ms,
+            "speech_pad_ms": vad_speech_pad_ms,
+        },
     )
 
-    logger.debug(f"Transcription of the vocals audio segments completed.")
+    # Decode the audio up front when it is needed here (adaptive passes, resumes with VAD)
+    audio = audio_path
+    sampling_rate = model.feature_extractor.sampling_rate
+    if decode_mode == "adaptive" or (start_time and vad_filter):
+        from faster_whisper import decode_audio
+        audio = decode_audio(str(audio_path), sampling_rate=sampling_rate)
 
-    # Initialize an empty list to hold the processed verses
-    verses = []
+    # When resuming, skip the part of the audio that was already transcribed. Clip timestamps
+    # disable faster-whisper's VAD filter, so with VAD on only the voiced regions left are clipped
+    resume_options = {}
+    if start_time:
+        clips = [start_time]
+        if vad_filter:
+            clips = _speech_clips(audio, sampling_rate, start_time, vad_options["vad_parameters"])
+            if not clips:
+                logger.info(f"No voiced audio left after {start_time}s.")
+                return
+        resume_options = {"clip_timestamps": clips}
 
-    # Process each segment into a structured verse
-    logger.debug(f"Formatting segments into verses with words, timing, and predictions using the Whisper model.")
+    if decode_mode == "full":
+        # Transcribe the audio and extract word-level timestamps (segments are decoded lazily)
+        segments, info = model.transcribe(audio, **options, **full_quality, **vad_options, **resume_options)
+
+        # Process each segment into a structured verse as it is decoded
+        logger.debug(f"Formatting segments into verses with words, timing, and predictions using the Whisper model.")
+        for segment in segments:
+            yield _segment_to_verse(segment)
+        return
+
+    # Adaptive mode: the decoded audio is shared by both passes (the models are held here
+    # so the registry bound cannot unload one between passes)
+    fast_model = model
+    if fast_model_size and fast_model_size != model_size:
+        if MODEL_REGISTRY.max_models < 2:
+            raise ValueError(
+                f"Adaptive decoding with the fast model '{fast_model_size}' needs two resident Whisper models, "
+                f"but WHISPER_MAX_LOADED_MODELS is {MODEL_REGISTRY.max_models}."
+            )
+        fast_model = MODEL_REGISTRY.get_model(fast_model_size, device, compute_type, num_workers, cpu_threads)
+
+    segments, info = fast_model.transcribe(
+        audio,
+        **options,
+        beam_size=min(ADAPTIVE_FAST_BEAM_SIZE, int(beam_size_input)),
+        best_of=1,
+        patience=1.0,
+        **vad_options,
+        **resume_options,
+    )
+
+    # Clips are too short to detect the language reliably, so retries reuse the song's
+    retry_options = dict(options, language=info.language)
+
+    redecoded = improved = total = 0
     for segment in segments:
+        total += 1
+        verse, stats = _segment_to_verse(segment)
+        if not _is_weak_segment(stats):
+            yield verse, stats
+            continue
 
-        # Create metadata for each word in the segment
-        words_metadata = []
-
-        for word in segment.words:
-            word_data = {
-                "word": word.word.strip(),
-                "start": round(word.start, 2),
-                "end": round(word.end, 2),
-                # "probability": round(word.probability, 2)
-            }
-            words_metadata.append(word_data)
-
-        # Create the verse-level metadata dictionary
-        verse_data = {
-            "start": round(segment.start, 2),       # Start time of the verse
-            "end": round(segment.end, 2),           # End time of the verse
-            "words": words_metadata       # Word-level metadata
-        }
+        # Decode only this segment again with the expensive settings and keep the better pass
+        redecoded += 1
+        retry_segments, _ = model.transcribe(
+            audio, **retry_options, **full_quality, clip_timestamps=[segment.start, segment.end]
+        )
+        retried = [_segment_to_verse(retry_segment) for retry_segment in retry_segments]
+        if retried and _mean_word_probability(retried) > _mean_word_probability([(verse, stats)]):
+            improved += 1
+            yield from retried
+        else:
+            yield verse, stats
+
+    logger.info(
+        f"Adaptive decoding re-decoded {redecoded}/{total} segments with the full settings "
+        f"({improved} improved)."
+    )
+
+
+def _extract_lyrics_with_timing(
+        audio_path: Union[str, Path],
+        beam_size_input: int = 15,
+        best_of_input: int = 5,
+        patience_input: float = 3.0,
+        condition_toggle: bool = False,
+        compression_threshold_input: float = 1.3,
+        temperature_input: float = 0.0,
+        language_option: str = "Auto Detect",
+        model_size: str = MODEL_SIZE,
+        device: str = DEVICE,
+        compute_type: str = COMPUTE_TYPE,
+        vad_filter: bool = VAD_FILTER,
+        decode_mode: str = DECODE_MODE,
+    ):
+    """
+    Extracts and groups lyrics into verses with timing and word details.
+
+    Args:
+        audio_path (str): Path to the audio file.
+        model_size (str): Whisper model size to transcribe with. Loaded on first use.
+        device (str): Device to run the Whisper model on.
+        compute_type (str): CTranslate2 compute type for the Whisper model.
+        vad_filter (bool): Only decode the voiced regions of the audio.
+        decode_mode (str): "full" or "adaptive" (see `_iter_lyrics_with_timing`).
 
-        # Append the verse metadata to the list of verses
-        verses.append(verse_data)
+    Returns:
+        list[dict]: List of verses with text and metadata.
+    """
+    verses = [verse for verse, _ in _iter_lyrics_with_timing(
+        audio_path,
+        beam_size_input,
+        best_of_input,
+        patience_input,
+        condition_toggle,
+        compression_threshold_input,
+        temperature_input,
+        language_option,
+        model_size=model_size,
+        device=device,
+        compute_type=compute_type,
+        vad_filter=vad_filter,
+        decode_mode=decode_mode,
+    )]
 
     logger.debug(f"Transcribed {len(verses)} verses with words, timing, and predictions using the Whisper model.")
     return verses
@@ -0,0 +1,106 @@
+# Standard Library Imports
+from collections import OrderedDict
+import threading
+import logging
+import os
+
+# Local Application Imports
+from .config import MODEL_SIZE, DEVICE, COMPUTE_TYPE, MAX_LOADED_MODELS
+
+# Initialize Logger
+logger = logging.getLogger(__name__)
+
+
+def _effective_cpu_threads(num_workers: int, cpu_threads: int = 0) -> int:
+    """CPU threads per model worker: the requested count, or the CPU cores split between the workers."""
+    return cpu_threads or max(1, (os.cpu_count() or 1) // max(1, num_workers))
+
+
+class WhisperModelRegistry:
+    """
+    Process-wide registry of Whisper models that are loaded on first use.
+
+    Models are keyed by (size, device, compute_type, num_workers, cpu_threads) and kept
+    in least-recently-used order. When more than `max_models` are resident, the least recently used model is
+    released so memory is only spent on the models that jobs actually ask for.
+    """
+
+    def __init__(self, max_models: int = MAX_LOADED_MODELS):
+        self.max_models = max(1, int(max_models))
+        self._models = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_model(
+        self,
+        model_size: str = MODEL_SIZE,
+        device: str = DEVICE,
+        compute_type: str = COMPUTE_TYPE,
+        num_workers: int = 1,
+        cpu_threads: int = 0,
+    ):
+        """
+        Return a loaded Whisper model, loading it on first use.
+
+        Args:
+            model_size (str): Whisper model size (e.g. "large-v2", "small").
+            device (str): Device to run the model on ("cuda" or "cpu").
+            compute_type (str): CTranslate2 compute type (e.g. "float16", "int8").
+            num_workers (int): Number of transcriptions the model can run in parallel
+                (from different threads).
+            cpu_threads (int): CPU threads per worker (0 for the CPU cores split between the workers).
+
+        Returns:
+            WhisperModel: The loaded model.
+        """
+        # Resolve the default thread count first so equivalent requests share one model
+        cpu_threads = _effective_cpu_threads(num_workers, cpu_threads)
+        key = (model_size, device, compute_type, num_workers, cpu_threads)
+
+        # Loading is serialized so concurrent jobs never load the same model twice
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                return self._models[key]
+
+            # Import lazily so importing the package does not pull in CTranslate2
+            from faster_whisper import WhisperModel
+
+            logger.info(f"Loading Whisper model '{model_size}' on {device} ({compute_type}, {num_workers} workers)...")
+            model = WhisperModel(
+                model_size,
+                device=device,
+                compute_type=compute_type,
+                num_workers=num_workers,
+                cpu_threads=cpu_threads,
+            )
+            self._models[key] = model
+
+            # Release the least recently used models beyond the residency bound
+            while len(self._models) > self.max_models:
+                evicted_key, _ = self._models.popitem(last=False)
+                logger.info(f"Unloaded Whisper model '{evicted_key[0]}' ({evicted_key[1]}, {evicted_key[2]}).")
+
+            return model
+
+    def warm_up(
+        self,
+        model_size: str = MODEL_SIZE,
+        device: str = DEVICE,
+        compute_type: str = COMPUTE_TYPE,
+    ):
+        """Load a model ahead of time so the first transcription does not pay the load cost."""
+        self.get_model(model_size, device, compute_type)
+
+    def loaded_models(self):
+        """Return the keys of the currently resident models, least recently used first."""
+        with self._lock:
+            return list(self._models.keys())
+
+    def clear(self):
+        """Release every loaded model."""
+        with self._lock:
+            self._models.clear()
+
+
+# Shared registry used by every transcription job in the process
+MODEL_REGISTRY = WhisperModelRegistry()
@@ -1,16 +1,120 @@
 # Standard Library Imports
 from pathlib import Path
-from typing import Union
+from typing import Callable, Optional, Union
 import logging
 import json
+import os
 
 # Local Application Imports
-from .main import _extract_lyrics_with_timing
+from .config import (
+    MODEL_SIZE,
+    VAD_FILTER,
+    VAD_THRESHOLD,
+    VAD_MIN_SILENCE_MS,
+    VAD_SPEECH_PAD_MS,
+    DECODE_MODE,
+    ADAPTIVE_FAST_BEAM_SIZE,
+    ADAPTIVE_FAST_MODEL_SIZE,
+    ADAPTIVE_MIN_WORD_PROBABILITY,
+    ADAPTIVE_MAX_COMPRESSION_RATIO,
+    ADAPTIVE_MIN_AVG_LOGPROB,
+)
+from .main import _iter_lyrics_with_timing
+from .model_registry import MODEL_REGISTRY
+from ...utilities import find_audio_artifact
+from ...cache_manifest import compute_cache_key, restore_artifacts, record_artifacts
 
 # Initialize Logger
 logger = logging.getLogger(__name__)
 
 
+def _checkpoint_file(output_file: Path) -> Path:
+    """Path of the JSON Lines checkpoint written while `output_file` is transcribed."""
+    return output_file.with_name(f"{output_file.stem}.partial.jsonl")
+
+
+def _stats_file(output_file: Path) -> Path:
+    """Path of the decoding statistics sidecar of `output_file`."""
+    return output_file.with_name(f"{output_file.stem}.stats.json")
+
+
+def _load_checkpoint(checkpoint_file: Path, cache_key: str) -> list:
+    """
+    Load the verses of an interrupted transcription with the same cache key.
+
+    The checkpoint starts with a header line holding the cache key, followed by one
+    [verse, statistics] pair per line. A truncated last line (from a crash mid-write)
+    is ignored.
+
+    Returns:
+        list: (verse, statistics) tuples.
+    """
+    if not checkpoint_file.exists():
+        return []
+
+    entries = []
+    with open(checkpoint_file, "r", encoding="utf-8") as f:
+        try:
+            if json.loads(f.readline()).get("cache_key") != cache_key:
+                return []
+        except (json.JSONDecodeError, AttributeError):
+            return []
+
+        for line in f:
+            try:
+                verse, stats = json.loads(line)
+            except (json.JSONDecodeError, ValueError, TypeError):
+                break
+            entries.append((verse, stats))
+    return entries
+
+
+def _columnar_stats(entries: list) -> dict:
+    """
+    Packs the per-segment decoding statistics into per-word and per-segment arrays.
+
+    Word arrays are in the order of the words in the lyrics file (verse by verse), and
+    `segments.word_offset` is the index of each verse's first word in them.
+    """
+    words = {"verse": [], "start": [], "end": [], "probability": []}
+    segments = {"start": [], "end": [], "avg_logprob": [], "no_speech_prob": [], "compression_ratio": [], "word_offset": []}
+
+    for verse_index, (verse, stats) in enumerate(entries):
+        segments["word_offset"].append(len(words["verse"]))
+        segments["start"].append(verse["start"])
+        segments["end"].append(verse["end"])
+        for key in ("avg_logprob", "no_speech_prob", "compression_ratio"):
+            segments[key].append(stats[key])
+
+        for word, probability in zip(verse["words"], stats["probabilities"]):
+            words["verse"].append(verse_index)
+            words["start"].append(word["start"])
+            words["end"].append(word["end"])
+            words["probability"].append(probability)
+
+    return {"version": 1, "words": words, "segments": segments}
+
+
+def load_transcription_stats(working_dir: Union[str, Path], file_name: str = "raw_lyrics.json") -> Optional[dict]:
+    """
+    Load the decoding statistics saved next to a transcription.
+
+    The sidecar (`raw_lyrics.stats.json`) holds compact per-word arrays (`verse`, `start`,
+    `end`, `probability`) and per-segment arrays (`start`, `end`, `avg_logprob`,
+    `no_speech_prob`, `compression_ratio`, `word_offset`), so later stages can target
+    only the weakly recognized parts of a song.
+
+    Returns:
+        Optional[dict]: The statistics, or None if the transcription has none (e.g. it
+        was made before statistics were saved).
+    """
+    stats_file = _stats_file(Path(working_dir) / file_name)
+    if not stats_file.exists():
+        return None
+    with open(stats_file, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 def transcribe_audio_lyrics(
     working_dir: Union[str, Path],
     override: bool = False,
@@ -21,40 +125,145 @@ def transcribe_audio_lyrics(
     compression_threshold_input: float = 1.3,
     temperature_input: float = 0.0,
     language_option: str = "Auto Detect",
-    file_name: str = "raw_lyrics.json"
+    file_name: str = "raw_lyrics.json",
+    model_size: str = MODEL_SIZE,
+    on_verse: Optional[Callable[[list], None]] = None,
+    vad_filter: bool = VAD_FILTER,
+    num_workers: int = 1,
+    cpu_threads: int = 0,
+    decode_mode: str = DECODE_MODE,
 ):
-    # Check if the lyrics file already exists in the output directory and
-    # skip the extraction if the override flag is not set
+    """
+    Transcribes the vocals of a working directory into `raw_lyrics.json`.
+
+    Word probabilities and segment statistics are saved in a sidecar next to it
+    (`raw_lyrics.stats.json`, see `load_transcription_stats`).
+
+    Verses are appended to a checkpoint file (`raw_lyrics.partial.jsonl`) as soon as they
+    are decoded. If a run is interrupted, the next run with the same vocals and settings
+    resumes after the last written verse instead of starting over (unless `override` is set).
+    The checkpoint is replaced by the JSON file once the transcription completes.
+
+    Args:
+        on_verse (Optional[Callable[[list], None]]): Called with the verses transcribed so
+            far every time a verse is decoded (e.g. to show live progress).
+        vad_filter (bool): Only decode the voiced regions of the vocals, with the thresholds
+            from `WHISPER_VAD_*` (see config).
+        num_workers (int): Parallel transcriptions the shared Whisper model is loaded for
+            (see `TranscriptionService`).
+        cpu_threads (int): CPU threads per model worker (0 for the CPU cores split between the workers).
+        decode_mode (str): "full" to decode the whole song with the given settings, or
+            "adaptive" to decode with cheap settings first and re-decode only the weak
+            segments with the given settings (thresholds from `WHISPER_*`, see config).
+
+    Returns:
+        Path: Path to the raw lyrics file.
+    """
+    # Check if the vocals file exists (in any intermediate format). If not, raise an error.
+    input_vocals = find_audio_artifact(working_dir, "vocals")
+    if input_vocals is None:
+        raise FileNotFoundError(f"Vocals file not found in: {working_dir}")
+
+    # Check if the lyrics were already transcribed from these vocals with the same decoding
+    # settings and skip the extraction if the override flag is not set
     output_file = Path(working_dir) / file_name
-    if output_file.exists() and not override:
+    cache_key = compute_cache_key(
+        working_dir,
+        "transcription",
+        params={
+            "file_name": file_name,
+            "beam_size": beam_size_input,
+            "best_of": best_of_input,
+            "patience": patience_input,
+            "condition_on_previous_text": condition_toggle,
+            "compression_ratio_threshold": compression_threshold_input,
+            "temperature": temperature_input,
+            "language": language_option,
+            "model_size": model_size,
+            "vad": [VAD_THRESHOLD, VAD_MIN_SILENCE_MS, VAD_SPEECH_PAD_MS] if vad_filter else None,
+            "adaptive": [
+                ADAPTIVE_FAST_BEAM_SIZE,
+                ADAPTIVE_FAST_MODEL_SIZE,
+                ADAPTIVE_MIN_WORD_PROBABILITY,
+                ADAPTIVE_MAX_COMPRESSION_RATIO,
+                ADAPTIVE_MIN_AVG_LOGPROB,
+            ] if decode_mode == "adaptive" else None,
+        },
+        inputs=[input_vocals],
+    )
+    if restore_artifacts(working_dir, "transcription", cache_key, override=override):
         logger.info(
             "Skipping lyric extraction... Lyrics raw data already exist in the output directory...")
         return output_file
 
-    # Check if the vocals file exists. If not, raise an error.
-    input_vocals = Path(working_dir) / "vocals.mp3"
-    if not Path(input_vocals).exists():
-        raise FileNotFoundError(f"Vocals file not found: {input_vocals}")
-
     try:
-        logger.info("Transcribing raw lyrics from the vocals audio using Whisper model...")
-        # Extract lyrics metadata from the vocals stem
-        lyrics_metadata = _extract_lyrics_with_timing(
-            input_vocals,
-            beam_size_input,
-            best_of_input,
-            patience_input,
-            condition_toggle,
-            compression_threshold_input,
-            temperature_input,
-            language_option
-        )
+        # Resume an interrupted transcription of the same vocals with the same settings
+        checkpoint_file = _checkpoint_file(output_file)
+        entries = [] if override else _load_checkpoint(checkpoint_file, cache_key)
+        lyrics_metadata = [verse for verse, _ in entries]
+        resume_from = lyrics_metadata[-1]["end"] if lyrics_metadata else 0.0
+
+        if lyrics_metadata:
+            logger.info(f"Resuming transcription after {len(lyrics_metadata)} verses (at {resume_from}s)...")
+            if on_verse is not None:
+                on_verse(list(lyrics_metadata))
+        else:
+            logger.info(f"Transcribing raw lyrics from the vocals audio using Whisper model '{model_size}'...")
+
+        # Rewrite the checkpoint with the kept verses, then append each new verse as it is decoded
+        with open(checkpoint_file, "w", encoding="utf-8") as checkpoint:
+            checkpoint.write(json.dumps({"cache_key": cache_key}) + "\n")
+            for entry in entries:
+                checkpoint.write(json.dumps(entry) + "\n")
+            checkpoint.flush()
+
+            # Extract lyrics metadata from the vocals stem
+            for verse, stats in _iter_lyrics_with_timing(
+                input_vocals,
+                beam_size_input,
+                best_of_input,
+                patience_input,
+                condition_toggle,
+                compression_threshold_input,
+                temperature_input,
+                language_option,
+                model_size=model_size,
+                start_time=resume_from,
+                vad_filter=vad_filter,
+                num_workers=num_workers,
+                cpu_threads=cpu_threads,
+                decode_mode=decode_mode,
+            ):
+                entries.append((verse, stats))
+                lyrics_metadata.append(verse)
+                checkpoint.write(json.dumps([verse, stats]) + "\n")
+                checkpoint.flush()
+                if on_verse is not None:
+                    on_verse(list(lyrics_metadata))
 
         # Save lyrics raw metadata to a JSON file
         with open(output_file, "w") as f:
             json.dump(lyrics_metadata, f, indent=4)
+
+        # Save the word confidences and segment statistics next to it
+        stats_file = _stats_file(output_file)
+        with open(stats_file, "w", encoding="utf-8") as f:
+            json.dump(_columnar_stats(entries), f, separators=(",", ":"))
+
+        os.remove(checkpoint_file)
+        record_artifacts(working_dir, "transcription", cache_key, [output_file, stats_file])
         logger.info(f"Transcribed vocals extracted successfully to: {output_file}")
         return output_file
 
     except Exception as e:
         raise RuntimeError(f"Error in extracting lyrics: {e}")
+
+
+def warm_up_whisper_model(model_size: str = MODEL_SIZE):
+    """Load a Whisper model into the shared registry ahead of the first transcription."""
+    try:
+        MODEL_REGISTRY.warm_up(model_size)
+        logger.info(f"Whisper model '{model_size}' loaded and ready.")
+
+    except Exception as e:
+        logger.warning(f"Whisper model warm-up failed: {e}")
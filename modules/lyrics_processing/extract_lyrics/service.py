@@ -0,0 +1,78 @@
+# Standard Library Imports
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Optional, Union
+import logging
+
+# Local Application Imports
+from .config import TRANSCRIPTION_WORKERS
+from .process import transcribe_audio_lyrics
+from .model_registry import _effective_cpu_threads
+
+# Initialize Logger
+logger = logging.getLogger(__name__)
+
+
+class TranscriptionService:
+    """
+    Transcribes the vocals of several songs concurrently with one shared Whisper model.
+
+    The model is loaded once with `workers` CTranslate2 workers, so up to `workers`
+    songs are decoded in parallel from a thread pool. The CPU cores are split between
+    the workers (`cpu_threads` each) instead of every song competing for all of them.
+    Results are the usual `raw_lyrics.json` files, with the same caching and resuming
+    as `transcribe_audio_lyrics`.
+    """
+
+    def __init__(self, workers: int = TRANSCRIPTION_WORKERS, cpu_threads: Optional[int] = None):
+        self.workers = max(1, int(workers))
+        self.cpu_threads = _effective_cpu_threads(self.workers, cpu_threads or 0)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="transcription")
+        logger.info(f"Transcription service: {self.workers} workers with {self.cpu_threads} CPU threads each.")
+
+    def submit(self, working_dir: Union[str, Path], **options) -> Future:
+        """
+        Queue the transcription of a working directory's vocals.
+
+        Args:
+            working_dir (Union[str, Path]): Working directory holding the vocals stem.
+            **options: Keyword arguments for `transcribe_audio_lyrics`.
+
+        Returns:
+            Future: Resolves to the path of the raw lyrics file.
+        """
+        return self._executor.submit(
+            transcribe_audio_lyrics,
+            working_dir,
+            num_workers=self.workers,
+            cpu_threads=self.cpu_threads,
+            **options,
+        )
+
+    def transcribe_many(self, working_dirs: Iterable[Union[str, Path]], **options) -> dict:
+        """
+        Transcribe several working directories and wait for all of them.
+
+        Returns:
+            dict: Mapping of working directory to the raw lyrics path, or to the exception
+            raised for that song.
+        """
+        futures = {working_dir: self.submit(working_dir, **options) for working_dir in working_dirs}
+        results = {}
+        for working_dir, future in futures.items():
+            try:
+                results[working_dir] = future.result()
+            except Exception as e:
+                logger.error(f"Transcription failed for {working_dir}: {e}")
+                results[working_dir] = e
+        return results
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting songs and, with `wait`, finish the queued ones."""
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
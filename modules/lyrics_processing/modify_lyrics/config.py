@@ -12,6 +12,33 @@ load_dotenv()
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 GEMENI_MODEL = "gemini-1.5-flash"
 
+# Chunked alignment settings
+GEMINI_CHUNK_SIZE = int(os.getenv("GEMINI_CHUNK_SIZE", 50))                        # Raw words per prompt
+GEMINI_CONCURRENCY = int(os.getenv("GEMINI_CONCURRENCY", 1))                       # Chunks in flight (1 = sequential)
+GEMINI_MIN_REQUEST_INTERVAL = float(os.getenv("GEMINI_MIN_REQUEST_INTERVAL", 0.5)) # Seconds between request starts
+GEMINI_REFERENCE_MARGIN = float(os.getenv("GEMINI_REFERENCE_MARGIN", 0.5))         # Extra reference context, in chunks
+
+# Response cache settings (validated alignments keyed on model and prompt)
+GEMINI_CACHE_FILE = "gemini_cache.sqlite"                                          # Stored in the cache directory
+GEMINI_CACHE_DIR = os.getenv("GEMINI_CACHE_DIR")                                   # Overrides the cache directory
+GEMINI_CACHE_TTL = float(os.getenv("GEMINI_CACHE_TTL", 90 * 24 * 3600))            # Seconds before an entry expires
+GEMINI_CACHE_MAX_ENTRIES = int(os.getenv("GEMINI_CACHE_MAX_ENTRIES", 50000))       # Least recently used entries beyond are dropped
+GEMINI_CACHE_BYPASS = os.getenv("GEMINI_CACHE_BYPASS", "0").lower() in ("1", "true", "yes")
+
+# Lyrics aligner: "llm" (Gemini aligns every chunk), "hybrid" (local alignment, Gemini only
+# for low-confidence regions) or "local" (local alignment only, no network access)
+LYRICS_ALIGNERS = ["llm", "hybrid", "local"]
+LYRICS_ALIGNER = os.getenv("LYRICS_ALIGNER", "llm")
+
+# Local aligner settings
+LOCAL_ALIGNER_GAP_PENALTY = 0.5          # Score of leaving a raw or reference word unmatched
+LOCAL_ALIGNER_MATCH_THRESHOLD = 0.5      # Minimum token similarity to take the reference word
+LOCAL_ALIGNER_MIN_CONFIDENCE = float(os.getenv("LOCAL_ALIGNER_MIN_CONFIDENCE", 0.6))  # Below it, a word is weak
+LOCAL_ALIGNER_BAND = 40                  # Half-width of the alignment band around the anchors, in reference words
+LOCAL_ALIGNER_FULL_CELLS = 100000        # Alignments up to this many raw x reference words are not banded
+LOCAL_ALIGNER_ANCHOR_WORDS = (3, 1)      # Lengths of the word sequences unique to both lyrics used as anchors
+LOCAL_ALIGNER_CONTEXT_WORDS = 2          # Words of context added around a weak region sent to the LLM
+
 # Prompt components\
 PREFIX = """
 You are an AI tasked with aligning and correcting transcribed lyrics from a raw speech-to-text model by comparing them to the provided reference lyrics.
@@ -25,8 +25,18 @@ def generate_prompt(
     previous_chunk_last_verse,
     previous_chunk_end_time,
     correction_log,
-    expected_next_word
+    expected_next_word,
+    reference_verse_range=None
 ):
+    # Chunks aligned concurrently only see the reference verses around their position
+    reference_scope = ""
+    if reference_verse_range is not None:
+        reference_scope = f"""
+## REFERENCE SCOPE:
+- The corrected lyrics below are the **reference verses {reference_verse_range[0]} to {reference_verse_range[1]}**, the part of the song this chunk falls in.
+- Use these verse numbers as given; the chunk may start or end in the middle of a verse.
+"""
+
     PROMPT = f"""
 {PREFIX}
 
@@ -47,7 +57,7 @@ Processed Words: {processed_words} / {total_words}
 
 ## EXPECTED NEXT WORD:
 - The next expected word in the reference lyrics after this chunk is **"{expected_next_word}"**.
-
+{reference_scope}
 ## CORRECTION LOG (PREVIOUS CHUNKS):
 - The following words have already been corrected in earlier chunks **(showing last 10 corrections only for relevance):**
 {correction_log[-10:]}
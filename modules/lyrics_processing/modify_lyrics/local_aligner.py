@@ -0,0 +1,345 @@
+# Standard Library Imports
+from difflib import SequenceMatcher
+from collections import Counter
+from bisect import bisect_left
+from functools import lru_cache
+import unicodedata
+import logging
+import re
+
+# Local Application Imports
+from .config import (
+    WordAlignment,
+    LOCAL_ALIGNER_GAP_PENALTY,
+    LOCAL_ALIGNER_MATCH_THRESHOLD,
+    LOCAL_ALIGNER_MIN_CONFIDENCE,
+    LOCAL_ALIGNER_BAND,
+    LOCAL_ALIGNER_FULL_CELLS,
+    LOCAL_ALIGNER_ANCHOR_WORDS,
+    LOCAL_ALIGNER_CONTEXT_WORDS,
+)
+
+# Initialize Logger
+logger = logging.getLogger(__name__)
+
+# Traceback moves of the alignment matrix
+_DIAGONAL, _UP, _LEFT = 1, 2, 3
+
+# Spelling variants that sound alike, applied before building the phonetic key
+_PHONETIC_RULES = [
+    (re.compile(r"ph"), "f"),
+    (re.compile(r"ck|q|c(?=[aou])|c$"), "k"),
+    (re.compile(r"c"), "s"),
+    (re.compile(r"z"), "s"),
+    (re.compile(r"(?<=.)[aeiouyhw]"), ""),
+    (re.compile(r"(.)\1+"), r"\1"),
+]
+
+
+def _normalize_token(word):
+    """Lowercases a word and strips accents, punctuation and apostrophes."""
+    word = unicodedata.normalize("NFKD", word)
+    return "".join(char for char in word.lower() if char.isalnum())
+
+
+@lru_cache(maxsize=16384)
+def _phonetic_key(token):
+    """Reduces a normalized token to a rough consonant skeleton (e.g. "gonna" -> "gn")."""
+    for pattern, replacement in _PHONETIC_RULES:
+        token = pattern.sub(replacement, token)
+    return token
+
+
+@lru_cache(maxsize=16384)
+def _letter_counts(token):
+    """Counts the letters of a normalized token."""
+    return Counter(token)
+
+
+@lru_cache(maxsize=65536)
+def _token_similarity(first, second):
+    """
+    Scores how alike two normalized tokens are.
+
+    Cheap checks run first: pairs that cannot reach the match threshold, judged by their
+    lengths and shared letters, score 0.0 without a character comparison.
+
+    Returns:
+        float: 1.0 for identical tokens, at least 0.85 for tokens that sound alike,
+        otherwise the character similarity ratio (0.0 if either token is empty).
+    """
+    if not first or not second:
+        return 0.0
+    if first == second:
+        return 1.0
+
+    # Upper bounds of the ratio from the lengths, then from the shared letters
+    sounds_alike = _phonetic_key(first) == _phonetic_key(second)
+    if not sounds_alike:
+        minimum = LOCAL_ALIGNER_MATCH_THRESHOLD * (len(first) + len(second))
+        if 2 * min(len(first), len(second)) < minimum:
+            return 0.0
+        if 2 * sum((_letter_counts(first) & _letter_counts(second)).values()) < minimum:
+            return 0.0
+
+    score = SequenceMatcher(None, first, second).ratio()
+    return max(score, 0.85) if sounds_alike else score
+
+
+def _unique_sequences(tokens, size):
+    """Returns {word sequence: start index} for the `size`-word sequences occurring exactly once."""
+    sequences = [tuple(tokens[index:index + size]) for index in range(len(tokens) - size + 1)]
+    counts = Counter(sequences)
+    return {
+        sequence: index for index, sequence in enumerate(sequences)
+        if counts[sequence] == 1 and all(sequence)
+    }
+
+
+def _find_anchors(raw_tokens, reference_tokens, sizes=LOCAL_ALIGNER_ANCHOR_WORDS):
+    """
+    Pairs raw and reference tokens that certainly belong together.
+
+    Word sequences occurring exactly once in both lyrics are paired word by word, and
+    the longest chain of pairs in the same order in both lyrics is kept, so repeated
+    choruses or a stray match far off the path cannot pull the alignment aside.
+
+    Returns:
+        list: (raw index, reference index) pairs, increasing in both.
+    """
+    candidates = {}
+    for size in sizes:
+        reference_sequences = _unique_sequences(reference_tokens, size)
+        for sequence, raw_index in _unique_sequences(raw_tokens, size).items():
+            reference_index = reference_sequences.get(sequence)
+            if reference_index is not None:
+                for offset in range(size):
+                    candidates.setdefault(raw_index + offset, reference_index + offset)
+    pairs = sorted(candidates.items())
+
+    # Longest chain with increasing reference indices (raw indices already increase)
+    tails, tail_positions, parents = [], [], [None] * len(pairs)
+    for position, (_, reference_index) in enumerate(pairs):
+        slot = bisect_left(tails, reference_index)
+        parents[position] = tail_positions[slot - 1] if slot else None
+        if slot == len(tails):
+            tails.append(reference_index)
+            tail_positions.append(position)
+        else:
+            tails[slot], tail_positions[slot] = reference_index, position
+
+    chain, position = [], tail_positions[-1] if tail_positions else None
+    while position is not None:
+        chain.append(pairs[position])
+        position = parents[position]
+    return chain[::-1]
+
+
+def _band_limits(rows, columns, anchors, band):
+    """
+    Chooses the columns computed on each row of the alignment matrix.
+
+    The band follows the anchors: it is interpolated between consecutive anchors, widened
+    where the raw and reference words between them differ in count, and runs parallel to
+    the diagonal before the first and after the last anchor. Without anchors it falls back
+    to the proportional diagonal. Each row also covers the centers of its neighbours, so a
+    path can cross reference words skipped between two raw words.
+
+    Returns:
+        list: (low, high) column limits, inclusive, for rows 0 to `rows`.
+    """
+    if anchors:
+        # Token pair (i, j) is matrix cell (i + 1, j + 1)
+        cells = [(raw_index + 1, reference_index + 1) for raw_index, reference_index in anchors]
+        centers, widths = [0] * (rows + 1), [band] * (rows + 1)
+
+        first_row, first_column = cells[0]
+        for row in range(first_row):
+            centers[row] = first_column - (first_row - row)
+        for (start_row, start_column), (end_row, end_column) in zip(cells, cells[1:]):
+            extra = abs((end_column - start_column) - (end_row - start_row)) // 2
+            for row in range(start_row, end_row):
+                centers[row] = start_column + (row - start_row) * (end_column - start_column) // (end_row - start_row)
+                widths[row] = band + extra
+        last_row, last_column = cells[-1]
+        for row in range(last_row, rows + 1):
+            centers[row] = last_column + (row - last_row)
+    else:
+        centers = [row * columns // rows for row in range(rows + 1)]
+        widths = [max(band, columns * 15 // 100)] * (rows + 1)
+
+    limits = []
+    for row in range(rows + 1):
+        neighbours = centers[max(0, row - 1):row + 2]
+        limits.append((
+            max(0, min(neighbours) - widths[row]),
+            min(columns, max(neighbours) + widths[row]),
+        ))
+
+    # Unsung reference words before and after the raw words are skipped along rows 0 and `rows`
+    limits[0] = (0, columns)
+    limits[rows] = (limits[rows][0], columns)
+    return limits
+
+
+def _align_tokens(raw_tokens, reference_tokens, gap=LOCAL_ALIGNER_GAP_PENALTY, band=LOCAL_ALIGNER_BAND):
+    """
+    Globally aligns two token sequences (Needleman-Wunsch).
+
+    Pairing two tokens scores between -1 and 1 by their similarity and leaving a token
+    unmatched costs `gap`, except for reference tokens before the first or after the last
+    raw token (unsung parts of the reference lyrics). Small alignments compute the whole
+    matrix. Larger ones only compute and store a band around anchors (see `_find_anchors`),
+    so time and memory grow with the song length times the band width.
+
+    Args:
+        raw_tokens (list): Normalized transcribed tokens.
+        reference_tokens (list): Normalized reference tokens.
+        gap (float): Penalty for an unmatched token.
+        band (int): Half-width of the band around the anchors, in reference tokens.
+
+    Returns:
+        list: For each raw token, a (reference index or None, similarity) tuple.
+    """
+    rows, columns = len(raw_tokens), len(reference_tokens)
+    if not rows or not columns:
+        return [(None, 0.0)] * rows
+
+    if rows * columns <= LOCAL_ALIGNER_FULL_CELLS:
+        limits = [(0, columns)] * (rows + 1)
+    else:
+        limits = _band_limits(rows, columns, _find_anchors(raw_tokens, reference_tokens), band)
+
+    # Only the previous score row is kept; trace rows hold the band of their row
+    unreachable = float("-inf")
+    previous = [0.0] * (columns + 1)  # Reference words before the first raw word are skipped for free
+    traces = [bytearray([_LEFT]) * (columns + 1)]
+
+    for row in range(1, rows + 1):
+        low, high = limits[row]
+        previous_low, previous_high = limits[row - 1]
+        current, moves = [unreachable] * (high - low + 1), bytearray(high - low + 1)
+        raw_token = raw_tokens[row - 1]
+        trailing_gap = 0.0 if row == rows else -gap
+
+        for column in range(low, high + 1):
+            best, move = unreachable, _UP
+            if previous_low <= column <= previous_high:
+                best = previous[column - previous_low] - gap
+            if previous_low < column <= previous_high + 1:
+                diagonal = previous[column - 1 - previous_low]
+                if diagonal > unreachable:
+                    diagonal += 2 * _token_similarity(raw_token, reference_tokens[column - 1]) - 1
+                    if diagonal > best:
+                        best, move = diagonal, _DIAGONAL
+            if column > low:
+                left = current[column - 1 - low] + trailing_gap
+                if left > best:
+                    best, move = left, _LEFT
+            current[column - low], moves[column - low] = best, move
+
+        previous = current
+        traces.append(moves)
+
+    # Trace the best path back from the end of both sequences
+    pairs = [(None, 0.0)] * rows
+    row, column = rows, columns
+    while row > 0:
+        move = traces[row][column - limits[row][0]]
+        if move == _DIAGONAL:
+            pairs[row - 1] = (column - 1, _token_similarity(raw_tokens[row - 1], reference_tokens[column - 1]))
+            row, column = row - 1, column - 1
+        elif move == _UP:
+            row -= 1
+        else:
+            column -= 1
+    return pairs
+
+
+def _align_lyrics_locally(raw_lyrics, reference_lyrics):
+    """
+    Maps the transcribed words onto the reference words without an LLM.
+
+    Each raw word keeps its timing. Words paired with a similar reference word take
+    its spelling and verse number; other words are kept as transcribed and take the
+    verse number of their position. Ghost words and standalone punctuation are kept.
+
+    Args:
+        raw_lyrics (list): Condensed raw words (dicts with word, start and end).
+        reference_lyrics (list): Reference lyrics as (word, verse_number) tuples.
+
+    Returns:
+        tuple: (list of WordAlignment objects, list of per-word confidences between 0 and 1,
+        list of the reference index paired with each word or None).
+    """
+    raw_tokens = [_normalize_token(word["word"]) for word in raw_lyrics]
+    reference_tokens = [_normalize_token(word) for word, _ in reference_lyrics]
+    pairs = _align_tokens(raw_tokens, reference_tokens)
+
+    # Verse number at each raw position: from the paired reference word, else the closest previous one
+    first_verse = reference_lyrics[0][1] if reference_lyrics else 1
+    verse_numbers, verse = [], None
+    for reference_index, _ in pairs:
+        if reference_index is not None:
+            verse = reference_lyrics[reference_index][1]
+        verse_numbers.append(verse)
+    next_verse = first_verse
+    for index in range(len(verse_numbers) - 1, -1, -1):
+        if verse_numbers[index] is None:
+            verse_numbers[index] = next_verse
+        else:
+            next_verse = verse_numbers[index]
+
+    aligned, confidences, references = [], [], []
+    for word, token, (reference_index, similarity), verse_number in zip(raw_lyrics, raw_tokens, pairs, verse_numbers):
+        matched = reference_index is not None and similarity >= LOCAL_ALIGNER_MATCH_THRESHOLD
+        aligned.append(WordAlignment(
+            word=reference_lyrics[reference_index][0] if matched else word["word"],
+            start=word["start"],
+            end=word["end"],
+            verse_number=verse_number,
+        ))
+        # Ghost words and punctuation are kept as they are, which is always right
+        confidences.append(similarity if token else 1.0)
+        references.append(reference_index if matched else None)
+
+    return aligned, confidences, references
+
+
+def _low_confidence_regions(confidences, threshold=LOCAL_ALIGNER_MIN_CONFIDENCE, context=LOCAL_ALIGNER_CONTEXT_WORDS):
+    """
+    Finds the spans of weakly aligned words, widened by `context` words on each side.
+
+    Overlapping or touching spans are merged.
+
+    Returns:
+        list: (start, end) index ranges of the raw words, end exclusive.
+    """
+    regions = []
+    for index, confidence in enumerate(confidences):
+        if confidence >= threshold:
+            continue
+        start, end = max(0, index - context), min(len(confidences), index + context + 1)
+        if regions and start <= regions[-1][1]:
+            regions[-1] = (regions[-1][0], end)
+        else:
+            regions.append((start, end))
+    return regions
+
+
+def _region_reference(reference_lyrics, references, start, end):
+    """
+    Returns the reference words between the confidently paired words around a region,
+    extended to whole verses.
+    """
+    before = [index for index in references[:start] if index is not None]
+    after = [index for index in references[end:] if index is not None]
+    low = before[-1] if before else 0
+    high = after[0] + 1 if after else len(reference_lyrics)
+
+    first_verse, last_verse = reference_lyrics[low][1], reference_lyrics[high - 1][1]
+    while low > 0 and reference_lyrics[low - 1][1] == first_verse:
+        low -= 1
+    while high < len(reference_lyrics) and reference_lyrics[high][1] == last_verse:
+        high += 1
+    return reference_lyrics[low:high]
@@ -1,5 +1,8 @@
 # Standard Library Imports
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import logging
+import math
 import json
 import time
 from pprint import pprint
@@ -8,13 +11,35 @@ from pprint import pprint
 from pydantic import ValidationError
 
 # Local Application Imports
-from .config import WordAlignmentList
+from .config import (
+    WordAlignmentList,
+    GEMENI_MODEL,
+    GEMINI_CHUNK_SIZE,
+    GEMINI_CONCURRENCY,
+    GEMINI_MIN_REQUEST_INTERVAL,
+    GEMINI_REFERENCE_MARGIN,
+)
 from .gemini_setup import generate_prompt, llm
 from .lyrics_cleaning import _clean_gemini_response
 
 # Initialize Logger
 logger = logging.getLogger(__name__)
 
+# Spaces out the requests of concurrently processed chunks
+_PACE_LOCK = threading.Lock()
+_next_request = 0.0
+
+
+def _pace_requests(min_interval=GEMINI_MIN_REQUEST_INTERVAL):
+    """Wait so that consecutive LLM requests start at least `min_interval` seconds apart."""
+    global _next_request
+    with _PACE_LOCK:
+        now = time.monotonic()
+        wait = _next_request - now
+        _next_request = max(now, _next_request) + min_interval
+    if wait > 0:
+        time.sleep(wait)
+
 
 def _chunk_lyrics(lyrics, chunk_size):
     """
@@ -68,6 +93,7 @@ def _invoke_with_retries(prompt, max_retries=3, delay_between_retries=0.5):
         try:
             # Attempt to invoke the LLM with the provided prompt
             logger.debug(f"Attempt {attempt}/{max_retries}: Sending prompt to the LLM.")
+            _pace_requests()
             response = llm.invoke(prompt)
 
             # Clean the response to ensure it is valid JSON
@@ -127,10 +153,83 @@ def _validate_and_parse_response(cleaned_content):
         raise RuntimeError("Failed to decode JSON response.") from je
 
 
-def _process_lyrics_in_chunks(raw_lyrics, reference_lyrics, chunk_size=50):
+def _reference_window(reference_lyrics, chunk_start, chunk_end, total_words, margin_words):
+    """
+    Estimates the reference words a raw chunk corresponds to.
+
+    The chunk's position in the raw lyrics is mapped proportionally onto the reference
+    lyrics, widened by `margin_words` on each side and extended to whole verses.
+
+    Args:
+        reference_lyrics (list): List of (word, verse_number) tuples.
+        chunk_start (int): Index of the chunk's first raw word.
+        chunk_end (int): Index after the chunk's last raw word.
+        total_words (int): Total number of raw words.
+        margin_words (int): Extra raw words of context on each side.
+
+    Returns:
+        tuple: (reference slice, (first verse number, last verse number)).
+    """
+    total_reference = len(reference_lyrics)
+    if not total_reference:
+        return reference_lyrics, None
+
+    scale = total_reference / max(total_words, 1)
+    low = max(0, int((chunk_start - margin_words) * scale))
+    high = min(total_reference, max(low + 1, math.ceil((chunk_end + margin_words) * scale)))
+
+    # Extend the window to the start of its first verse and the end of its last verse
+    first_verse = reference_lyrics[low][1]
+    last_verse = reference_lyrics[high - 1][1]
+    while low > 0 and reference_lyrics[low - 1][1] == first_verse:
+        low -= 1
+    while high < total_reference and reference_lyrics[high][1] == last_verse:
+        high += 1
+
+    return reference_lyrics[low:high], (first_verse, last_verse)
+
+
+def _align_chunk(prompt, response_cache=None):
+    """
+    Sends a chunk prompt to the LLM and returns the parsed WordAlignment objects.
+
+    With a response cache, a prompt that was already answered is served from the cache,
+    and new responses are stored once they pass validation.
+    """
+    if response_cache is not None:
+        cached_response = response_cache.get(GEMENI_MODEL, prompt)
+        if cached_response is not None:
+            logger.debug("LLM response cache hit.")
+            return _validate_and_parse_response(cached_response)
+
+    cleaned_response = _invoke_with_retries(prompt)
+    parsed_response = _validate_and_parse_response(cleaned_response)
+
+    if response_cache is not None:
+        response_cache.put(GEMENI_MODEL, prompt, WordAlignmentList(parsed_response).model_dump_json())
+    return parsed_response
+
+
+def _process_lyrics_in_chunks(
+    raw_lyrics,
+    reference_lyrics,
+    chunk_size=GEMINI_CHUNK_SIZE,
+    concurrency=GEMINI_CONCURRENCY,
+    response_cache=None,
+):
     """
     Processes raw lyrics in chunks, aligning them with corrected lyrics.
+
+    With `concurrency` above 1, chunks are aligned in parallel and stitched back in
+    order; otherwise they are aligned one after another, each with the previous
+    chunk's output as context. Responses are looked up in and stored to
+    `response_cache` when given.
     """
+    if concurrency > 1 and len(raw_lyrics) > chunk_size:
+        return _process_lyrics_in_chunks_concurrently(
+            raw_lyrics, reference_lyrics, chunk_size, concurrency, response_cache
+        )
+
     # Split raw lyrics into smaller chunks: List[List[dict]]
     chunks = _chunk_lyrics(raw_lyrics, chunk_size)
 
@@ -189,11 +288,8 @@ def _process_lyrics_in_chunks(raw_lyrics, reference_lyrics, chunk_size=50):
         )
 
         try:
-            # Attempt to retrieve a cleaned response from the model
-            cleaned_response = _invoke_with_retries(prompt)
-
-            # Attempt to validate and parse the cleaned response from the model
-            parsed_response = _validate_and_parse_response(cleaned_response)
+            # Retrieve, validate and parse the response from the model
+            parsed_response = _align_chunk(prompt, response_cache)
 
             # Append processed lyrics to the result
             aligned_lyrics.extend(parsed_response)
@@ -216,4 +312,67 @@ def _process_lyrics_in_chunks(raw_lyrics, reference_lyrics, chunk_size=50):
 
     logger.info("Modified lyrics successfully processed in chunks!")
 
-    return aligned_lyrics
\ No newline at end of file
+    return aligned_lyrics
+
+
+def _process_lyrics_in_chunks_concurrently(raw_lyrics, reference_lyrics, chunk_size, concurrency, response_cache=None):
+    """
+    Aligns the chunks in parallel and stitches the results back in order.
+
+    Each chunk is given context that is known before any chunk is processed: the
+    neighbouring raw words and timings at its boundaries, and the range of reference
+    verses around its position in the song. No chunk waits for another's output, so
+    the stage takes about (chunks / concurrency) round-trips instead of one per chunk.
+    """
+    chunks = _chunk_lyrics(raw_lyrics, chunk_size)
+    total_chunks = len(chunks)
+    margin_words = int(chunk_size * GEMINI_REFERENCE_MARGIN)
+
+    prompts = []
+    for index, raw_chunk in enumerate(chunks):
+        chunk_start = index * chunk_size
+        previous_chunk = chunks[index - 1] if index > 0 else None
+        next_chunk = chunks[index + 1] if index + 1 < total_chunks else None
+
+        reference_window, verse_range = _reference_window(
+            reference_lyrics, chunk_start, chunk_start + len(raw_chunk), len(raw_lyrics), margin_words
+        )
+
+        prompts.append(generate_prompt(
+            raw_chunk,
+            reference_window,
+            index + 1,
+            total_chunks,
+            raw_chunk[0]['start'],
+            raw_chunk[-1]['end'],
+            processed_words=chunk_start,
+            total_words=len(raw_lyrics),
+
+            # Boundary context from the raw transcription instead of the previous chunk's output
+            previous_chunk_last_word=previous_chunk[-1]['word'] if previous_chunk else None,
+            previous_chunk_last_verse=None,
+            previous_chunk_end_time=previous_chunk[-1]['end'] if previous_chunk else None,
+            correction_log=[],
+            expected_next_word=next_chunk[0]['word'] if next_chunk else None,
+            reference_verse_range=verse_range,
+        ))
+
+    logger.info(f"Processing {total_chunks} chunks with up to {concurrency} concurrent requests...")
+    with ThreadPoolExecutor(max_workers=min(concurrency, total_chunks)) as executor:
+        futures = [executor.submit(_align_chunk, prompt, response_cache) for prompt in prompts]
+
+        # Stitch the chunks back together in their original order
+        aligned_lyrics = []
+        for chunk_number, future in enumerate(futures, start=1):
+            try:
+                aligned_lyrics.extend(future.result())
+                logger.info(f"Successfully processed chunk {chunk_number}/{total_chunks}.")
+            except Exception as e:
+                logger.error(f"Error processing chunk {chunk_number}: {e}")
+                for pending in futures:
+                    pending.cancel()
+                raise
+
+    logger.info("Modified lyrics successfully processed in chunks!")
+
+    return aligned_lyrics
@@ -1,16 +1,68 @@
 # Standard Library Imports
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from pprint import pprint
 
 # Local Application Imports
+from .config import LYRICS_ALIGNER, LYRICS_ALIGNERS, GEMINI_CONCURRENCY
 from .lyrics_cleaning import _condense_raw_lyrics, _expand_gemini_lyrics
 from .lyrics_processor import _process_lyrics_in_chunks
+from .local_aligner import _align_lyrics_locally, _low_confidence_regions, _region_reference
 
 # Initialize Logger
 logger = logging.getLogger(__name__)
 
 
-def _modify_lyrics_ai(raw_lyrics, reference_lyrics):
+def _align_with_local_engine(raw_lyrics, reference_lyrics, use_llm=True, response_cache=None):
+    """
+    Aligns the condensed lyrics locally and, with `use_llm`, re-aligns only the
+    low-confidence regions with the LLM.
+
+    A region whose LLM alignment fails keeps its local alignment.
+
+    Args:
+        raw_lyrics (list): Condensed raw words.
+        reference_lyrics (list): Reference lyrics as (word, verse_number) tuples.
+        use_llm (bool): Whether to consult the LLM for low-confidence regions.
+        response_cache (LLMResponseCache|None): Cache of validated LLM responses (None disables it).
+
+    Returns:
+        list: WordAlignment objects in raw word order.
+    """
+    aligned, confidences, references = _align_lyrics_locally(raw_lyrics, reference_lyrics)
+    regions = _low_confidence_regions(confidences)
+    weak_words = sum(end - start for start, end in regions)
+    logger.info(f"Local alignment: {len(regions)} low-confidence regions ({weak_words}/{len(aligned)} words).")
+
+    if not use_llm or not regions:
+        return aligned
+
+    def align_region(region):
+        start, end = region
+        region_reference = _region_reference(reference_lyrics, references, start, end)
+        return _process_lyrics_in_chunks(
+            raw_lyrics[start:end], region_reference, concurrency=1, response_cache=response_cache
+        )
+
+    with ThreadPoolExecutor(max_workers=max(1, min(GEMINI_CONCURRENCY, len(regions)))) as executor:
+        futures = [executor.submit(align_region, region) for region in regions]
+
+    # Splice the LLM alignments into the local one, keeping the local words of failed regions
+    result, position = [], 0
+    for (start, end), future in zip(regions, futures):
+        result.extend(aligned[position:start])
+        try:
+            result.extend(future.result())
+        except Exception as e:
+            logger.warning(f"LLM alignment of words {start}-{end} failed, keeping the local alignment: {e}")
+            result.extend(aligned[start:end])
+        position = end
+    result.extend(aligned[position:])
+
+    return result
+
+
+def _modify_lyrics_ai(raw_lyrics, reference_lyrics, response_cache=None, aligner=LYRICS_ALIGNER):
     """
     Modifies raw lyrics using AI by aligning them with official lyrics.
 
@@ -20,10 +72,16 @@ def _modify_lyrics_ai(raw_lyrics, reference_lyrics):
     Args:
         raw_lyrics (list): List of raw transcribed lyrics.
         reference_lyrics (list): List of official lyrics (verses as strings).
+        response_cache (LLMResponseCache|None): Cache of validated LLM responses (None disables it).
+        aligner (str): "llm" to align every chunk with Gemini, "hybrid" to align locally and
+            consult Gemini only for low-confidence regions, or "local" to align locally only.
 
     Returns:
         list: Formatted and modified lyrics.
     """
+    if aligner not in LYRICS_ALIGNERS:
+        raise ValueError(f"Unknown lyrics aligner '{aligner}'. Expected one of {LYRICS_ALIGNERS}.")
+
     try:
         # Step 1: Condense raw lyrics into a simpler structure for processing
         compressed_raw_lyrics = _condense_raw_lyrics(raw_lyrics)
@@ -37,9 +95,19 @@ def _modify_lyrics_ai(raw_lyrics, reference_lyrics):
         ]
         logger.debug(f"Compressed official lyrics for processing through AI | {len(compressed_reference_lyrics)} words")
 
-        # Step 3: Process the lyrics in chunks and align them
-        modified_lyrics = _process_lyrics_in_chunks(compressed_raw_lyrics, compressed_reference_lyrics)
-        logger.debug(f"Lyrics successfully processed through AI | {len(modified_lyrics)} words")
+        # Step 3: Align the lyrics (locally, or in chunks through the AI)
+        if aligner == "llm":
+            modified_lyrics = _process_lyrics_in_chunks(
+                compressed_raw_lyrics, compressed_reference_lyrics, response_cache=response_cache
+            )
+        else:
+            modified_lyrics = _align_with_local_engine(
+                compressed_raw_lyrics,
+                compressed_reference_lyrics,
+                use_llm=aligner == "hybrid",
+                response_cache=response_cache,
+            )
+        logger.debug(f"Lyrics successfully aligned ({aligner}) | {len(modified_lyrics)} words")
 
         # Step 4: Expand the processed lyrics back to the original verse structure
         formatted_modified_lyrics = _expand_gemini_lyrics(modified_lyrics)
@@ -5,7 +5,10 @@ import logging
 
 # Local Application Imports
 from .main import _modify_lyrics_ai
+from .config import GEMINI_CACHE_DIR, GEMINI_CACHE_BYPASS, LYRICS_ALIGNER
+from .response_cache import get_response_cache
 from ...utilities import load_json, save_json
+from ...cache_manifest import compute_cache_key, restore_artifacts, record_artifacts
 
 # Initialize Logger
 logger = logging.getLogger(__name__)
@@ -15,6 +18,8 @@ def perform_lyric_enhancement(
     output_path: Union[str, Path],
     override: bool = False,
     file_name: str = "modified_lyrics.json",
+    use_response_cache: bool = True,
+    aligner: str = LYRICS_ALIGNER,
 ):
     """
     Processes and modifies lyrics using AI, saving the output to a file.
@@ -27,17 +32,12 @@ def perform_lyric_enhancement(
         output_path (Union[str, Path]): Directory to save the modified lyrics.
         override (bool): Whether to override the file if it already exists.
         file_name (str): Name of the output file to save the modified lyrics.
+        use_response_cache (bool): Whether to reuse cached LLM responses for identical prompts.
+            Also disabled by setting `GEMINI_CACHE_BYPASS`.
+        aligner (str): "llm", "hybrid" or "local" (see `_modify_lyrics_ai`).
     """
     try:
-        # Step 1: Check if the output file already exists
-        output_file = Path(output_path) / file_name
-        if output_file.exists() and not override:
-            logger.info(
-                f"Skipping lyrics modification... AI modified lyrics file already exists in the output directory."
-            )
-            return output_file
-
-        # Step 2: Ensure required input files exist
+        # Step 1: Ensure required input files exist
         raw_lyrics_file = Path(output_path) / "raw_lyrics.json"
         if not raw_lyrics_file.exists():
             logger.warning(
@@ -50,15 +50,35 @@ def perform_lyric_enhancement(
                 f"Official lyrics file does not exist. Skipping lyrics modification...")
             return
 
+        # Step 2: Check if the output file already exists for these raw and reference lyrics
+        output_file = Path(output_path) / file_name
+        cache_key = compute_cache_key(
+            output_path,
+            "lyric_enhancement",
+            params={"file_name": file_name, "aligner": aligner},
+            inputs=[raw_lyrics_file, reference_lyrics_file],
+        )
+        if restore_artifacts(output_path, "lyric_enhancement", cache_key, override=override):
+            logger.info(
+                f"Skipping lyrics modification... AI modified lyrics file already exists in the output directory."
+            )
+            return output_file
+
         # Step 3: Load the input files
         raw_lyrics = load_json(raw_lyrics_file)
         reference_lyrics = load_json(reference_lyrics_file)
 
-        # Step 4: Modify the lyrics using the AI
-        modified_lyrics = _modify_lyrics_ai(raw_lyrics, reference_lyrics)
+        # Step 4: Modify the lyrics using the AI (responses are cached next to the song working directories)
+        response_cache = None
+        if use_response_cache and not GEMINI_CACHE_BYPASS:
+            response_cache = get_response_cache(GEMINI_CACHE_DIR or Path(output_path).parent)
+        modified_lyrics = _modify_lyrics_ai(
+            raw_lyrics, reference_lyrics, response_cache=response_cache, aligner=aligner
+        )
 
         # Step 5: Save the modified lyrics to the output file
         save_json(modified_lyrics, output_file)
+        record_artifacts(output_path, "lyric_enhancement", cache_key, [output_file])
         logger.info("Lyrics ai modification completed and saved successfully!")
         return output_file
 
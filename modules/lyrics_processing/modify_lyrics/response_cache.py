@@ -0,0 +1,120 @@
+# Standard Library Imports
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Union
+import threading
+import hashlib
+import logging
+import sqlite3
+import time
+
+# Local Application Imports
+from .config import GEMINI_CACHE_FILE, GEMINI_CACHE_TTL, GEMINI_CACHE_MAX_ENTRIES
+
+# Initialize Logger
+logger = logging.getLogger(__name__)
+
+# Share of `max_entries` kept by a trim, so the cache is trimmed once per many inserts
+TRIM_RATIO = 0.9
+
+
+class LLMResponseCache:
+    """
+    Persistent prompt -> validated response cache backed by SQLite.
+
+    Entries are keyed on the model name and the full prompt text, and hold the
+    `WordAlignmentList` JSON that passed validation, so an identical chunk (from a
+    re-run or from a duplicate song) is never sent to the API twice. Entries older
+    than `ttl` are ignored. Once the cache holds more than `max_entries`, the least
+    recently used entries are dropped down to `TRIM_RATIO` of the bound.
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        ttl: float = GEMINI_CACHE_TTL,
+        max_entries: int = GEMINI_CACHE_MAX_ENTRIES,
+    ):
+        self.db_path = Path(db_path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, model TEXT NOT NULL, response TEXT NOT NULL, "
+                "created REAL NOT NULL, used REAL NOT NULL)"
+            )
+            self._entries = connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection for one transaction and close it afterwards."""
+        connection = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _key(model: str, prompt: str) -> str:
+        return hashlib.sha256(f"{model}\0{prompt}".encode("utf-8")).hexdigest()
+
+    def get(self, model: str, prompt: str) -> Optional[str]:
+        key = self._key(model, prompt)
+        now = time.time()
+        with self._lock, self._connect() as connection:
+            row = connection.execute(
+                "SELECT response, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[1] > self.ttl:
+                self._entries -= connection.execute("DELETE FROM responses WHERE key = ?", (key,)).rowcount
+                return None
+            connection.execute("UPDATE responses SET used = ? WHERE key = ?", (now, key))
+        return row[0]
+
+    def put(self, model: str, prompt: str, response: str) -> None:
+        now = time.time()
+        key = self._key(model, prompt)
+        with self._lock, self._connect() as connection:
+            updated = connection.execute(
+                "UPDATE responses SET model = ?, response = ?, created = ?, used = ? WHERE key = ?",
+                (model, response, now, now, key),
+            ).rowcount
+            if not updated:
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses (key, model, response, created, used) VALUES (?, ?, ?, ?, ?)",
+                    (key, model, response, now, now),
+                )
+                self._entries += 1
+
+            # Other processes may share the database, so the count is refreshed before trimming
+            if self._entries > self.max_entries:
+                self._entries = connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            if self._entries > self.max_entries:
+                connection.execute(
+                    "DELETE FROM responses WHERE key NOT IN "
+                    "(SELECT key FROM responses ORDER BY used DESC LIMIT ?)",
+                    (int(self.max_entries * TRIM_RATIO),),
+                )
+                self._entries = connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+# One cache per database, shared by every enhancement in the process
+_CACHES = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_response_cache(cache_dir: Optional[Union[str, Path]]) -> Optional[LLMResponseCache]:
+    """Return the shared response cache stored in a directory (None disables caching)."""
+    if cache_dir is None:
+        return None
+    db_path = (Path(cache_dir) / GEMINI_CACHE_FILE).resolve()
+    with _CACHES_LOCK:
+        if db_path not in _CACHES:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            _CACHES[db_path] = LLMResponseCache(db_path)
+        return _CACHES[db_path]
@@ -0,0 +1,170 @@
+# Standard Library Imports
+from pathlib import Path
+from typing import Optional, Union
+import threading
+import hashlib
+import logging
+import json
+import time
+import os
+
+# Third-Party Imports
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import requests
+
+# Local Application Imports
+from .config import (
+    GENIUS_HTTP_TIMEOUT,
+    GENIUS_HTTP_RETRIES,
+    GENIUS_MAX_CONCURRENCY,
+    GENIUS_MIN_REQUEST_INTERVAL,
+    GENIUS_CACHE_TTL,
+    GENIUS_HTTP_CACHE_DIR,
+)
+
+# Initialize Logger
+logger = logging.getLogger(__name__)
+
+
+class GeniusHttpClient:
+    """
+    Pooled, polite HTTP client for the Genius API and song pages.
+
+    - A single `requests.Session` keeps connections alive across requests and songs.
+    - At most `max_concurrency` requests are in flight, and requests start at least
+      `min_interval` seconds apart, so concurrent batch jobs stay within politeness limits.
+    - Responses are cached on disk. Fresh entries (younger than `ttl`) are served without a
+      request; stale entries are revalidated with their ETag / Last-Modified headers.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        timeout: float = GENIUS_HTTP_TIMEOUT,
+        retries: int = GENIUS_HTTP_RETRIES,
+        max_concurrency: int = GENIUS_MAX_CONCURRENCY,
+        min_interval: float = GENIUS_MIN_REQUEST_INTERVAL,
+        ttl: float = GENIUS_CACHE_TTL,
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.timeout = timeout
+        self.ttl = ttl
+        self.min_interval = min_interval
+
+        # Retry connection errors and transient server responses with backoff
+        retry = Retry(total=retries, backoff_factor=1.0, status_forcelist=(429, 500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(1, max_concurrency), max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._slots = threading.BoundedSemaphore(max(1, max_concurrency))
+        self._pace_lock = threading.Lock()
+        self._next_request = 0.0
+
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    # ---------------- Cache ----------------
+    def _cache_file(self, url: str, params: Optional[dict]) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        key = json.dumps([url, sorted((params or {}).items())])
+        return self.cache_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+    @staticmethod
+    def _read_cache(cache_file: Optional[Path]) -> Optional[dict]:
+        if cache_file is None or not cache_file.exists():
+            return None
+        try:
+            return json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    @staticmethod
+    def _write_cache(cache_file: Optional[Path], entry: dict) -> None:
+        if cache_file is None:
+            return
+        temp_file = cache_file.with_suffix(f".{threading.get_ident()}.tmp")
+        temp_file.write_text(json.dumps(entry), encoding="utf-8")
+        os.replace(temp_file, cache_file)
+
+    # ---------------- Requests ----------------
+    def _pace(self) -> None:
+        """Space out the start of consecutive requests by `min_interval` seconds."""
+        with self._pace_lock:
+            now = time.monotonic()
+            wait = self._next_request - now
+            self._next_request = max(now, self._next_request) + self.min_interval
+        if wait > 0:
+            time.sleep(wait)
+
+    def get_text(self, url: str, params: Optional[dict] = None, headers: Optional[dict] = None) -> str:
+        """
+        GET a URL and return the response body, using the on-disk cache.
+
+        Args:
+            url (str): URL to fetch.
+            params (Optional[dict]): Query parameters (part of the cache key).
+            headers (Optional[dict]): Extra request headers (not part of the cache key).
+
+        Returns:
+            str: Response body.
+
+        Raises:
+            Exception: If the request fails with a non-200 status.
+        """
+        cache_file = self._cache_file(url, params)
+        cached = self._read_cache(cache_file)
+        if cached is not None and time.time() - cached["fetched"] < self.ttl:
+            logger.debug(f"HTTP cache hit: {url}")
+            return cached["body"]
+
+        # Revalidate a stale entry instead of downloading it again
+        request_headers = dict(headers or {})
+        if cached is not None:
+            if cached.get("etag"):
+                request_headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                request_headers["If-Modified-Since"] = cached["last_modified"]
+
+        with self._slots:
+            self._pace()
+            response = self.session.get(url, params=params, headers=request_headers, timeout=self.timeout)
+
+        if response.status_code == 304 and cached is not None:
+            logger.debug(f"HTTP cache revalidated: {url}")
+            cached["fetched"] = time.time()
+            self._write_cache(cache_file, cached)
+            return cached["body"]
+
+        if response.status_code != 200:
+            raise Exception(f"HTTP error {response.status_code} for {url}: {response.text[:200]}")
+
+        self._write_cache(cache_file, {
+            "url": url,
+            "fetched": time.time(),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "body": response.text,
+        })
+        return response.text
+
+    def get_json(self, url: str, params: Optional[dict] = None, headers: Optional[dict] = None) -> dict:
+        """GET a URL and decode its JSON body, using the on-disk cache."""
+        return json.loads(self.get_text(url, params=params, headers=headers))
+
+
+# One client per cache directory, shared by every lyrics fetch in the process
+_CLIENTS = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def get_genius_client(cache_dir: Optional[Union[str, Path]] = GENIUS_HTTP_CACHE_DIR) -> GeniusHttpClient:
+    """Return the shared Genius HTTP client for a cache directory (None disables caching)."""
+    key = str(Path(cache_dir).resolve()) if cache_dir is not None else None
+    with _CLIENTS_LOCK:
+        if key not in _CLIENTS:
+            _CLIENTS[key] = GeniusHttpClient(cache_dir)
+        return _CLIENTS[key]
@@ -1,3 +1,22 @@
 import os
 
-GENIUS_API_TOKEN = os.getenv("GENIUS_API_ACCESS_TOKEN")
\ No newline at end of file
+GENIUS_API_TOKEN = os.getenv("GENIUS_API_ACCESS_TOKEN")
+
+# Genius API base URL (can point to a local stand-in serving fixtures)
+GENIUS_API_URL = os.getenv("GENIUS_API_URL", "https://api.genius.com")
+
+# HTTP client settings: timeout (seconds), retries, and politeness limits
+GENIUS_HTTP_TIMEOUT = float(os.getenv("GENIUS_HTTP_TIMEOUT", 15))
+GENIUS_HTTP_RETRIES = int(os.getenv("GENIUS_HTTP_RETRIES", 3))
+GENIUS_MAX_CONCURRENCY = int(os.getenv("GENIUS_MAX_CONCURRENCY", 4))
+GENIUS_MIN_REQUEST_INTERVAL = float(os.getenv("GENIUS_MIN_REQUEST_INTERVAL", 0.5))
+
+# On-disk HTTP cache for search results and lyrics pages (seconds before revalidation)
+GENIUS_HTTP_CACHE_DIR = os.getenv("GENIUS_HTTP_CACHE_DIR")
+GENIUS_CACHE_TTL = float(os.getenv("GENIUS_CACHE_TTL", 7 * 24 * 3600))
+
+# Parser for Genius song pages: "stream" (fastest), "lxml" or "html.parser" (full tree)
+GENIUS_HTML_PARSER = os.getenv("GENIUS_HTML_PARSER", "stream")
+
+# Name of the HTTP cache directory inside the project cache directory
+HTTP_CACHE_DIR_NAME = ".http_cache"
@@ -4,6 +4,7 @@ import re
 
 # Local Application Imports
 from .config import GENIUS_API_TOKEN
+from .client import get_genius_client
 from .utilities import (
     _search_genius_lyrics,
     _scrape_genius_lyrics,
@@ -14,7 +15,7 @@ from .utilities import (
 logger = logging.getLogger(__name__)
 
 
-def _fetch_official_lyrics(metadata):
+def _fetch_official_lyrics(metadata, http_cache_dir=None):
     """
     Fetch and clean official lyrics from Genius using song metadata.
 
@@ -22,6 +23,7 @@ def _fetch_official_lyrics(metadata):
         metadata (dict): Dictionary containing song metadata with keys:
                          - title: Title of the song
                          - artists: Artist name
+        http_cache_dir (str|Path|None): Directory of the on-disk HTTP cache (None disables it).
 
     Returns:
         list: Cleaned lyrics as a list of verses (strings).
@@ -35,10 +37,13 @@ def _fetch_official_lyrics(metadata):
     # Join multiple artists into a single string
     artist = ", ".join(metadata["artists"]) if isinstance(metadata["artists"], list) else metadata["artists"]
 
+    # Shared pooled client, so connections and cached responses are reused across songs
+    client = get_genius_client(http_cache_dir)
+
     try:
         # Search for the song on Genius
         logger.debug(f"Searching for lyrics on Genius for '{title}' by '{artist}'...")
-        url = _search_genius_lyrics(title, artist, api_key=GENIUS_API_TOKEN)
+        url = _search_genius_lyrics(title, artist, api_key=GENIUS_API_TOKEN, client=client)
 
         if not url:
             logger.error(f"No lyrics found for '{title}' by '{artist}'.")
@@ -47,7 +52,7 @@ def _fetch_official_lyrics(metadata):
             logger.debug(f"Lyrics found at URL: {url}")
 
         # Scrape lyrics from the Genius page
-        lyrics = _scrape_genius_lyrics(url)
+        lyrics = _scrape_genius_lyrics(url, client=client)
         if not lyrics:
             logger.error(f"Lyrics could not be scraped for '{title}' by '{artist}'.")
             raise ValueError(f"Lyrics could not be scraped for '{title}' by '{artist}'.") 
@@ -0,0 +1,79 @@
+"""
+Micro-benchmark of the Genius page parsing backends.
+
+Runs every backend over saved song pages, checks that they extract the same lines as the
+full BeautifulSoup tree, and reports the mean parse time per page.
+
+Usage:
+    python -m modules.lyrics_processing.search_lyrics.parser_benchmark <pages> [--repeat N]
+
+`<pages>` is a directory of saved `.html` pages, or the HTTP cache directory
+(`cache/.http_cache`), whose cached Genius pages are used.
+"""
+# Standard Library Imports
+from pathlib import Path
+import argparse
+import json
+import time
+
+# Local Application Imports
+from .parsers import PARSERS
+
+
+def _load_pages(directory: Path) -> dict:
+    """Load saved HTML pages and the song pages held in the HTTP cache."""
+    pages = {}
+    for file in sorted(directory.iterdir()):
+        if file.suffix == ".html":
+            pages[file.name] = file.read_text(encoding="utf-8")
+        elif file.suffix == ".json":
+            entry = json.loads(file.read_text(encoding="utf-8"))
+            if "data-lyrics-container" in entry.get("body", ""):
+                pages[entry.get("url", file.name)] = entry["body"]
+    return pages
+
+
+def run_benchmark(pages: dict, repeat: int = 5) -> dict:
+    """
+    Time every parsing backend over the pages.
+
+    Args:
+        pages (dict): Mapping of page name to HTML.
+        repeat (int): Number of timed passes over the pages.
+
+    Returns:
+        dict: Mapping of backend to (mean milliseconds per page, number of mismatching pages).
+    """
+    reference = {name: PARSERS["html.parser"](page) for name, page in pages.items()}
+
+    results = {}
+    for backend, parse in PARSERS.items():
+        mismatches = sum(1 for name, page in pages.items() if parse(page) != reference[name])
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for page in pages.values():
+                parse(page)
+        elapsed = time.perf_counter() - start
+
+        results[backend] = (1000 * elapsed / (repeat * len(pages)), mismatches)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Genius page parsing backends.")
+    parser.add_argument("pages", type=Path, help="Directory of saved .html pages or the HTTP cache directory.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed passes over the pages (default: 5).")
+    args = parser.parse_args()
+
+    pages = _load_pages(args.pages)
+    if not pages:
+        raise SystemExit(f"No Genius pages found in {args.pages}")
+
+    print(f"{len(pages)} pages, {args.repeat} passes")
+    for backend, (milliseconds, mismatches) in run_benchmark(pages, args.repeat).items():
+        print(f"{backend:>12}: {milliseconds:8.2f} ms/page   mismatching pages: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# Standard Library Imports
+from html.parser import HTMLParser
+import logging
+
+# Third-Party Imports
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+
+# Local Application Imports
+from .config import GENIUS_HTML_PARSER
+
+# Initialize Logger
+logger = logging.getLogger(__name__)
+
+# Attribute marking the elements that hold the lyrics on a Genius song page
+LYRICS_CONTAINER_ATTRS = {"data-lyrics-container": "true"}
+
+# Elements whose text is not part of the page content
+_NON_TEXT_TAGS = {"script", "style", "template"}
+
+
+class _LyricsContainerExtractor(HTMLParser):
+    """
+    Streaming extractor for the text of the lyrics containers.
+
+    The page is tokenized once without building a tree; only the text inside
+    `div[data-lyrics-container="true"]` is kept, stripped and in document order,
+    like `stripped_strings` of the containers.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.lines = []
+        self.containers = 0
+        self._depth = 0          # Nesting depth of divs inside the current container
+        self._skip = 0           # Nesting depth of non-text elements inside the container
+
+    def handle_starttag(self, tag, attrs):
+        if self._depth:
+            if tag == "div":
+                self._depth += 1
+            elif tag in _NON_TEXT_TAGS:
+                self._skip += 1
+        elif tag == "div" and dict(attrs).get("data-lyrics-container") == "true":
+            self._depth = 1
+            self.containers += 1
+
+    def handle_endtag(self, tag):
+        if not self._depth:
+            return
+        if tag == "div":
+            self._depth -= 1
+        elif tag in _NON_TEXT_TAGS and self._skip:
+            self._skip -= 1
+
+    def handle_data(self, data):
+        if self._depth and not self._skip:
+            line = data.strip()
+            if line:
+                self.lines.append(line)
+
+
+def _parse_stream(page: str) -> list:
+    extractor = _LyricsContainerExtractor()
+    extractor.feed(page)
+    extractor.close()
+    if not extractor.containers:
+        raise Exception("No lyrics containers found on the page.")
+    return extractor.lines
+
+
+def _parse_soup(page: str, features: str = "html.parser") -> list:
+    # Only build the tree for the lyrics containers, not for the whole page
+    strainer = SoupStrainer("div", attrs=LYRICS_CONTAINER_ATTRS)
+    soup = BeautifulSoup(page, features, parse_only=strainer)
+    containers = soup.find_all("div", attrs=LYRICS_CONTAINER_ATTRS)
+    if not containers:
+        raise Exception("No lyrics containers found on the page.")
+    return [line for container in containers for line in container.stripped_strings]
+
+
+def _parse_full_tree(page: str) -> list:
+    # Reference implementation: full BeautifulSoup tree of the page
+    soup = BeautifulSoup(page, "html.parser")
+    containers = soup.find_all("div", attrs=LYRICS_CONTAINER_ATTRS)
+    if not containers:
+        raise Exception("No lyrics containers found on the page.")
+    return [line for container in containers for line in container.stripped_strings]
+
+
+def _parse_lxml(page: str) -> list:
+    try:
+        return _parse_soup(page, "lxml")
+    except FeatureNotFound:
+        logger.debug("lxml is not installed. Falling back to the streaming parser.")
+        return _parse_stream(page)
+
+
+# Available parsing backends for Genius song pages
+PARSERS = {
+    "stream": _parse_stream,
+    "lxml": _parse_lxml,
+    "html.parser": _parse_full_tree,
+}
+
+
+def extract_lyrics_lines(page: str, parser: str = GENIUS_HTML_PARSER) -> list:
+    """
+    Extract the lyric lines of a Genius song page.
+
+    Args:
+        page (str): HTML of the song page.
+        parser (str): Parsing backend: "stream" (streaming extractor, default), "lxml"
+            (BeautifulSoup with lxml, restricted to the lyrics containers) or "html.parser"
+            (full BeautifulSoup tree).
+
+    Returns:
+        list[str]: The stripped text lines of the lyrics containers, in page order.
+
+    Raises:
+        Exception: If the page has no lyrics containers.
+    """
+    if parser not in PARSERS:
+        raise ValueError(f"Unknown HTML parser '{parser}'. Expected one of {list(PARSERS)}.")
+    return PARSERS[parser](page)
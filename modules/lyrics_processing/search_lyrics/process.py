@@ -5,7 +5,9 @@ import logging
 
 # Local Application Imports
 from .main import _fetch_official_lyrics
+from .config import GENIUS_HTTP_CACHE_DIR, HTTP_CACHE_DIR_NAME
 from ...utilities import load_json, save_json
+from ...cache_manifest import compute_cache_key, restore_artifacts, record_artifacts
 
 # Initialize Logger
 logger = logging.getLogger(__name__)
@@ -25,18 +27,21 @@ def fetch_and_save_lyrics(
     """
     metadata_file = Path(output_path) / "metadata.json"
 
-    # Check if the file already exists in the output directory and
+    if not metadata_file.exists():
+        logger.error("Metadata file does not exist. Skipping lyric search...")
+        raise FileNotFoundError("Metadata file does not exist.")
+
+    # Check if the lyrics were already fetched for this song metadata and
     # skip the search if the override flag is not set
     output_file = Path(output_path) / file_name
-    if output_file.exists() and not override:
+    cache_key = compute_cache_key(
+        output_path, "reference_lyrics", params={"file_name": file_name}, inputs=[metadata_file]
+    )
+    if restore_artifacts(output_path, "reference_lyrics", cache_key, override=override):
         logger.info(
             "Skipping lyric search... Official lyrics file already exists in the output directory."
         )
         return
-    
-    if not metadata_file.exists():
-        logger.error("Metadata file does not exist. Skipping lyric search...")
-        raise FileNotFoundError("Metadata file does not exist.")
 
     try:
         logger.info("Fetching official audio lyrics to reference for AI modification...")
@@ -44,11 +49,13 @@ def fetch_and_save_lyrics(
         # Load the audio metadata file
         metadata = load_json(metadata_file)
 
-        # Fetch official lyrics
-        lyrics = _fetch_official_lyrics(metadata)
+        # Fetch official lyrics (HTTP responses are cached next to the song working directories)
+        http_cache_dir = GENIUS_HTTP_CACHE_DIR or Path(output_path).parent / HTTP_CACHE_DIR_NAME
+        lyrics = _fetch_official_lyrics(metadata, http_cache_dir=http_cache_dir)
 
         # Save the lyrics as a JSON file
         save_json(lyrics, output_file)
+        record_artifacts(output_path, "reference_lyrics", cache_key, [output_file])
 
         logger.info("Official audio lyrics fetched and saved successfully!")
 
@@ -1,17 +1,17 @@
 # Standard Library Imports
-from bs4 import BeautifulSoup
 import logging
-import requests
 import re
 
 # Local Application Imports
-from .config import GENIUS_API_TOKEN
+from .config import GENIUS_API_TOKEN, GENIUS_API_URL
+from .client import get_genius_client
+from .parsers import extract_lyrics_lines
 
 # Initialize Logger
 logger = logging.getLogger(__name__)
 
 
-def _search_genius_lyrics(title, artist, api_key=GENIUS_API_TOKEN):
+def _search_genius_lyrics(title, artist, api_key=GENIUS_API_TOKEN, client=None):
     """
     Search the Genius API for a song by title and artist.
 
@@ -19,6 +19,7 @@ def _search_genius_lyrics(title, artist, api_key=GENIUS_API_TOKEN):
         title (str): The title of the song to search.
         artist (str): The artist of the song to search.
         api_key (str): The Genius API key for authentication.
+        client (GeniusHttpClient): Pooled, caching HTTP client (default: shared uncached client).
 
     Returns:
         dict or None: The first result from the Genius API search, or None if no results are found.
@@ -28,21 +29,18 @@ def _search_genius_lyrics(title, artist, api_key=GENIUS_API_TOKEN):
     """
 
     # API endpoint and headers
-    base_url = "https://api.genius.com/search"
+    base_url = f"{GENIUS_API_URL.rstrip('/')}/search"
     headers = {"Authorization": f"Bearer {api_key}"}
     params = {"q": f"{title} {artist}"}
 
-    # Make the API request
-    response = requests.get(base_url, headers=headers, params=params)
-
-    # Check for errors in the response status code
-    if response.status_code != 200:
-        raise Exception(
-            f"Genius API error: {response.status_code}, {response.json()}"
-        )
+    # Make the API request (cached by query, so repeated searches do not reach the API)
+    client = client or get_genius_client(None)
+    try:
+        data = client.get_json(base_url, params=params, headers=headers)
+    except Exception as e:
+        raise Exception(f"Genius API error: {e}")
 
     # Parse the JSON response
-    data = response.json()
     hits = data.get("response", {}).get("hits", [])
 
     if not hits:
@@ -68,12 +66,13 @@ def _search_genius_lyrics(title, artist, api_key=GENIUS_API_TOKEN):
     return hits[0]["result"]["url"]
 
 
-def _scrape_genius_lyrics(url):
+def _scrape_genius_lyrics(url, client=None):
     """
     Scrape lyrics from a Genius song URL.
 
     Args:
         url (str): The URL of the Genius song page to scrape.
+        client (GeniusHttpClient): Pooled, caching HTTP client (default: shared uncached client).
 
     Returns:
         list[str]: A list of lyric lines extracted from the page.
@@ -81,28 +80,16 @@ def _scrape_genius_lyrics(url):
     Raises:
         Exception: If the page request fails or no lyrics are found.
     """
-    # Fetch the Genius song page
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise Exception(f"Failed to fetch Genius page: {response.status_code}")
-
-    # Parse the page content using BeautifulSoup
-    soup = BeautifulSoup(response.text, "html.parser")
-
-    # Find all divs with the attribute 'data-lyrics-container'
-    lyrics_containers = soup.find_all(
-        "div", attrs={"data-lyrics-container": "true"})
-
-    if not lyrics_containers:
-        raise Exception("No lyrics containers found on the page.")
-
-    # Extract and clean the text from the containers
-    lyrics = []
-    for container in lyrics_containers:
-        for line in container.stripped_strings:
-            lyrics.append(line)
-
-    return lyrics
+    # Fetch the Genius song page (cached by URL)
+    client = client or get_genius_client(None)
+    try:
+        page = client.get_text(url)
+    except Exception as e:
+        raise Exception(f"Failed to fetch Genius page: {e}")
+
+    # Extract the text of the divs with the attribute 'data-lyrics-container'
+    # (parsing backend configured by GENIUS_HTML_PARSER)
+    return extract_lyrics_lines(page)
 
 
 def _clean_genius_lyrics(fetched_lyrics):
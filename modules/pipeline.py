@@ -0,0 +1,147 @@
+# Standard Library Imports
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+import logging
+
+# Initialize Logger
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PipelineStage:
+    """
+    A single stage of the processing pipeline.
+
+    Attributes:
+        name (str): Unique name of the stage (e.g. "separation").
+        func (Callable[[], Any]): Callable running the stage; its return value is the stage result.
+        inputs (Tuple[str, ...]): Artifacts the stage reads (e.g. "vocals", "metadata.json").
+        outputs (Tuple[str, ...]): Artifacts the stage writes.
+        required (bool): Whether a failure aborts the pipeline. Stages depending on a failed
+            optional stage are skipped instead.
+    """
+    name: str
+    func: Callable[[], Any]
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    required: bool = True
+
+
+def _resolve_dependencies(stages: Iterable[PipelineStage]) -> Dict[str, set]:
+    """
+    Derive the stage dependencies from the artifacts each stage reads and writes.
+
+    An input that no stage produces is expected to exist already and adds no dependency.
+
+    Returns:
+        Dict[str, set]: Mapping of stage name to the names of the stages it waits for.
+
+    Raises:
+        ValueError: If stage names are not unique, an artifact has several producers,
+            or the dependencies contain a cycle.
+    """
+    producers = {}
+    names = set()
+    for stage in stages:
+        if stage.name in names:
+            raise ValueError(f"Duplicate pipeline stage '{stage.name}'.")
+        names.add(stage.name)
+
+        for artifact in stage.outputs:
+            if artifact in producers:
+                raise ValueError(f"Artifact '{artifact}' is produced by both '{producers[artifact]}' and '{stage.name}'.")
+            producers[artifact] = stage.name
+
+    dependencies = {
+        stage.name: {producers[artifact] for artifact in stage.inputs if artifact in producers} - {stage.name}
+        for stage in stages
+    }
+
+    # Reject cycles up front so the scheduler can never wait forever
+    remaining = {name: set(deps) for name, deps in dependencies.items()}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"Pipeline stages have a dependency cycle: {sorted(remaining)}")
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+
+    return dependencies
+
+
+def run_pipeline(stages: Iterable[PipelineStage], max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Run pipeline stages concurrently, starting each stage as soon as the stages
+    producing its inputs have finished.
+
+    Independent stages (e.g. the metadata lookup and stem separation) overlap, so
+    network-bound stages are hidden behind the CPU-bound ones.
+
+    Args:
+        stages (Iterable[PipelineStage]): Stages to run.
+        max_workers (Optional[int]): Maximum number of stages running at once (default: all).
+
+    Returns:
+        Dict[str, Any]: Mapping of stage name to its result. Skipped or failed optional
+            stages are missing from the mapping.
+
+    Raises:
+        Exception: The error of the first required stage that failed, after the
+            running stages have finished.
+    """
+    stages = {stage.name: stage for stage in stages}
+    dependencies = _resolve_dependencies(stages.values())
+
+    results = {}
+    finished, skipped = set(), set()
+    error = None
+
+    with ThreadPoolExecutor(max_workers=max_workers or max(1, len(stages)), thread_name_prefix="pipeline") as executor:
+        running = {}
+
+        def schedule():
+            pending = [
+                name for name in dependencies
+                if name not in finished and name not in skipped and name not in running.values()
+            ]
+
+            # Skip stages whose inputs will never be produced, following chains of dependents
+            while blocked := [name for name in pending if dependencies[name] & skipped]:
+                for name in blocked:
+                    logger.warning(f"Skipping stage '{name}': depends on a stage that did not complete.")
+                    skipped.add(name)
+                    pending.remove(name)
+
+            for name in pending:
+                if dependencies[name] <= finished:
+                    logger.debug(f"Starting stage '{name}'.")
+                    running[executor.submit(stages[name].func)] = name
+
+        schedule()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    results[name] = future.result()
+                    finished.add(name)
+                    logger.debug(f"Finished stage '{name}'.")
+
+                except Exception as e:
+                    skipped.add(name)
+                    if stages[name].required:
+                        logger.error(f"Stage '{name}' failed: {e}")
+                        error = error or e
+                    else:
+                        logger.warning(f"Optional stage '{name}' failed: {e}")
+
+            # After a required failure, let running stages finish but start no new ones
+            if error is None:
+                schedule()
+
+    if error is not None:
+        raise error
+    return results
@@ -1,2 +1,2 @@
 from .stem_separation import separate_audio_stems
-from .stem_merging import merge_audio_stems
\ No newline at end of file
+from .stem_merging import merge_audio_stems, StemMixConfig
\ No newline at end of file
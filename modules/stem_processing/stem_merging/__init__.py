@@ -1 +1,2 @@
-from .process import merge_audio_stems
\ No newline at end of file
+from .process import merge_audio_stems
+from .config import StemMixConfig
\ No newline at end of file
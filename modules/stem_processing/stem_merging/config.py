@@ -0,0 +1,20 @@
+# Standard Library Imports
+from dataclasses import dataclass, field
+
+# Default Mix Settings
+DEFAULT_STEMS = ("bass", "drums", "other")
+DEFAULT_SAMPLE_RATE = 44100
+DEFAULT_CHANNELS = 2
+DEFAULT_BITRATE = "320k"
+
+
+# Stem Mix Configuration
+@dataclass
+class StemMixConfig:
+    stems: tuple = DEFAULT_STEMS                        # Stems summed into the mix
+    gains_db: dict = field(default_factory=dict)        # Per-stem gain in dB, e.g. {"vocals": -12.0}
+    headroom_db: float = 1.0                            # Output ceiling below 0 dBFS
+    limiter: bool = True                                # Soft-limit peaks instead of scaling the whole mix
+    sample_rate: int = DEFAULT_SAMPLE_RATE
+    channels: int = DEFAULT_CHANNELS
+    bitrate: str = DEFAULT_BITRATE
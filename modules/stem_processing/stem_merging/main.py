@@ -1,9 +1,13 @@
 # Standard Library Imports
-from pydub import AudioSegment
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 import logging
 
+# Local Application Imports
+from .config import StemMixConfig
+from .utilities import _db_to_gain, _accumulate, _apply_limiter
+from ...utilities import decode_audio, encode_audio
+
 # Initialize Logger
 logger = logging.getLogger(__name__)
 
@@ -11,10 +15,11 @@ logger = logging.getLogger(__name__)
 def _excecute_stem_merge(
     stems_directory: Union[str, Path],
     output_file: Union[str, Path],
-    output_format: str = 'mp3'
+    output_format: Optional[str] = None,
+    config: StemMixConfig = StemMixConfig()
 ):
     # Define the expected stem file names
-    expected_files = ['bass', 'drums', 'other']
+    expected_files = [stem.lower() for stem in config.stems]
     stem_files = {}
 
     # Iterate through the files in the directory and find the required stems
@@ -27,23 +32,35 @@ def _excecute_stem_merge(
     # Validate that all required audio stem paths are found
     if not all(stem in stem_files for stem in expected_files):
         raise ValueError(
-            "All required stem files (bass, drums, other) must be provided.")
+            f"All required stem files ({', '.join(expected_files)}) must be provided.")
 
     try:
         logger.debug(f"Stem files found: {stem_files}")
-        
-        # Step 1: Load the audio stems
-        # Each stem (bass, drums, other, vocals) is loaded as an AudioSegment object
-        stems = [AudioSegment.from_file(stem_files[stem]) for stem in expected_files]
-
-        # Step 2: Merge the stems by overlaying them sequentially
-        # Start with the first stem (bass) and overlay the rest (drums, other, vocals) one by one
-        merged_audio = stems[0]
-        for stem in stems[1:]:
-            merged_audio = merged_audio.overlay(stem)
-
-        # Step 3: Export the merged audio to the specified format
-        merged_audio.export(output_file, format=output_format)
+
+        # Step 1: Decode each stem once into a float32 array and sum it into the mix
+        # Each stem is scaled by its gain in place, so only one decoded stem is alive
+        # next to the running mix at any time
+        merged_audio = None
+        for stem in expected_files:
+            audio = decode_audio(stem_files[stem], config.sample_rate, config.channels)
+
+            gain_db = config.gains_db.get(stem, 0.0)
+            if gain_db:
+                audio *= _db_to_gain(gain_db)
+
+            merged_audio = _accumulate(merged_audio, audio)
+
+        # Step 2: Keep the mix below the output ceiling
+        merged_audio = _apply_limiter(merged_audio, config.headroom_db, config.limiter)
+
+        # Step 3: Encode the merged audio once to the specified format
+        encode_audio(
+            merged_audio,
+            output_file,
+            sample_rate=config.sample_rate,
+            bitrate=config.bitrate,
+            output_format=output_format
+        )
         return
 
     except Exception as e:
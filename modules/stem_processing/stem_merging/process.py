@@ -4,7 +4,10 @@ from typing import Union
 import logging
 
 # Local Application Imports
+from .config import StemMixConfig
 from .main import _excecute_stem_merge
+from ...utilities import find_audio_artifact
+from ...cache_manifest import compute_cache_key, restore_artifacts, record_artifacts
 
 # Initialize Logger
 logger = logging.getLogger(__name__)
@@ -13,19 +16,42 @@ logger = logging.getLogger(__name__)
 def merge_audio_stems(
     working_dir: Union[str, Path],
     override: bool = False,
-    file_name: str = "karaoke_audio.mp3"
+    file_name: str = "karaoke_audio.wav",
+    mix_config: StemMixConfig = None
 ):
-    """Merge audio stems into a karaoke instrumental."""
-    # Check if the instrumental audio file already exists in the output directory and
-    # skip the merging if the override flag is not set
+    """
+    Merge audio stems into a karaoke instrumental.
+
+    Args:
+        working_dir (Union[str, Path]): Directory holding the separated stems.
+        override (bool): Whether to override the file if it already exists.
+        file_name (str): Name of the merged output file. The format follows its extension.
+        mix_config (StemMixConfig): Stems, per-stem gains and headroom of the mix.
+            Defaults to an instrumental of bass, drums and other at unity gain.
+    """
+    mix_config = mix_config or StemMixConfig()
+
+    # Key the instrumental on the mix settings and the stems it is mixed from, and skip the
+    # merging if it already exists for them and the override flag is not set
     output_file = Path(working_dir) / file_name
-    if output_file.exists() and not override:
+    cache_key = compute_cache_key(
+        working_dir,
+        "merge",
+        params={"file_name": file_name, "mix": mix_config},
+        inputs=[find_audio_artifact(working_dir, stem) for stem in mix_config.stems],
+    )
+    if restore_artifacts(working_dir, "merge", cache_key, override=override):
         logger.info("Skipping audio merging... Karaoke audio already exists in the output directory.")
         return
 
     try:
         logger.info(f"Merging audio stems into a single karaoke audio file: {output_file.stem}")
-        _excecute_stem_merge(stems_directory=working_dir, output_file=output_file)
+        _excecute_stem_merge(
+            stems_directory=working_dir,
+            output_file=output_file,
+            config=mix_config
+        )
+        record_artifacts(working_dir, "merge", cache_key, [output_file])
         logger.info("Audio stems merged successfully.")
         return
     
@@ -0,0 +1,83 @@
+# Standard Library Imports
+import logging
+
+# Third-Party Imports
+import numpy as np
+
+# Initialize Logger
+logger = logging.getLogger(__name__)
+
+
+def _db_to_gain(gain_db):
+    """
+    Convert a gain in decibels to a linear amplitude factor.
+
+    Args:
+        gain_db (float): Gain in decibels.
+
+    Returns:
+        float: Linear amplitude factor.
+    """
+    return float(10 ** (gain_db / 20))
+
+
+def _accumulate(mix, audio):
+    """
+    Add an audio array into the running mix in place, growing the mix if the audio is longer.
+
+    Args:
+        mix (np.ndarray | None): Running mix with shape (channels, samples), or None for the first stem.
+        audio (np.ndarray): Audio to add with shape (channels, samples).
+
+    Returns:
+        np.ndarray: The updated mix.
+    """
+    # Start the mix from a copy so adding later stems never modifies the first one
+    if mix is None:
+        return audio.copy()
+
+    # Pad the mix if this stem is longer (stems may differ by a few samples)
+    if audio.shape[1] > mix.shape[1]:
+        mix = np.pad(mix, ((0, 0), (0, audio.shape[1] - mix.shape[1])))
+
+    mix[:, :audio.shape[1]] += audio
+    return mix
+
+
+def _apply_limiter(mix, headroom_db=1.0, limiter=True):
+    """
+    Keep the mix below the output ceiling.
+
+    With the limiter enabled only samples above a soft knee are compressed (tanh curve),
+    so quiet passages are untouched. Without it, the whole mix is scaled down when it peaks
+    above the ceiling.
+
+    Args:
+        mix (np.ndarray): Mixed audio with shape (channels, samples). Modified in place.
+        headroom_db (float): Distance of the output ceiling below 0 dBFS.
+        limiter (bool): Whether to soft-limit peaks instead of scaling the whole mix.
+
+    Returns:
+        np.ndarray: The limited mix.
+    """
+    ceiling = _db_to_gain(-abs(headroom_db))
+    peak = float(np.max(np.abs(mix))) if mix.size else 0.0
+
+    # Nothing to do if the mix already fits below the ceiling
+    if peak <= ceiling:
+        return mix
+
+    if not limiter:
+        logger.debug(f"Scaling mix down from peak {peak:.3f} to ceiling {ceiling:.3f}.")
+        mix *= ceiling / peak
+        return mix
+
+    # Compress only the samples above the knee into the remaining headroom
+    knee = ceiling * 0.8
+    span = ceiling - knee
+    over = np.abs(mix) > knee
+    excess = np.abs(mix[over]) - knee
+    mix[over] = np.sign(mix[over]) * (knee + span * np.tanh(excess / span))
+
+    logger.debug(f"Soft-limited {int(over.sum())} samples above {knee:.3f}.")
+    return mix
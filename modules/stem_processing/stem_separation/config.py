@@ -1,17 +1,65 @@
 # Standard Library Imports
 from dataclasses import dataclass
+import os
 
 # Default Model and Thresholds
 DEFAULT_MODEL = "htdemucs_ft"
 DEFAULT_MP3_RATE = 320
 
+# Intermediate stem format. Stems are only consumed by later pipeline stages, so they are
+# written lossless by default to avoid repeated MP3 encode/decode and generation loss
+DEFAULT_STEM_FORMAT = "wav"
+STEM_FORMATS = ("wav", "flac", "mp3")
+
+# Segmented (streaming) separation: overlapping windows are separated one at a time and
+# crossfaded, so peak memory scales with the window length instead of the track length
+DEFAULT_OVERLAP_SECONDS = 2.0
+MIN_SEGMENT_SECONDS = 10.0
+DEFAULT_MAX_MEMORY_MB = int(os.getenv("DEMUCS_MAX_MEMORY_MB", 0)) or None
+
+# Parallel separation: windows are distributed across a pool of worker processes, each
+# running the model with a share of the CPU threads. Parallel runs always use windows.
+# By default half the cores get a worker, capped at 4 since every worker holds a model copy
+CPU_COUNT = os.cpu_count() or 1
+MAX_DEFAULT_JOBS = 4
+DEFAULT_JOBS = max(1, int(os.getenv("DEMUCS_JOBS", min(MAX_DEFAULT_JOBS, CPU_COUNT // 2))))
+DEFAULT_PARALLEL_SEGMENT_SECONDS = 30.0
+
+# Karaoke Mode: vocals plus the accompaniment written directly as the karaoke audio
+KARAOKE_STEM = "vocals"
+KARAOKE_ACCOMPANIMENT = "karaoke_audio"
+
 
 # Audio Separation Configuration
 @dataclass
 class AudioSeparationConfig:
     model: str = DEFAULT_MODEL
     two_stems: str = None
-    mp3: bool = True
+    accompaniment_name: str = None                  # Name of the complement stem in two-stems mode (default: "no_<stem>")
+    stem_format: str = DEFAULT_STEM_FORMAT          # One of STEM_FORMATS
     mp3_rate: int = DEFAULT_MP3_RATE
     float32: bool = False
     int24: bool = False
+    segment_seconds: float = None                   # Window length for segmented separation
+    overlap_seconds: float = DEFAULT_OVERLAP_SECONDS    # Crossfaded overlap between windows
+    max_memory_mb: int = DEFAULT_MAX_MEMORY_MB      # Memory ceiling used to derive the window length
+    jobs: int = DEFAULT_JOBS                        # Worker processes for CPU separation (1 = in-process)
+
+    @property
+    def segmented(self) -> bool:
+        """Whether the track is separated window by window instead of all at once."""
+        return self.segment_seconds is not None or self.max_memory_mb is not None or self.jobs > 1
+
+    @property
+    def windows_in_flight(self) -> int:
+        """Windows held in memory at once: two per worker (one separated, one queued) in parallel runs."""
+        return 2 * self.jobs if self.jobs > 1 else 1
+
+
+def karaoke_separation_config(**overrides) -> AudioSeparationConfig:
+    """Build a two-stems configuration that writes `vocals` and `karaoke_audio` directly."""
+    return AudioSeparationConfig(
+        two_stems=KARAOKE_STEM,
+        accompaniment_name=KARAOKE_ACCOMPANIMENT,
+        **overrides
+    )
@@ -0,0 +1,391 @@
+# Standard Library Imports
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from contextlib import ExitStack
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Union
+import multiprocessing
+import threading
+import logging
+import atexit
+
+# Third-Party Imports
+import numpy as np
+import torch
+
+# Local Application Imports
+from .config import AudioSeparationConfig, CPU_COUNT
+from .utilities import (
+    _resolve_device,
+    _device_config,
+    _save_stem,
+    _segment_seconds,
+    _stem_codec_args,
+)
+from ...utilities import AudioStreamReader, AudioStreamWriter
+
+# Initialize Logger
+logger = logging.getLogger(__name__)
+
+
+class DemucsSeparationEngine:
+    """
+    In-process Demucs separation engine.
+
+    Pretrained models are loaded once and kept in memory across jobs, so separating a
+    song no longer pays for a fresh interpreter, the torch import, and reloading the
+    model weights. Audio is decoded into a tensor, the model is applied directly to it,
+    and each stem is written straight into the output directory.
+
+    Long tracks can be separated in segmented mode: overlapping windows are decoded,
+    separated and crossfaded one at a time and the stems are spilled to disk window by
+    window, so peak memory scales with the window length rather than the track length.
+    The stems are encoded at the end, rescaled by their peak like whole-track output.
+
+    On CPU the windows can be spread over a persistent pool of worker processes
+    (`config.jobs`), each holding its own copy of the model and a share of the CPU
+    threads. Results are reassembled in order, so the output matches a single-process run.
+    """
+
+    def __init__(self):
+        self._models = {}
+        self._lock = threading.Lock()
+        self._pool = None
+        self._pool_key = None
+
+    def get_model(self, model_name: str):
+        """
+        Return a loaded Demucs model (or bag of models), loading it on first use.
+
+        Args:
+            model_name (str): Name of the pretrained Demucs model (e.g. "htdemucs_ft").
+
+        Returns:
+            torch.nn.Module: The loaded model in evaluation mode.
+        """
+        with self._lock:
+            if model_name not in self._models:
+                # Import lazily so importing the package does not load Demucs
+                from demucs.pretrained import get_model
+
+                logger.info(f"Loading Demucs model '{model_name}'...")
+                model = get_model(model_name)
+                model.cpu()
+                model.eval()
+                self._models[model_name] = model
+
+            return self._models[model_name]
+
+    def separate(
+        self,
+        input_file: Union[str, Path],
+        output_dir: Union[str, Path],
+        config: AudioSeparationConfig = AudioSeparationConfig(),
+    ):
+        """
+        Separate an audio file into stems and write them into the output directory.
+
+        Args:
+            input_file (Union[str, Path]): Path to the input audio file.
+            output_dir (Union[str, Path]): Directory where the stems are written.
+            config (AudioSeparationConfig): Separation settings.
+
+        Returns:
+            dict: Mapping of stem name to the written file path.
+        """
+        device = _resolve_device()
+        config = _device_config(config, device)
+
+        # With a worker pool the windows are separated by the workers' models, so only the
+        # model's layout is needed here, not a copy of its weights
+        if config.jobs > 1:
+            model = self._get_pool(config.model, config.jobs).submit(_worker_model_layout).result()
+        else:
+            model = self.get_model(config.model)
+
+        if config.segmented:
+            return self._separate_segmented(model, device, Path(input_file), Path(output_dir), config)
+        return self._separate_whole(model, device, Path(input_file), Path(output_dir), config)
+
+    def _separate_whole(self, model, device, input_file, output_dir, config):
+        """Separate the whole track at once and write the stems with Demucs."""
+        from demucs.audio import AudioFile
+
+        # Step 1: Decode the input audio at the model's sample rate and channel count
+        wav = AudioFile(input_file).read(
+            streams=0,
+            samplerate=model.samplerate,
+            channels=model.audio_channels
+        )
+
+        # Step 2: Apply the model to the decoded tensor
+        logger.debug(f"Applying Demucs model '{config.model}' on {device}.")
+        sources = _apply_model(model, wav, device)
+
+        # Step 3: Name the separated sources, collapsing to two stems if requested
+        stems = _name_stems(model, sources, config)
+
+        # Step 4: Write each stem straight into the output directory
+        written = {}
+        for name, source in stems.items():
+            written[name] = _save_stem(source, output_dir, name, model.samplerate, config)
+            logger.debug(f"Saved stem '{name}' to {written[name]}")
+
+        return written
+
+    def _separate_segmented(self, model, device, input_file, output_dir, config):
+        """Separate the track in overlapping, crossfaded windows and spill the stems to disk."""
+        samplerate, channels = model.samplerate, model.audio_channels
+
+        # Window geometry: each window shares `overlap` samples with the previous one
+        segment_seconds = _segment_seconds(config, samplerate, channels, len(model.sources))
+        window = int(segment_seconds * samplerate)
+        overlap = max(1, int(min(config.overlap_seconds, segment_seconds / 2) * samplerate))
+        hop = window - overlap
+        fade_in = np.linspace(0.0, 1.0, overlap, dtype=np.float32)
+        fade_out = 1.0 - fade_in
+        logger.debug(f"Segmented separation with {segment_seconds:.1f}s windows and {overlap / samplerate:.1f}s overlap.")
+
+        stem_names = _stem_names(model, config)
+        written = {name: output_dir / f"{name}.{config.stem_format}" for name in stem_names}
+        codec_args = _stem_codec_args(config)
+
+        # Stems are spilled to disk as raw float32 frames until their peak is known, then encoded
+        # with the same peak rescaling Demucs applies to whole-track output (clip="rescale")
+        spills = {name: output_dir / f".{name}.segmented.f32" for name in stem_names}
+        peaks = np.zeros(len(stem_names), dtype=np.float32)
+
+        try:
+            with ExitStack() as stack:
+                reader = stack.enter_context(AudioStreamReader(input_file, samplerate, channels))
+                spill_files = [stack.enter_context(open(spills[name], "wb")) for name in stem_names]
+
+                def emit(block):
+                    # block: (stems, channels, samples), spilled as interleaved frames
+                    if not block.shape[-1]:
+                        return
+                    np.maximum(peaks, np.abs(block).max(axis=(1, 2)), out=peaks)
+                    for spill_file, stem in zip(spill_files, block):
+                        np.ascontiguousarray(stem.T).tofile(spill_file)
+
+                windows = _iter_windows(reader, window, hop, overlap)
+                previous_tail = None
+                for block, is_last in self._map_windows(model, device, windows, config):
+                    # Crossfade the start of this window with the tail of the previous one
+                    if previous_tail is not None:
+                        block[..., :overlap] = block[..., :overlap] * fade_in + previous_tail * fade_out
+
+                    # Last window: write everything
+                    if is_last:
+                        emit(block)
+                        previous_tail = None
+                        break
+
+                    # Otherwise hold back the overlap for the next crossfade
+                    emit(block[..., :-overlap])
+                    previous_tail = block[..., -overlap:]
+
+                if previous_tail is not None:
+                    emit(previous_tail)
+
+            for name, peak in zip(stem_names, peaks):
+                scale = np.float32(1.0 / max(1.01 * float(peak), 1.0))
+                with open(spills[name], "rb") as spill_file, \
+                        AudioStreamWriter(written[name], samplerate, channels, codec_args) as writer:
+                    while (frames := np.fromfile(spill_file, dtype=np.float32, count=window * channels)).size:
+                        writer.write(frames.reshape(-1, channels).T * scale)
+        finally:
+            for spill in spills.values():
+                spill.unlink(missing_ok=True)
+
+        for name, path in written.items():
+            logger.debug(f"Saved stem '{name}' to {path}")
+        return written
+
+    def _map_windows(self, model, device, windows, config):
+        """
+        Separate windows in order, in-process or across the worker pool.
+
+        Args:
+            model (torch.nn.Module): Loaded Demucs model (used in-process).
+            device (str): Device to run the model on.
+            windows (Iterator[tuple]): (chunk, is_last) pairs from `_iter_windows`.
+            config (AudioSeparationConfig): Separation settings.
+
+        Yields:
+            tuple: (block, is_last) where block has shape (stems, channels, samples).
+        """
+        if config.jobs <= 1:
+            for index, (chunk, is_last) in enumerate(windows, start=1):
+                logger.debug(f"Separating window {index} ({chunk.shape[1] / model.samplerate:.1f}s).")
+                yield _separate_window(model, chunk, device, config), is_last
+            return
+
+        # Keep at most one queued window per worker beyond the ones being separated
+        # (2 * jobs in flight, as budgeted by `_segment_seconds`), so memory stays
+        # bounded while every worker has work
+        pool = self._get_pool(config.model, config.jobs)
+        pending = deque()
+        for chunk, is_last in windows:
+            pending.append((pool.submit(_separate_window_in_worker, chunk, config), is_last))
+            if len(pending) >= 2 * config.jobs:
+                future, last = pending.popleft()
+                yield future.result(), last
+
+        while pending:
+            future, last = pending.popleft()
+            yield future.result(), last
+
+    def _get_pool(self, model_name, jobs):
+        """Return the persistent worker pool for the model, (re)creating it if the settings changed."""
+        with self._lock:
+            if self._pool_key != (model_name, jobs):
+                if self._pool is not None:
+                    self._pool.shutdown(wait=True)
+
+                threads = max(1, CPU_COUNT // jobs)
+                logger.info(f"Starting {jobs} separation workers with {threads} threads each...")
+                self._pool = ProcessPoolExecutor(
+                    max_workers=jobs,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(model_name, threads),
+                )
+                self._pool_key = (model_name, jobs)
+
+            return self._pool
+
+    def shutdown(self):
+        """Stop the worker pool, if any."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+            self._pool, self._pool_key = None, None
+
+
+def _iter_windows(reader, window, hop, overlap):
+    """
+    Read overlapping windows from an audio stream.
+
+    Args:
+        reader (AudioStreamReader): Open audio stream.
+        window (int): Window length in samples.
+        hop (int): Number of new samples per window after the first one.
+        overlap (int): Number of samples shared with the previous window.
+
+    Yields:
+        tuple: (chunk, is_last) where chunk has shape (channels, samples).
+    """
+    carry = None
+    while True:
+        # Read a full window first, then only the new (non-overlapping) part
+        requested = window if carry is None else hop
+        new = reader.read(requested)
+        if new.shape[1] == 0:
+            return
+
+        chunk = new if carry is None else np.concatenate([carry, new], axis=1)
+        is_last = new.shape[1] < requested
+        yield chunk, is_last
+
+        if is_last:
+            return
+        carry = chunk[:, -overlap:]
+
+
+def _separate_window(model, chunk, device, config):
+    """Separate one window and stack the configured stems into a (stems, channels, samples) array."""
+    sources = _apply_model(model, torch.from_numpy(chunk), device)
+    return np.stack([stem.numpy() for stem in _name_stems(model, sources, config).values()])
+
+
+# Model held by each worker process of the separation pool
+_WORKER_MODEL = None
+
+
+def _init_worker(model_name, threads):
+    """Load the model once per worker process and limit its share of CPU threads."""
+    global _WORKER_MODEL
+    from demucs.pretrained import get_model
+
+    torch.set_num_threads(threads)
+    _WORKER_MODEL = get_model(model_name)
+    _WORKER_MODEL.cpu()
+    _WORKER_MODEL.eval()
+
+
+def _worker_model_layout():
+    """Return the sample rate, channel count and source names of the worker's model."""
+    return SimpleNamespace(
+        samplerate=_WORKER_MODEL.samplerate,
+        audio_channels=_WORKER_MODEL.audio_channels,
+        sources=list(_WORKER_MODEL.sources),
+    )
+
+
+def _separate_window_in_worker(chunk, config):
+    """Separate one window inside a worker process."""
+    return _separate_window(_WORKER_MODEL, chunk, "cpu", config)
+
+
+def _apply_model(model, wav, device):
+    """
+    Apply the Demucs model to a mixture tensor.
+
+    Args:
+        model (torch.nn.Module): Loaded Demucs model.
+        wav (torch.Tensor): Mixture with shape (channels, samples).
+        device (str): Device to run the model on.
+
+    Returns:
+        torch.Tensor: Separated sources with shape (sources, channels, samples) on the CPU.
+    """
+    from demucs.apply import apply_model
+
+    # Normalize the mixture the same way the Demucs CLI does (guarding silent audio)
+    ref = wav.mean(0)
+    mean, std = ref.mean(), ref.std() + 1e-8
+    wav = (wav - mean) / std
+
+    with torch.no_grad():
+        sources = apply_model(model, wav[None], device=device, split=True, overlap=0.25, progress=False)[0]
+    return (sources * std + mean).cpu()
+
+
+def _stem_names(model, config):
+    """Return the names of the stems written for the model and configuration, in order."""
+    if config.two_stems is None:
+        return list(model.sources)
+    return [config.two_stems, config.accompaniment_name or f"no_{config.two_stems}"]
+
+
+def _name_stems(model, sources, config):
+    """
+    Name the separated sources, collapsing to two stems if requested.
+
+    In two-stems mode the accompaniment is summed from the in-memory sources,
+    so no intermediate stems are written and merged afterwards.
+
+    Args:
+        model (torch.nn.Module): Loaded Demucs model.
+        sources (torch.Tensor): Separated sources with shape (sources, channels, samples).
+        config (AudioSeparationConfig): Separation settings.
+
+    Returns:
+        dict: Mapping of stem name to its audio tensor, ordered like `_stem_names`.
+    """
+    stems = dict(zip(model.sources, sources))
+    if config.two_stems is None:
+        return stems
+
+    if config.two_stems not in stems:
+        raise ValueError(f"Stem '{config.two_stems}' is not provided by model '{config.model}'.")
+
+    selected = stems.pop(config.two_stems)
+    return dict(zip(_stem_names(model, config), [selected, sum(stems.values())]))
+
+
+# Shared engine so loaded models persist across separation jobs
+SEPARATION_ENGINE = DemucsSeparationEngine()
+atexit.register(SEPARATION_ENGINE.shutdown)
@@ -17,15 +17,9 @@ from pathlib import Path
 from typing import Union
 import logging
 
-# Third-Party Imports
-import torch
-
 # Local Application Imports
 from .config import AudioSeparationConfig
-from .utilities import (
-    _execute_command,
-    _organize_outputs,
-)
+from .engine import SEPARATION_ENGINE
 
 # Initialize Logger
 logger = logging.getLogger(__name__)
@@ -40,40 +34,11 @@ def _excecute_stem_separation(
         input_path = Path(input_file)
         output_path = Path(output_path)
 
-        # Set the device for processing the audio
-        device = torch.device(
-            f"cuda:{torch.cuda.current_device()}" if torch.cuda.is_available() else "cpu")
-
-        # Prepare the command to execute the Demucs model
-        cmd = [
-            "python", "-m", "demucs.separate",
-            "-o", str(output_path),
-            "-n", config.model,
-            "--device", f"{device}"
-        ]
-
-        if config.mp3:
-            cmd += ["--mp3", f"--mp3-bitrate={config.mp3_rate}"]
-
-        if config.float32:
-            cmd += ["--float32"]
-
-        if config.int24:
-            cmd += ["--int24"]
-
-        if config.two_stems is not None:
-            cmd += [f"--two-stems={config.two_stems}"]
-
-        cmd.append(str(input_path))
-        logger.debug(f"Executing command: {' '.join(cmd)}")
-
-        # Execute the command to separate the audio stems using subprocess
-        if not _execute_command(cmd):
-            # Early exit if the command fails
-            return
-
-        # Organize the output files removing them from subdirectories
-        _organize_outputs(output_path)
+        # Separate the stems in-process using the persistent Demucs engine.
+        # The stems are written directly into the output directory.
+        stems = SEPARATION_ENGINE.separate(input_path, output_path, config)
+        logger.debug(f"Separated stems: {', '.join(stems)}")
+        return stems
 
     except Exception as e:
         logger.error(f"Error in stem separation: {e}")
@@ -1,10 +1,14 @@
 # Standard Library Imports
+from dataclasses import replace
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 import logging
 
 # Local Application Imports
+from .config import AudioSeparationConfig, karaoke_separation_config
 from .main import _excecute_stem_separation
+from .utilities import _resolve_device, _device_config
+from ...cache_manifest import compute_cache_key, restore_artifacts, record_artifacts
 
 # Initialize Logger
 logger = logging.getLogger(__name__)
@@ -13,22 +17,63 @@ logger = logging.getLogger(__name__)
 def separate_audio_stems(
     input_file: Union[str, Path],
     working_dir: Union[str, Path],
-    override: bool = False
+    override: bool = False,
+    karaoke_mode: bool = False,
+    segment_seconds: Optional[float] = None,
+    max_memory_mb: Optional[int] = None,
+    jobs: Optional[int] = None
 ):
-    """Perform stem separation and save results in the working directory."""
-    expected_stems = ['vocals', 'drums', 'bass', 'other']
+    """
+    Perform stem separation and save results in the working directory.
 
-    # Check if any of the expected stem files already exist in the directory and
-    # skip the separation if the override flag is not set
-    if not override:
-        existing_stems = [f.stem.lower() for f in working_dir.iterdir() if f.is_file()]
-        if all(stem in existing_stems for stem in expected_stems):
-            logger.info("Stems already exist. Skipping stem separation...")
-            return
+    Args:
+        input_file (Union[str, Path]): Path to the input audio file.
+        working_dir (Union[str, Path]): Directory to save the stems.
+        override (bool): Whether to re-run the separation if the stems already exist.
+        karaoke_mode (bool): Write only `vocals` and the `karaoke_audio` accompaniment,
+            built from the model's in-memory output. Makes the stem merge stage unnecessary.
+        segment_seconds (Optional[float]): Separate the track in overlapping windows of this
+            length, streaming the stems to disk window by window.
+        max_memory_mb (Optional[int]): Memory ceiling for the audio buffers. Enables segmented
+            separation with a window length derived from it. Defaults to `DEMUCS_MAX_MEMORY_MB`.
+        jobs (Optional[int]): Number of worker processes that separate windows in parallel on CPU.
+            Defaults to `DEMUCS_JOBS`, or half the CPU cores (at most 4).
+    """
+    working_dir = Path(working_dir)
+
+    # Only override the memory and worker settings that were explicitly provided
+    overrides = {}
+    if segment_seconds is not None:
+        overrides["segment_seconds"] = segment_seconds
+    if max_memory_mb is not None:
+        overrides["max_memory_mb"] = max_memory_mb
+    if jobs is not None:
+        overrides["jobs"] = max(1, int(jobs))
+
+    config = karaoke_separation_config(**overrides) if karaoke_mode else AudioSeparationConfig(**overrides)
+
+    # The stems are keyed on the settings they are separated with on this device. Windowed output
+    # differs from whole-track output, and the worker count only matters through the window
+    # length, so the mode and the windows in flight are keyed instead of the workers.
+    # Skip the separation if stems for these settings exist and the override flag is not set
+    run_config = _device_config(config, _resolve_device())
+    cache_key = compute_cache_key(
+        working_dir,
+        "separation",
+        params={
+            "config": replace(run_config, jobs=1),
+            "segmented": run_config.segmented,
+            "windows_in_flight": run_config.windows_in_flight if run_config.max_memory_mb is not None else 1,
+        },
+    )
+    if restore_artifacts(working_dir, "separation", cache_key, override=override):
+        logger.info("Stems already exist. Skipping stem separation...")
+        return
 
     try:
         logger.info(f"Separating audio stems for input file: {Path(input_file).stem}")
-        _excecute_stem_separation(input_file, working_dir)
+        stems = _excecute_stem_separation(input_file, working_dir, config)
+        record_artifacts(working_dir, "separation", cache_key, stems.values())
         logger.info(f"Audio stems separated successfully!")
         return
         
@@ -1,79 +1,131 @@
 # Standard Library Imports
+from dataclasses import replace
 from pathlib import Path
-import subprocess as sp
 import logging
-import shutil
+
+# Third-Party Imports
+import torch
+
+# Local Application Imports
+from .config import STEM_FORMATS, MIN_SEGMENT_SECONDS, DEFAULT_PARALLEL_SEGMENT_SECONDS
 
 # Initialize Logger
 logger = logging.getLogger(__name__)
 
 
-def _organize_outputs(output_path):
+def _resolve_device():
+    """
+    Select the device used to run the Demucs model.
+
+    Returns:
+        str: "cuda:<index>" if a GPU is available, otherwise "cpu".
     """
-    Organize output files by moving them from subdirectories to the main output directory.
+    if torch.cuda.is_available():
+        return f"cuda:{torch.cuda.current_device()}"
+    return "cpu"
+
+
+def _device_config(config, device):
+    """
+    Adapt the separation settings to the device they run on.
+
+    Worker processes only help on CPU; a GPU is driven from a single process.
 
     Args:
-        output_path (str): Path to the main output directory.
+        config (AudioSeparationConfig): Separation settings.
+        device (str): Device from `_resolve_device`.
+
+    Returns:
+        AudioSeparationConfig: The settings the separation actually runs with.
     """
-    # Convert the output path to a Path object
-    output_dir = Path(output_path)
+    if device != "cpu" and config.jobs > 1:
+        return replace(config, jobs=1)
+    return config
 
-    # Iterate through each item in the output directory
-    for model_dir in output_dir.iterdir():
 
-        # Check if the item is a directory
-        if model_dir.is_dir():
+def _save_stem(source, output_dir, name, samplerate, config):
+    """
+    Save a separated stem tensor into the output directory.
 
-            # Recursively find all files in the subdirectory
-            for file in model_dir.glob("**/*"):
+    Args:
+        source (torch.Tensor): Stem audio with shape (channels, samples).
+        output_dir (Path): Directory where the stem is written.
+        name (str): Name of the stem (e.g. "vocals").
+        samplerate (int): Sample rate of the stem audio.
+        config (AudioSeparationConfig): Separation settings (format, bitrate, bit depth).
 
-                # Check if the item is a file
-                if file.is_file():
+    Returns:
+        Path: Path of the written stem file.
+    """
+    from demucs.audio import save_audio
 
-                    # Define the new location for the file in the main output directory
-                    new_location = output_dir / file.name
+    if config.stem_format not in STEM_FORMATS:
+        raise ValueError(f"Unsupported stem format '{config.stem_format}'. Expected one of {STEM_FORMATS}.")
 
-                    # Move the file to the new location
-                    shutil.move(str(file), new_location)
+    stem_path = Path(output_dir) / f"{name}.{config.stem_format}"
 
-            # Remove the now-empty subdirectory
-            shutil.rmtree(model_dir)
-    logger.debug("Stem outputs organized successfully.")
+    save_audio(
+        source.cpu(),
+        str(stem_path),
+        samplerate=samplerate,
+        bitrate=config.mp3_rate,
+        clip="rescale",
+        bits_per_sample=24 if config.int24 else 16,
+        as_float=config.float32,
+    )
+    return stem_path
 
 
-def _execute_command(cmd):
+def _segment_seconds(config, samplerate, channels, num_sources):
     """
-    Execute a shell command and handle stdout and stderr.
+    Determine the window length used for segmented separation.
+
+    When a memory ceiling is configured, the window is sized so the audio buffers held
+    per window fit in it: the input window, the separated sources, and the model's
+    intermediate estimates (roughly two more copies of the sources). Model weights are
+    not included in the estimate. With parallel jobs the ceiling is shared by the windows
+    in flight, two per worker (one being separated, one queued).
 
     Args:
-        cmd (list): Command to execute.
+        config (AudioSeparationConfig): Separation settings.
+        samplerate (int): Sample rate of the model.
+        channels (int): Number of audio channels of the model.
+        num_sources (int): Number of sources produced by the model.
 
     Returns:
-        bool: True if the command executed successfully, False otherwise.
+        float: Window length in seconds.
     """
-    try:
-        # Execute the separation command using subprocess
-        process = sp.Popen(cmd, stdout=sp.PIPE, stderr=sp.PIPE)
+    segment_seconds = config.segment_seconds or DEFAULT_PARALLEL_SEGMENT_SECONDS
+    if config.max_memory_mb is not None:
+        bytes_per_second = samplerate * channels * 4 * (1 + 3 * num_sources) * config.windows_in_flight
+        budget_seconds = config.max_memory_mb * 1024 ** 2 / bytes_per_second
+        segment_seconds = min(config.segment_seconds or budget_seconds, budget_seconds)
 
-        # Handle the I/O streams of the process, capturing stdout and stderr
-        stdout, stderr = process.communicate()
+    # Keep windows long enough for the overlap and for the model's own context
+    return max(segment_seconds, MIN_SEGMENT_SECONDS, 2 * config.overlap_seconds)
 
-        if stdout:
-            logger.debug(stdout.decode())
 
-        if stderr:
-            logger.warning(stderr.decode())
+def _stem_codec_args(config):
+    """
+    Build FFmpeg output arguments that match the configured stem format and bit depth.
+
+    Args:
+        config (AudioSeparationConfig): Separation settings.
+
+    Returns:
+        list[str]: FFmpeg codec arguments.
+    """
+    if config.stem_format not in STEM_FORMATS:
+        raise ValueError(f"Unsupported stem format '{config.stem_format}'. Expected one of {STEM_FORMATS}.")
 
-        # Wait for the process to finish
-        process.wait()
+    if config.stem_format == "mp3":
+        return ["-c:a", "libmp3lame", "-b:a", f"{config.mp3_rate}k"]
 
-        if process.returncode != 0:
-            raise RuntimeError(
-                f"Command failed with return code {process.returncode}.")
-        
-        logger.debug(f"Command executed successfully with return code {process.returncode}.")
-        return True
+    if config.stem_format == "flac":
+        if config.int24:
+            return ["-c:a", "flac", "-sample_fmt", "s32", "-bits_per_raw_sample", "24"]
+        return ["-c:a", "flac", "-sample_fmt", "s16"]
 
-    except Exception as e:
-        logging.error(f"Command execution failed: {e}")
-        raise
+    if config.float32:
+        return ["-c:a", "pcm_f32le"]
+    return ["-c:a", "pcm_s24le" if config.int24 else "pcm_s16le"]
@@ -4,9 +4,10 @@ from typing import Union
 import logging
 
 # Local Application Imports
-from .utilities import extract_audio_duration
-from ..utilities import load_json
+from ..utilities import load_json, find_audio_artifact
+from ..audio_probe import get_audio_duration
 from .create_ass_file import create_ass_file
+from ..cache_manifest import compute_cache_key, restore_artifacts, record_artifacts
 
 # Initialize Logger
 logger = logging.getLogger(__name__)
@@ -36,14 +37,9 @@ def process_karaoke_subtitles(
         metadata = Path(output_path) / "metadata.json"
         modified_lyrics_file = Path(output_path) / "modified_lyrics.json"
         raw_lyrics_file = Path(output_path) / "raw_lyrics.json"
-        audio_file = Path(output_path) / "karaoke_audio.mp3"
+        audio_file = find_audio_artifact(output_path, "karaoke_audio")
         output_file = Path(output_path) / file_name
 
-        # Check if the output file already exists and skip if override is not set
-        if output_file.exists() and not override:
-            logger.info("Skipping subtitle generation... Karaoke subtitles file already exists in the output directory.")
-            return
-
         # Use `modified_lyrics.json`. If it does not exist use `raw_lyrics.json`
         lyrics_file = modified_lyrics_file if Path(modified_lyrics_file).exists() else Path(raw_lyrics_file)
 
@@ -51,6 +47,33 @@ def process_karaoke_subtitles(
             logger.error(f"Lyrics file does not exist. Skipping subtitle generation...")
             raise FileNotFoundError(f"Lyrics file '{lyrics_file}' does not exist.")
 
+        # Check if the subtitles already exist for these lyrics, metadata, audio and style
+        # and skip if override is not set
+        cache_key = compute_cache_key(
+            output_path,
+            "subtitles",
+            params={
+                "file_name": file_name,
+                "font": font,
+                "fontsize": fontsize,
+                "primary_color": primary_color,
+                "secondary_color": secondary_color,
+                "outline_color": outline_color,
+                "outline_size": outline_size,
+                "shadow_color": shadow_color,
+                "shadow_size": shadow_size,
+                "screen_width": screen_width,
+                "screen_height": screen_height,
+                "verses_before": verses_before,
+                "verses_after": verses_after,
+                "loader_threshold": loader_threshold,
+            },
+            inputs=[lyrics_file, metadata, audio_file],
+        )
+        if restore_artifacts(output_path, "subtitles", cache_key, override=override):
+            logger.info("Skipping subtitle generation... Karaoke subtitles file already exists in the output directory.")
+            return
+
         # Load the artist info
         artist_info = load_json(metadata)
         song_name = artist_info.get("title", "Unknown Title")
@@ -62,7 +85,9 @@ def process_karaoke_subtitles(
         verses_data = load_json(lyrics_file)
 
         # Extract audio duration (assuming you have an input file for the instrumental audio)
-        audio_duration = extract_audio_duration(audio_file)
+        if audio_file is None:
+            raise FileNotFoundError(f"Karaoke audio file not found in: {output_path}")
+        audio_duration = get_audio_duration(audio_file, output_path)
 
         if audio_duration is None:
             raise ValueError(f"Could not extract audio duration from {audio_duration}")
@@ -87,6 +112,7 @@ def process_karaoke_subtitles(
             loader_threshold=loader_threshold
         )
 
+        record_artifacts(output_path, "subtitles", cache_key, [output_file])
         logger.info(f"Karaoke subtitles file created: {output_file}")
 
     except Exception as e:
@@ -1,9 +1,14 @@
 # Standard Library Imports
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
+import subprocess
+import tempfile
 import logging
 import json
 
+# Third-Party Imports
+import numpy as np
+
 # Initialize Logger
 logger = logging.getLogger(__name__)
 
@@ -46,4 +51,246 @@ def ensure_directory_exists(directory: Union[str, Path]) -> Path:
     directory.mkdir(parents=True, exist_ok=True)
 
     # Return the Path object for further use
-    return directory
\ No newline at end of file
+    return directory
+
+
+# ════════════════════════════════════════════════════════════
+# AUDIO I/O HELPERS
+# ════════════════════════════════════════════════════════════
+LOSSY_AUDIO_FORMATS = {"mp3", "ogg", "aac", "m4a"}
+
+# Formats of intermediate audio artifacts in a working directory, in lookup order
+AUDIO_ARTIFACT_FORMATS = ("wav", "flac", "mp3")
+
+
+def find_audio_artifact(directory: Union[str, Path], name: str) -> Optional[Path]:
+    """
+    Locate an intermediate audio artifact (e.g. `vocals`, `karaoke_audio`) regardless of its format.
+
+    Args:
+        directory (Union[str, Path]): Working directory holding the artifact.
+        name (str): File name of the artifact without extension.
+
+    Returns:
+        Optional[Path]: Path to the artifact, or None if it does not exist in any known format.
+    """
+    for extension in AUDIO_ARTIFACT_FORMATS:
+        candidate = Path(directory) / f"{name}.{extension}"
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def decode_audio(
+    file_path: Union[str, Path],
+    sample_rate: int = 44100,
+    channels: int = 2
+) -> np.ndarray:
+    """
+    Decode an audio file into a float32 NumPy array using FFmpeg.
+
+    Args:
+        file_path (Union[str, Path]): Path to the audio file.
+        sample_rate (int): Sample rate to resample the audio to.
+        channels (int): Number of channels to down/up-mix the audio to.
+
+    Returns:
+        np.ndarray: Audio samples with shape (channels, samples) in the range [-1, 1].
+    """
+    result = subprocess.run(
+        [
+            "ffmpeg", "-v", "error",
+            "-i", str(file_path),
+            "-f", "f32le", "-acodec", "pcm_f32le",
+            "-ac", str(channels),
+            "-ar", str(sample_rate),
+            "-"
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed to decode {file_path}: {result.stderr.decode('utf-8', 'ignore')}")
+
+    # Interleaved frames -> writable, contiguous (channels, samples) array. The bytes buffer
+    # is read-only, so the samples are always copied (a mono transpose would be a view)
+    samples = np.frombuffer(result.stdout, dtype=np.float32).reshape(-1, channels)
+    return np.array(samples.T, order="C")
+
+
+def encode_audio(
+    samples: np.ndarray,
+    output_file: Union[str, Path],
+    sample_rate: int = 44100,
+    bitrate: str = "320k",
+    output_format: Optional[str] = None
+) -> Path:
+    """
+    Encode a float32 NumPy array into an audio file using FFmpeg.
+
+    Args:
+        samples (np.ndarray): Audio samples with shape (channels, samples).
+        output_file (Union[str, Path]): Destination file. The format is inferred from its extension.
+        sample_rate (int): Sample rate of the samples.
+        bitrate (str): Bitrate used for lossy formats (e.g. "320k").
+        output_format (Optional[str]): Explicit container format, overriding the file extension.
+
+    Returns:
+        Path: Path of the encoded file.
+    """
+    output_file = Path(output_file)
+    codec_format = output_format or output_file.suffix.lstrip(".").lower()
+    channels = samples.shape[0]
+
+    cmd = [
+        "ffmpeg", "-y", "-v", "error",
+        "-f", "f32le", "-ar", str(sample_rate), "-ac", str(channels),
+        "-i", "-",
+    ]
+    if codec_format in LOSSY_AUDIO_FORMATS:
+        cmd += ["-b:a", bitrate]
+    if output_format is not None:
+        cmd += ["-f", output_format]
+    cmd.append(str(output_file))
+
+    # Interleave the channels and stream them to FFmpeg
+    interleaved = np.ascontiguousarray(samples.T, dtype=np.float32)
+    result = subprocess.run(cmd, input=memoryview(interleaved).cast("B"), stderr=subprocess.PIPE)
+
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed to encode {output_file}: {result.stderr.decode('utf-8', 'ignore')}")
+    return output_file
+
+
+class AudioStreamReader:
+    """
+    Decode an audio file incrementally through an FFmpeg pipe.
+
+    Only the requested number of samples is held in memory at a time, so long
+    recordings can be processed window by window.
+
+    Usage:
+        with AudioStreamReader(path, 44100, 2) as reader:
+            while (block := reader.read(44100)).shape[1]:
+                ...
+    """
+
+    def __init__(self, file_path: Union[str, Path], sample_rate: int = 44100, channels: int = 2):
+        self.file_path = Path(file_path)
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self._finished = False
+        self._stderr = tempfile.TemporaryFile()
+        self._process = subprocess.Popen(
+            [
+                "ffmpeg", "-v", "error",
+                "-i", str(self.file_path),
+                "-f", "f32le", "-acodec", "pcm_f32le",
+                "-ac", str(channels),
+                "-ar", str(sample_rate),
+                "-"
+            ],
+            stdout=subprocess.PIPE,
+            stderr=self._stderr,
+        )
+
+    def read(self, num_samples: int) -> np.ndarray:
+        """
+        Read up to `num_samples` samples per channel.
+
+        Returns:
+            np.ndarray: Writable audio with shape (channels, n). n is smaller than requested only at the end of the stream.
+        """
+        frame_bytes = 4 * self.channels
+        data = self._process.stdout.read(num_samples * frame_bytes)
+        if len(data) < num_samples * frame_bytes:
+            self._finished = True
+
+        # Drop a trailing partial frame, if any
+        data = data[:len(data) - len(data) % frame_bytes]
+        samples = np.frombuffer(data, dtype=np.float32).reshape(-1, self.channels)
+        return np.array(samples.T, order="C")
+
+    def close(self):
+        """Stop the decoder and raise if FFmpeg failed while decoding the whole stream."""
+        self._process.stdout.close()
+        returncode = self._process.wait()
+        self._stderr.seek(0)
+        error = self._stderr.read().decode("utf-8", "ignore")
+        self._stderr.close()
+
+        # A reader closed before the end of the stream stops FFmpeg with a broken pipe,
+        # which is expected and not reported as an error
+        if self._finished and returncode != 0:
+            raise RuntimeError(f"ffmpeg failed to decode {self.file_path}: {error}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class AudioStreamWriter:
+    """
+    Encode audio incrementally through an FFmpeg pipe.
+
+    Blocks of float32 samples are streamed to the encoder as they are produced,
+    so the complete track never needs to be held in memory.
+    """
+
+    def __init__(
+        self,
+        output_file: Union[str, Path],
+        sample_rate: int = 44100,
+        channels: int = 2,
+        codec_args: Optional[list] = None
+    ):
+        self.output_file = Path(output_file)
+        self._stderr = tempfile.TemporaryFile()
+        self._process = subprocess.Popen(
+            [
+                "ffmpeg", "-y", "-v", "error",
+                "-f", "f32le", "-ar", str(sample_rate), "-ac", str(channels),
+                "-i", "-",
+                *(codec_args or []),
+                str(self.output_file)
+            ],
+            stdin=subprocess.PIPE,
+            stderr=self._stderr,
+        )
+
+    def write(self, samples: np.ndarray):
+        """Write a block of audio with shape (channels, samples)."""
+        interleaved = np.ascontiguousarray(samples.T, dtype=np.float32)
+        try:
+            self._process.stdin.write(memoryview(interleaved).cast("B"))
+        except BrokenPipeError:
+            self.close()
+            raise
+
+    def close(self):
+        """Flush the encoder and raise if FFmpeg failed."""
+        if not self._process.stdin.closed:
+            try:
+                self._process.stdin.close()
+            except BrokenPipeError:
+                pass
+
+        returncode = self._process.wait()
+        if self._stderr.closed:
+            return
+
+        self._stderr.seek(0)
+        error = self._stderr.read().decode("utf-8", "ignore")
+        self._stderr.close()
+
+        if returncode != 0:
+            raise RuntimeError(f"ffmpeg failed to encode {self.output_file}: {error}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -7,7 +7,8 @@ import logging
 # Third-Party Imports
 import torch
 
-from .utilities import extract_audio_duration, validate_file
+from .utilities import validate_file
+from ..audio_probe import get_audio_duration
 # Initialize Logger
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,7 @@ def generate_karaoke_video(
     fps: int = 24,
     bitrate: str = "3000k",
     audio_bitrate: str = "192k",
+    audio_duration: Optional[float] = None,
 ):
     """
     Generate a karaoke video by:
@@ -33,7 +35,7 @@ def generate_karaoke_video(
       5) Writing the final video to `output_path`.
 
     Args:
-        audio_path (str|Path): Path to the karaoke audio (.mp3 or similar).
+        audio_path (str|Path): Path to the karaoke audio (.wav, .flac, .mp3 or similar).
         ass_path (str|Path): Path to the .ass subtitles.
         output_path (str|Path): Destination for the final MP4.
         resolution (str): E.g. "1280x720".
@@ -42,6 +44,7 @@ def generate_karaoke_video(
         fps (int): Frames per second for the output video.
         bitrate (str): Target video bitrate (e.g. "3000k").
         audio_bitrate (str): Audio bitrate (e.g. "192k").
+        audio_duration (float|None): Duration of the audio in seconds, if already known.
 
     Returns:
         str|None: Returns the final output path (str) on success, or None on failure.
@@ -66,8 +69,8 @@ def generate_karaoke_video(
         video_codec = "libx264"
         use_crf = True
 
-    # Get audio duration
-    audio_dur = extract_audio_duration(audio_path)
+    # Get audio duration (probed once per song by the caller, if available)
+    audio_dur = audio_duration if audio_duration is not None else get_audio_duration(audio_path)
     if audio_dur is None:
         logger.error("Cannot detect audio duration, aborting.")
         return None
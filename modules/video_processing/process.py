@@ -9,7 +9,8 @@ import re
 
 # Local Application Imports
 from .main import generate_karaoke_video
-from ..utilities import load_json
+from ..utilities import load_json, find_audio_artifact
+from ..audio_probe import get_audio_duration
 
 # Initialize Logger
 logger = logging.getLogger(__name__)
@@ -27,10 +28,13 @@ def process_karaoke_video(
     audio_bitrate: str = "192k",
 ):
     metadata_file = Path(working_dir) / "metadata.json"
-    karaoke_audio = Path(working_dir) / "karaoke_audio.mp3"
+    karaoke_audio = find_audio_artifact(working_dir, "karaoke_audio")
     karaoke_subtitles = Path(working_dir) / "karaoke_subtitles.ass"
 
     try:
+        if karaoke_audio is None:
+            raise FileNotFoundError(f"Karaoke audio file not found in: {working_dir}")
+
         # Load the audio metadata file
         metadata = load_json(metadata_file)
 
@@ -57,6 +61,7 @@ def process_karaoke_video(
             fps=fps,
             bitrate=bitrate,
             audio_bitrate=audio_bitrate,
+            audio_duration=get_audio_duration(karaoke_audio, working_dir),
         )
 
         return relative_output
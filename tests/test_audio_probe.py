@@ -0,0 +1,83 @@
+# Standard Library Imports
+from types import SimpleNamespace
+import base64
+import json
+import sys
+
+# Third-Party Imports
+import pytest
+
+# Local Application Imports
+from modules import audio_probe
+from modules.audio_probe import get_audio_duration, probe_audio
+from modules.audio_processing import main as audio_main
+from modules.audio_processing.process import initialize_working_directory, extract_audio_metadata
+
+# Compressed Chromaprint fingerprint holding a single sub-fingerprint
+FINGERPRINT = base64.urlsafe_b64encode(b"\x01\x00\x00\x01\x00").decode().rstrip("=")
+
+
+@pytest.fixture
+def launches(monkeypatch):
+    """Count the ffprobe and fpcalc processes launched while probing."""
+    counts = {"ffprobe": 0, "fpcalc": 0}
+
+    def run(command, **kwargs):
+        assert command[0] == "ffprobe"
+        counts["ffprobe"] += 1
+        info = {
+            "format": {"duration": "181.5"},
+            "streams": [{"codec_name": "mp3", "sample_rate": "44100", "channels": 2}],
+        }
+        return SimpleNamespace(returncode=0, stdout=json.dumps(info).encode(), stderr=b"")
+
+    def fingerprint_file(path):
+        counts["fpcalc"] += 1
+        return 181.0, FINGERPRINT.encode()
+
+    monkeypatch.setattr(audio_probe.subprocess, "run", run)
+    monkeypatch.setitem(sys.modules, "acoustid", SimpleNamespace(fingerprint_file=fingerprint_file))
+    monkeypatch.setattr(audio_main, "lookup_recording", lambda *args, **kwargs: {"status": "ok", "results": []})
+    return counts
+
+
+@pytest.mark.parametrize("key_mode", ["file", "audio"])
+def test_full_render_probes_each_file_once(tmp_path, launches, key_mode):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    upload = tmp_path / "song.mp3"
+    upload.write_bytes(b"upload audio")
+
+    # Audio and metadata stages: the upload only needs its fingerprint
+    working_dir, _ = initialize_working_directory(upload, cache_dir, key_mode=key_mode)
+    extract_audio_metadata(upload, working_dir)
+    assert launches == {"ffprobe": 0, "fpcalc": 1}
+
+    # Subtitle and video stages both read the duration of the karaoke audio
+    karaoke_audio = working_dir / "karaoke_audio.wav"
+    karaoke_audio.write_bytes(b"karaoke audio")
+    assert get_audio_duration(karaoke_audio, working_dir) == 181.5
+    assert get_audio_duration(karaoke_audio, working_dir) == 181.5
+    assert launches == {"ffprobe": 1, "fpcalc": 1}
+
+
+def test_format_is_probed_lazily_after_fingerprint(tmp_path, launches):
+    audio_file = tmp_path / "vocals.wav"
+    audio_file.write_bytes(b"vocals")
+
+    probe = probe_audio(audio_file, tmp_path, fingerprint=True)
+    assert probe["fingerprint"] == FINGERPRINT and "duration" not in probe
+
+    probe = probe_audio(audio_file, tmp_path)
+    assert probe["duration"] == 181.5 and probe["fingerprint"] == FINGERPRINT
+    assert launches == {"ffprobe": 1, "fpcalc": 1}
+
+
+def test_changed_file_is_probed_again(tmp_path, launches):
+    audio_file = tmp_path / "vocals.wav"
+    audio_file.write_bytes(b"vocals")
+    get_audio_duration(audio_file, tmp_path)
+
+    audio_file.write_bytes(b"new vocals")
+    get_audio_duration(audio_file, tmp_path)
+    assert launches["ffprobe"] == 2
@@ -0,0 +1,55 @@
+# Standard Library Imports
+import threading
+
+# Local Application Imports
+from modules import cache_manifest
+from modules.cache_manifest import compute_cache_key, record_artifacts, restore_artifacts
+
+
+def _separate(working_dir, content):
+    key = compute_cache_key(working_dir, "separation", params={"model": "htdemucs_ft"})
+    if not restore_artifacts(working_dir, "separation", key):
+        (working_dir / "vocals.wav").write_bytes(content)
+        record_artifacts(working_dir, "separation", key, [working_dir / "vocals.wav"])
+
+
+def _transcription_key(working_dir):
+    return compute_cache_key(working_dir, "transcription", inputs=[working_dir / "vocals.wav"])
+
+
+def test_recomputed_input_keeps_downstream_key(tmp_path):
+    _separate(tmp_path, b"first separation")
+    key = _transcription_key(tmp_path)
+
+    # Evicted stems are separated again with slightly different bytes
+    (tmp_path / "vocals.wav").unlink()
+    _separate(tmp_path, b"second separation")
+    assert _transcription_key(tmp_path) == key
+
+    # A file edited outside the pipeline changes the key
+    (tmp_path / "vocals.wav").write_bytes(b"edited vocals")
+    assert _transcription_key(tmp_path) != key
+
+
+def test_files_are_hashed_without_the_manifest_lock(tmp_path, monkeypatch):
+    (tmp_path / "vocals.wav").write_bytes(b"vocals")
+    hash_file = cache_manifest._file_digest
+    lock_free = []
+
+    def file_digest(*args):
+        # Another thread (a concurrent stage) must be able to take the lock meanwhile
+        def try_lock():
+            acquired = cache_manifest._MANIFEST_LOCK.acquire(timeout=1)
+            if acquired:
+                cache_manifest._MANIFEST_LOCK.release()
+            lock_free.append(acquired)
+
+        thread = threading.Thread(target=try_lock)
+        thread.start()
+        thread.join()
+        return hash_file(*args)
+
+    monkeypatch.setattr(cache_manifest, "_file_digest", file_digest)
+    key = compute_cache_key(tmp_path, "transcription", inputs=[tmp_path / "vocals.wav"])
+    record_artifacts(tmp_path, "transcription", key, [tmp_path / "vocals.wav"])
+    assert lock_free == [True, True]
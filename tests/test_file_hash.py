@@ -0,0 +1,35 @@
+# Standard Library Imports
+import hashlib
+import mmap
+
+# Local Application Imports
+from modules.audio_processing import utilities
+from modules.audio_processing.utilities import _get_file_hash
+
+
+def test_file_hash_matches_sha256(tmp_path):
+    file_path = tmp_path / "song.mp3"
+    file_path.write_bytes(b"karaoke" * 100000)
+
+    assert _get_file_hash(file_path) == hashlib.sha256(file_path.read_bytes()).hexdigest()
+
+
+def test_file_hash_of_empty_file(tmp_path):
+    file_path = tmp_path / "empty.mp3"
+    file_path.write_bytes(b"")
+
+    assert _get_file_hash(file_path) == hashlib.sha256(b"").hexdigest()
+
+
+def test_file_hash_falls_back_to_buffered_reads(tmp_path, monkeypatch):
+    # Some network and FUSE file systems cannot be memory-mapped
+    def unsupported(*args, **kwargs):
+        raise OSError("mmap not supported")
+
+    monkeypatch.setattr(utilities.mmap, "mmap", unsupported)
+    monkeypatch.delattr(hashlib, "file_digest", raising=False)  # Not available before Python 3.11
+    file_path = tmp_path / "song.mp3"
+    content = bytes(range(256)) * 10000  # Spans several read chunks
+    file_path.write_bytes(content)
+
+    assert _get_file_hash(file_path) == hashlib.sha256(content).hexdigest()
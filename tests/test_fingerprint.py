@@ -0,0 +1,42 @@
+# Third-Party Imports
+import numpy as np
+
+# Local Application Imports
+from modules.audio_processing import fingerprint
+from modules.audio_processing.fingerprint import _find_matching_song, _register_song_fingerprint
+
+
+def test_indexed_fingerprints_are_decoded_once(tmp_path, monkeypatch):
+    decoded = []
+
+    def decode(value):
+        decoded.append(value)
+        return np.full(64, sum(map(ord, value)), dtype=np.uint32)
+
+    monkeypatch.setattr(fingerprint, "_decode_fingerprint", decode)
+    monkeypatch.setattr(fingerprint, "_DECODED_FINGERPRINTS", {})
+
+    for name in ("song_a", "song_b", "song_c"):
+        (tmp_path / name).mkdir()
+        _register_song_fingerprint(tmp_path, name, 180.0, f"fingerprint_{name}")
+
+    _find_matching_song(tmp_path, 180.0, "new upload")
+    _find_matching_song(tmp_path, 180.0, "another upload")
+    assert sorted(decoded) == sorted(["new upload", "another upload"] + [f"fingerprint_song_{c}" for c in "abc"])
+
+
+def test_evicted_songs_leave_the_decoded_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(fingerprint, "_decode_fingerprint", lambda value: np.zeros(64, dtype=np.uint32))
+    monkeypatch.setattr(fingerprint, "_DECODED_FINGERPRINTS", {})
+
+    for name in ("song_a", "song_b"):
+        (tmp_path / name).mkdir()
+        _register_song_fingerprint(tmp_path, name, 180.0, f"fingerprint_{name}")
+    _find_matching_song(tmp_path, 180.0, "new upload")
+    assert set(fingerprint._DECODED_FINGERPRINTS) == {"song_a", "song_b"}
+
+    # The cache evicted song_a before the next song was registered
+    (tmp_path / "song_a").rmdir()
+    (tmp_path / "song_c").mkdir()
+    _register_song_fingerprint(tmp_path, "song_c", 180.0, "fingerprint_song_c")
+    assert set(fingerprint._DECODED_FINGERPRINTS) == {"song_b"}